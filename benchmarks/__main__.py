@@ -0,0 +1,132 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+from .compare import compare_results, find_regressions
+
+
+def compare(args: argparse.Namespace) -> int:
+    with open(args.base) as f:
+        base = json.load(f)
+
+    with open(args.head) as f:
+        head = json.load(f)
+
+    comparisons = compare_results(base=base, head=head)
+    regressions = find_regressions(comparisons=comparisons, tolerance=args.tolerance)
+
+    print(f"{'benchmark':<64}{'base ms':>12}{'head ms':>12}{'ratio':>8}")
+
+    for comparison in comparisons:
+        base_median = (
+            f"{comparison.base_median_seconds * 1000:>12.3f}"
+            if comparison.base_median_seconds is not None
+            else f"{'-':>12}"
+        )
+        head_median = (
+            f"{comparison.head_median_seconds * 1000:>12.3f}"
+            if comparison.head_median_seconds is not None
+            else f"{'-':>12}"
+        )
+        ratio = f"{comparison.ratio:>8.2f}" if comparison.ratio else f"{'-':>8}"
+        flag = "  REGRESSION" if comparison in regressions else ""
+
+        print(f"{comparison.name:<64}{base_median}{head_median}{ratio}{flag}")
+
+    if regressions:
+        print(
+            f"\n{len(regressions)} benchmarks are more than "
+            f"{args.tolerance:.0%} slower than in {args.base}"
+        )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Times the services' methods against a seeded database.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="runs the benchmarks")
+    run_parser.add_argument(
+        "--database-uri",
+        default=os.getenv("DATABASE_URI"),
+        help="(default: $DATABASE_URI)",
+    )
+    run_parser.add_argument(
+        "--filter", help="only runs the benchmarks whose names contain this"
+    )
+    run_parser.add_argument("--warmup-iterations", type=int, default=2)
+    run_parser.add_argument("--min-iterations", type=int, default=5)
+    run_parser.add_argument("--max-iterations", type=int, default=1000)
+    run_parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=1,
+        help="time each benchmark runs for, after min-iterations",
+    )
+    run_parser.add_argument("--output", help="writes the results as JSON to this file")
+
+    hot_article_parser = subparsers.add_parser(
+        "hot-article",
+        help="times favoriting a single article from many connections at once",
+    )
+    hot_article_parser.add_argument(
+        "--database-uri",
+        default=os.getenv("DATABASE_URI"),
+        help="(default: $DATABASE_URI)",
+    )
+    hot_article_parser.add_argument(
+        "--workers",
+        type=int,
+        default=16,
+        help="connections favoriting the article at once, as workers would",
+    )
+    hot_article_parser.add_argument("--users-per-worker", type=int, default=50)
+    hot_article_parser.add_argument(
+        "--seconds", type=float, default=10, help="time each mode runs for"
+    )
+    hot_article_parser.add_argument(
+        "--output", help="writes the results as JSON to this file"
+    )
+
+    compare_parser = subparsers.add_parser(
+        "compare",
+        help="compares two results, exiting with 1 if any benchmark regressed",
+    )
+    compare_parser.add_argument("base", help="results to compare against")
+    compare_parser.add_argument("head", help="results to compare")
+    compare_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="fraction of slowdown flagged as a regression (default: 0.1)",
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        sys.exit(compare(args=args))
+
+    if not args.database_uri:
+        parser.error("--database-uri or DATABASE_URI is required")
+
+    # Imported here, as importing conduit requires its configuration, which
+    # compare does not.
+    if args.command == "hot-article":
+        from .hot_article import run_hot_article
+
+        results = asyncio.run(run_hot_article(args=args))
+    else:
+        from .runner import run
+
+        results = asyncio.run(run(args=args))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
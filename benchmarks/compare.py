@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass
+class Comparison:
+    name: str
+    base_median_seconds: Optional[float]
+    head_median_seconds: Optional[float]
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if not self.base_median_seconds or self.head_median_seconds is None:
+            return None
+
+        return self.head_median_seconds / self.base_median_seconds
+
+
+def compare_results(base: dict, head: dict) -> List[Comparison]:
+    """Pairs the benchmarks of two results by name, comparing their medians,
+    which are less affected than means by the occasional slow iteration.
+    """
+    names = list(dict.fromkeys([*base["benchmarks"], *head["benchmarks"]]))
+
+    return [
+        Comparison(
+            name=name,
+            base_median_seconds=base["benchmarks"].get(name, {}).get("median_seconds"),
+            head_median_seconds=head["benchmarks"].get(name, {}).get("median_seconds"),
+        )
+        for name in names
+    ]
+
+
+def find_regressions(
+    comparisons: List[Comparison], tolerance: float
+) -> List[Comparison]:
+    return [
+        comparison
+        for comparison in comparisons
+        if comparison.ratio is not None and comparison.ratio > 1 + tolerance
+    ]
@@ -0,0 +1,203 @@
+import uuid
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import psycopg
+
+from conduit.articles import ArticlesService
+from conduit.users import UsersService
+
+FOLLOWED_AUTHORS_COUNTS = [10, 100, 10000]
+
+PASSWORD = "benchmark-password"
+
+
+@dataclass
+class BenchmarkUser:
+    id: str
+    username: str
+    email: str
+
+
+class BenchmarkFixtures:
+    """Looks up the rows the benchmarks read from a seeded database, and creates
+    the users they need, prefixed with a run id so teardown removes them and all
+    they wrote.
+    """
+
+    def __init__(
+        self,
+        aconn: psycopg.AsyncConnection,
+        users_service: UsersService,
+        articles_service: ArticlesService,
+    ):
+        self._aconn = aconn
+        self._users_service = users_service
+        self._articles_service = articles_service
+        self._run_id = uuid.uuid4().hex[:8]
+        self.user: Optional[BenchmarkUser] = None
+        self.followers: Dict[int, BenchmarkUser] = {}
+        self.followed_authors_counts: Dict[int, int] = {}
+        self.table_counts: Dict[str, int] = {}
+        self.articles_count = 0
+        self.popular_article_slug: Optional[str] = None
+        self.popular_tag: Optional[str] = None
+        self.top_favoriter_id: Optional[str] = None
+
+    async def setup(self):
+        for table in ["users", "follows", "articles", "favorites", "comments"]:
+            self.table_counts[table] = await self._fetch_value(
+                f"SELECT count(*) FROM {table}"
+            )
+
+        self.articles_count = self.table_counts["articles"]
+
+        if self.articles_count == 0:
+            raise RuntimeError(
+                "the database has no articles, seed it first with python -m seed"
+            )
+
+        self.popular_article_slug = await self._fetch_value(
+            """
+            SELECT a.slug
+            FROM articles a
+            LEFT JOIN comments c ON c.article_id = a.id AND c.deleted_at IS NULL
+            WHERE a.deleted_at IS NULL
+            GROUP BY a.id
+            ORDER BY count(c.id) DESC
+            LIMIT 1
+            """
+        )
+
+        self.popular_tag = await self._fetch_value(
+            """
+            SELECT t
+            FROM articles, UNNEST(tags) AS t
+            WHERE deleted_at IS NULL
+            GROUP BY t
+            ORDER BY count(*) DESC
+            LIMIT 1
+            """
+        )
+
+        self.top_favoriter_id = await self._fetch_value(
+            """
+            SELECT user_id
+            FROM favorites
+            WHERE deleted_at IS NULL
+            GROUP BY user_id
+            ORDER BY count(*) DESC
+            LIMIT 1
+            """
+        )
+
+        self.user = await self._create_user(name="user")
+
+        for followed_authors_count in FOLLOWED_AUTHORS_COUNTS:
+            follower = await self._create_user(name=f"follows-{followed_authors_count}")
+
+            # Follows the authors with the most articles first, so the feed has
+            # articles to list.
+            self.followed_authors_counts[followed_authors_count] = await self._execute(
+                """
+                INSERT INTO follows (follower_id, followed_id)
+                SELECT %(follower_id)s, u.id
+                FROM users u
+                LEFT JOIN articles a ON a.author_id = u.id
+                WHERE u.id <> %(follower_id)s
+                AND u.username NOT LIKE %(prefix)s
+                GROUP BY u.id
+                ORDER BY count(a.id) DESC
+                LIMIT %(limit)s
+                """,
+                {
+                    "follower_id": follower.id,
+                    "prefix": f"{self._prefix}%",
+                    "limit": followed_authors_count,
+                },
+            )
+
+            self.followers[followed_authors_count] = follower
+
+    async def teardown(self):
+        """Deletes the created users and all they wrote, then recounts the seeded
+        articles they favorited or commented on, whose counts and trending scores
+        their writes changed.
+        """
+        users_ids = "SELECT id FROM users WHERE username LIKE %(prefix)s"
+        articles_ids = f"SELECT id FROM articles WHERE author_id IN ({users_ids})"
+
+        changed_articles_ids = await self._fetch_values(
+            f"""
+            SELECT article_id FROM favorites WHERE user_id IN ({users_ids})
+            UNION
+            SELECT article_id FROM comments WHERE author_id IN ({users_ids})
+            EXCEPT
+            {articles_ids}
+            """,
+            {"prefix": f"{self._prefix}%"},
+        )
+
+        for delete_query in [
+            f"DELETE FROM follows WHERE follower_id IN ({users_ids})",
+            f"""
+            DELETE FROM favorites
+            WHERE user_id IN ({users_ids}) OR article_id IN ({articles_ids})
+            """,
+            f"""
+            DELETE FROM comments
+            WHERE author_id IN ({users_ids}) OR article_id IN ({articles_ids})
+            """,
+            f"DELETE FROM articles WHERE author_id IN ({users_ids})",
+            "DELETE FROM users WHERE username LIKE %(prefix)s",
+        ]:
+            await self._execute(delete_query, {"prefix": f"{self._prefix}%"})
+
+        if changed_articles_ids:
+            await self._articles_service.recount_articles(
+                article_ids=changed_articles_ids
+            )
+
+    def make_username(self, name: str) -> str:
+        return f"{self._prefix}{name}"
+
+    @property
+    def _prefix(self) -> str:
+        return f"benchmark-{self._run_id}-"
+
+    async def _create_user(self, name: str) -> BenchmarkUser:
+        username = self.make_username(name=name)
+        email = f"{username}@example.com"
+
+        user = await self._users_service.register_user(
+            username=username, email=email, password=PASSWORD
+        )
+
+        return BenchmarkUser(id=user.id, username=username, email=email)
+
+    async def _fetch_value(self, query: str):
+        async with self._aconn.cursor() as acur:
+            await acur.execute(query)
+            record = await acur.fetchone()
+
+        await self._aconn.commit()
+
+        return record[0] if record else None
+
+    async def _fetch_values(self, query: str, params: dict) -> List:
+        async with self._aconn.cursor() as acur:
+            await acur.execute(query, params)
+            records = await acur.fetchall()
+
+        await self._aconn.commit()
+
+        return [record[0] for record in records]
+
+    async def _execute(self, query: str, params: dict) -> int:
+        async with self._aconn.cursor() as acur:
+            await acur.execute(query, params)
+            rows_count = acur.rowcount
+
+        await self._aconn.commit()
+
+        return rows_count
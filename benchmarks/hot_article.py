@@ -0,0 +1,286 @@
+import argparse
+import asyncio
+import datetime
+import math
+import time
+import uuid
+from typing import List, Optional, Tuple
+
+import psycopg
+
+from conduit.articles import ArticlesService, HotArticles, TagIndex
+from conduit.database import ConnectionRouter
+from conduit.profiles import ProfilesService
+from conduit.users import UsersService
+from load_test.git import get_git_commit
+
+# The hot article's favorites count is kept in its row, or spread over shards.
+MODES = {
+    "row": None,
+    "sharded": 0,
+}
+
+
+class HotArticleFixtures:
+    """Creates an article and the users favoriting it, prefixed with a run id so
+    teardown removes them and all they wrote.
+    """
+
+    def __init__(self, aconn: psycopg.AsyncConnection, users_count: int):
+        self._aconn = aconn
+        self._users_count = users_count
+        self._prefix = f"benchmark-hot-{uuid.uuid4().hex[:8]}-"
+        self.slug = f"{self._prefix}article"
+        self.users_ids: List[str] = []
+
+    async def setup(self):
+        async with self._aconn.cursor() as acur:
+            await acur.execute(
+                """
+                INSERT INTO users (username, email, password_hash)
+                SELECT %(prefix)s || i, %(prefix)s || i || '@example.com', ''
+                FROM generate_series(0, %(users_count)s) i
+                RETURNING id
+                """,
+                {"prefix": self._prefix, "users_count": self._users_count},
+            )
+
+            author_id, *self.users_ids = [record[0] for record in await acur.fetchall()]
+
+            await acur.execute(
+                """
+                INSERT INTO articles (author_id, slug, title, description, body)
+                VALUES (%s, %s, 'Hot article', 'Hot article', 'Hot article')
+                """,
+                (author_id, self.slug),
+            )
+
+        await self._aconn.commit()
+
+    async def reset(self):
+        """Unfavorites the article, so that each mode starts from no favorites."""
+        async with self._aconn.cursor() as acur:
+            await acur.execute(
+                """
+                DELETE FROM favorites
+                WHERE article_id = (SELECT id FROM articles WHERE slug = %(slug)s)
+                """,
+                {"slug": self.slug},
+            )
+
+            await acur.execute(
+                """
+                DELETE FROM articles_favorites_count_shards
+                WHERE article_id = (SELECT id FROM articles WHERE slug = %(slug)s)
+                """,
+                {"slug": self.slug},
+            )
+
+            await acur.execute(
+                """
+                UPDATE articles
+                SET favorites_count = 0, trending_score = 0
+                WHERE slug = %(slug)s
+                """,
+                {"slug": self.slug},
+            )
+
+        await self._aconn.commit()
+
+    async def get_counts(self) -> dict:
+        """The article's favorites count, as read by the services and as counted
+        from its favorites, which should be equal.
+        """
+        async with self._aconn.cursor() as acur:
+            await acur.execute(
+                """
+                SELECT a.favorites_count + COALESCE((
+                    SELECT SUM(s.delta) FROM articles_favorites_count_shards s
+                    WHERE s.article_id = a.id
+                ), 0),
+                (
+                    SELECT COUNT(*) FROM favorites f
+                    WHERE f.article_id = a.id AND f.deleted_at IS NULL
+                )
+                FROM articles a
+                WHERE a.slug = %(slug)s
+                """,
+                {"slug": self.slug},
+            )
+
+            record = await acur.fetchone()
+
+        await self._aconn.commit()
+
+        return {"favorites_count": record[0], "favorites": record[1]}
+
+    async def teardown(self):
+        async with self._aconn.cursor() as acur:
+            for delete_query in [
+                """
+                DELETE FROM favorites
+                WHERE article_id = (SELECT id FROM articles WHERE slug = %(slug)s)
+                """,
+                "DELETE FROM articles WHERE slug = %(slug)s",
+                "DELETE FROM users WHERE username LIKE %(prefix)s",
+            ]:
+                await acur.execute(
+                    delete_query, {"slug": self.slug, "prefix": f"{self._prefix}%"}
+                )
+
+        await self._aconn.commit()
+
+
+async def _connect_articles_service(
+    database_uri: str, hot_article_rate: Optional[float]
+) -> Tuple[ConnectionRouter, ArticlesService]:
+    aconn = await ConnectionRouter.connect(
+        primary_uri=database_uri,
+        replica_uris=[],
+        read_your_writes_seconds=0,
+        replica_max_lag_seconds=0,
+        get_caller=lambda: None,
+    )
+
+    users_service = UsersService(aconn=aconn)
+
+    return aconn, ArticlesService(
+        aconn=aconn,
+        profiles_service=ProfilesService(aconn=aconn, users_service=users_service),
+        tag_index=TagIndex(max_suggestions=20),
+        hot_articles=HotArticles(rate_threshold=hot_article_rate)
+        if hot_article_rate is not None
+        else None,
+    )
+
+
+async def _toggle_favorites(
+    articles_service: ArticlesService,
+    slug: str,
+    users_ids: List[str],
+    deadline: float,
+) -> List[float]:
+    """Favorites and unfavorites slug as each of users_ids in turn until the
+    deadline, returning the duration of each call.
+    """
+    durations_seconds = []
+    favorited = set()
+    i = 0
+
+    while time.perf_counter() < deadline:
+        user_id = users_ids[i % len(users_ids)]
+        i += 1
+
+        started_at = time.perf_counter()
+
+        if user_id in favorited:
+            await articles_service.unfavorite_article_by_slug(
+                slug=slug, user_id=user_id
+            )
+            favorited.remove(user_id)
+        else:
+            await articles_service.favorite_article_by_slug(slug=slug, user_id=user_id)
+            favorited.add(user_id)
+
+        durations_seconds.append(time.perf_counter() - started_at)
+
+    return durations_seconds
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> float:
+    rank = max(math.ceil(percentile / 100 * len(sorted_values)), 1)
+
+    return sorted_values[rank - 1]
+
+
+async def run_hot_article(args: argparse.Namespace) -> dict:
+    """Favorites and unfavorites a single article from args.workers connections
+    at once, as many workers would, with its favorites count kept in its row and
+    then in shards, and reports the throughput of each.
+    """
+    aconn = await psycopg.AsyncConnection.connect(args.database_uri)
+
+    fixtures = HotArticleFixtures(
+        aconn=aconn, users_count=args.workers * args.users_per_worker
+    )
+
+    results = {
+        "git_commit": get_git_commit(),
+        "started_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "workers": args.workers,
+        "seconds": args.seconds,
+        "modes": {},
+    }
+
+    try:
+        await fixtures.setup()
+
+        print(f"{'mode':<12}{'ops':>10}{'ops/s':>12}{'p50 ms':>10}{'p95 ms':>10}")
+
+        for mode, hot_article_rate in MODES.items():
+            await fixtures.reset()
+
+            workers = [
+                await _connect_articles_service(
+                    database_uri=args.database_uri, hot_article_rate=hot_article_rate
+                )
+                for _ in range(args.workers)
+            ]
+
+            deadline = time.perf_counter() + args.seconds
+
+            try:
+                workers_durations_seconds = await asyncio.gather(
+                    *[
+                        _toggle_favorites(
+                            articles_service=articles_service,
+                            slug=fixtures.slug,
+                            users_ids=[
+                                user_id
+                                for i, user_id in enumerate(fixtures.users_ids)
+                                if i % args.workers == worker
+                            ],
+                            deadline=deadline,
+                        )
+                        for worker, (_, articles_service) in enumerate(workers)
+                    ]
+                )
+
+                await workers[0][1].roll_up_favorites_count_shards()
+            finally:
+                for worker_aconn, _ in workers:
+                    await worker_aconn.close()
+
+            durations_seconds = sorted(
+                duration_seconds
+                for worker_durations_seconds in workers_durations_seconds
+                for duration_seconds in worker_durations_seconds
+            )
+
+            mode_results = {
+                "operations": len(durations_seconds),
+                "operations_per_second": len(durations_seconds) / args.seconds,
+                "p50_seconds": _percentile(durations_seconds, 50),
+                "p95_seconds": _percentile(durations_seconds, 95),
+                **await fixtures.get_counts(),
+            }
+
+            results["modes"][mode] = mode_results
+
+            print(
+                f"{mode:<12}{mode_results['operations']:>10}"
+                f"{mode_results['operations_per_second']:>12.1f}"
+                f"{mode_results['p50_seconds'] * 1000:>10.3f}"
+                f"{mode_results['p95_seconds'] * 1000:>10.3f}"
+            )
+
+            if mode_results["favorites_count"] != mode_results["favorites"]:
+                raise RuntimeError(
+                    f"{mode} favorites count {mode_results['favorites_count']} "
+                    f"does not match the {mode_results['favorites']} favorites"
+                )
+    finally:
+        await fixtures.teardown()
+        await aconn.close()
+
+    return results
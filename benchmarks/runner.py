@@ -0,0 +1,86 @@
+import argparse
+import datetime
+
+from conduit import app
+from conduit.articles import ArticlesService, TagIndex
+from conduit.database import ConnectionRouter
+from conduit.profiles import ProfilesService
+from conduit.users import UsersService
+from load_test.git import get_git_commit
+from .fixtures import BenchmarkFixtures
+from .service_benchmarks import make_benchmarks
+from .timing import time_async
+
+
+async def run(args: argparse.Namespace) -> dict:
+    aconn = await ConnectionRouter.connect(
+        primary_uri=args.database_uri,
+        replica_uris=[],
+        read_your_writes_seconds=0,
+        replica_max_lag_seconds=0,
+        get_caller=lambda: None,
+    )
+
+    users_service = UsersService(aconn=aconn)
+    profiles_service = ProfilesService(aconn=aconn, users_service=users_service)
+    articles_service = ArticlesService(
+        aconn=aconn,
+        profiles_service=profiles_service,
+        tag_index=TagIndex(max_suggestions=20),
+    )
+
+    fixtures = BenchmarkFixtures(
+        aconn=aconn.primary,
+        users_service=users_service,
+        articles_service=articles_service,
+    )
+
+    results = {
+        "git_commit": get_git_commit(),
+        "started_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "benchmarks": {},
+    }
+
+    try:
+        await fixtures.setup()
+
+        results["database"] = {
+            "table_counts": fixtures.table_counts,
+            "followed_authors_counts": fixtures.followed_authors_counts,
+        }
+
+        benchmarks = await make_benchmarks(
+            app=app,
+            users_service=users_service,
+            profiles_service=profiles_service,
+            articles_service=articles_service,
+            fixtures=fixtures,
+        )
+
+        print(f"{'benchmark':<64}{'iterations':>12}{'median ms':>12}{'p95 ms':>12}")
+
+        for benchmark in benchmarks:
+            if args.filter and args.filter not in benchmark.name:
+                continue
+
+            timing = await time_async(
+                function=benchmark.run,
+                reset=benchmark.reset,
+                warmup_iterations=args.warmup_iterations,
+                min_iterations=args.min_iterations,
+                max_iterations=args.max_iterations,
+                min_seconds=args.min_seconds,
+            )
+
+            results["benchmarks"][benchmark.name] = timing.to_dict()
+
+            print(
+                f"{benchmark.name:<64}{timing.iterations:>12}"
+                f"{timing.median_seconds * 1000:>12.3f}"
+                f"{timing.p95_seconds * 1000:>12.3f}"
+            )
+    finally:
+        await fixtures.teardown()
+        await aconn.close()
+
+    return results
@@ -0,0 +1,319 @@
+import dataclasses
+import itertools
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from quart import Quart
+
+from conduit.articles import ArticlesService
+from conduit.articles.article_response import (
+    ArticleResponse,
+    ArticleResponseArticle,
+    ArticleResponseArticleAuthorProfile,
+)
+from conduit.articles.multiple_articles_response import (
+    MultipleArticlesResponse,
+    MultipleArticlesResponseArticle,
+    MultipleArticlesResponseAuthorProfile,
+)
+from conduit.profiles import ProfilesService
+from conduit.users import UsersService
+from .fixtures import FOLLOWED_AUTHORS_COUNTS, PASSWORD, BenchmarkFixtures
+
+LIST_ARTICLES_OFFSETS = [0, 1000, 100000]
+
+
+@dataclass
+class Benchmark:
+    name: str
+    run: Callable[[], Awaitable]
+    reset: Optional[Callable[[], Awaitable]] = None
+
+
+async def make_benchmarks(
+    app: Quart,
+    users_service: UsersService,
+    profiles_service: ProfilesService,
+    articles_service: ArticlesService,
+    fixtures: BenchmarkFixtures,
+) -> List[Benchmark]:
+    """Returns a benchmark for each service method, for the parameters that
+    affect its cost, and for serializing the responses built from them.
+    """
+    user = fixtures.user
+    slug = fixtures.popular_article_slug
+    article = await articles_service.get_article_by_slug(slug=slug)
+    counter = itertools.count()
+
+    await articles_service.refresh_tag_index()
+
+    async def suggest_tags():
+        articles_service.suggest_tags(prefix=fixtures.popular_tag[:2], limit=10)
+
+    async def register_user():
+        username = fixtures.make_username(name=f"registered-{next(counter)}")
+
+        await users_service.register_user(
+            username=username, email=f"{username}@example.com", password=PASSWORD
+        )
+
+    async def serialize(response):
+        async with app.app_context():
+            app.json.dumps(dataclasses.asdict(response))
+
+    benchmarks = [
+        Benchmark(
+            name="users.register_user",
+            run=register_user,
+        ),
+        Benchmark(
+            name="users.get_user_by_id",
+            run=lambda: users_service.get_user_by_id(id=user.id),
+        ),
+        Benchmark(
+            name="users.get_user_by_username",
+            run=lambda: users_service.get_user_by_username(username=user.username),
+        ),
+        Benchmark(
+            name="users.get_user_by_email",
+            run=lambda: users_service.get_user_by_email(email=user.email),
+        ),
+        Benchmark(
+            name="users.update_user",
+            run=lambda: users_service.update_user(
+                user_id=user.id, bio=f"bio {next(counter)}"
+            ),
+        ),
+        Benchmark(
+            name="users.verify_password_by_email",
+            run=lambda: users_service.verify_password_by_email(
+                email=user.email, password=PASSWORD
+            ),
+        ),
+        Benchmark(
+            name="profiles.get_profile_by_username",
+            run=lambda: profiles_service.get_profile_by_username(
+                username=user.username, follower_id=fixtures.followers[10].id
+            ),
+        ),
+        Benchmark(
+            name="profiles.follow_user_by_username",
+            run=lambda: profiles_service.follow_user_by_username(
+                follower_id=user.id, followed_username=fixtures.followers[10].username
+            ),
+            reset=lambda: profiles_service.unfollow_user_by_username(
+                follower_id=user.id, followed_username=fixtures.followers[10].username
+            ),
+        ),
+        Benchmark(
+            name="articles.create_article",
+            run=lambda: articles_service.create_article(
+                author_id=user.id,
+                title=f"benchmark article {next(counter)}",
+                description="benchmark article",
+                body="benchmark article body " * 100,
+                tags=["benchmark", "performance"],
+            ),
+        ),
+        Benchmark(
+            name="articles.get_article_by_slug",
+            run=lambda: articles_service.get_article_by_slug(slug=slug),
+        ),
+        Benchmark(
+            name="articles.get_tags",
+            run=articles_service.get_tags,
+        ),
+        Benchmark(
+            name="articles.refresh_tag_index",
+            run=articles_service.refresh_tag_index,
+        ),
+        Benchmark(
+            name="articles.suggest_tags",
+            run=suggest_tags,
+        ),
+        Benchmark(
+            name="articles.is_favorited",
+            run=lambda: articles_service.is_favorited(
+                article_id=article.id, user_id=user.id
+            ),
+        ),
+        Benchmark(
+            name="articles.favorite_article_by_slug",
+            run=lambda: articles_service.favorite_article_by_slug(
+                slug=slug, user_id=user.id
+            ),
+            reset=lambda: articles_service.unfavorite_article_by_slug(
+                slug=slug, user_id=user.id
+            ),
+        ),
+        Benchmark(
+            name="articles.add_comment_to_article_by_slug",
+            run=lambda: articles_service.add_comment_to_article_by_slug(
+                slug=slug, author_id=user.id, body="benchmark comment"
+            ),
+        ),
+        Benchmark(
+            name="articles.list_article_comments_by_slug[limit=20]",
+            run=lambda: articles_service.list_article_comments_by_slug(
+                slug=slug, follower_id=user.id, limit=20
+            ),
+        ),
+    ]
+
+    for offset in LIST_ARTICLES_OFFSETS:
+        if offset >= fixtures.articles_count:
+            continue
+
+        benchmarks.append(
+            Benchmark(
+                name=f"articles.list_articles[offset={offset}]",
+                run=lambda offset=offset: articles_service.list_articles(
+                    limit=20, offset=offset
+                ),
+            )
+        )
+
+    benchmarks.append(
+        Benchmark(
+            name="articles.list_articles[compact]",
+            run=lambda: articles_service.list_articles(limit=20, include_body=False),
+        )
+    )
+
+    for sort in ["trending", "top"]:
+        benchmarks.append(
+            Benchmark(
+                name=f"articles.list_articles[sort={sort}]",
+                run=lambda sort=sort: articles_service.list_articles(
+                    limit=20, sort=sort
+                ),
+            )
+        )
+
+    benchmarks.append(
+        Benchmark(
+            name="articles.rescore_trending_articles",
+            run=articles_service.rescore_trending_articles,
+        )
+    )
+
+    if fixtures.popular_tag:
+        benchmarks.append(
+            Benchmark(
+                name="articles.list_articles[tag]",
+                run=lambda: articles_service.list_articles(
+                    tag=fixtures.popular_tag, limit=20
+                ),
+            )
+        )
+
+    if fixtures.top_favoriter_id:
+        benchmarks.append(
+            Benchmark(
+                name="articles.list_articles[favorited]",
+                run=lambda: articles_service.list_articles(
+                    articles_favorited_by_user_id=fixtures.top_favoriter_id, limit=20
+                ),
+            )
+        )
+
+    for followed_authors_count in FOLLOWED_AUTHORS_COUNTS:
+        follower = fixtures.followers[followed_authors_count]
+
+        benchmarks.append(
+            Benchmark(
+                name=f"articles.list_articles[feed,following={followed_authors_count}]",
+                run=lambda follower=follower: articles_service.list_articles(
+                    authors_followed_by_user_id=follower.id, limit=20
+                ),
+            )
+        )
+        benchmarks.append(
+            Benchmark(
+                name=f"profiles.get_followed_profiles_by_user_id"
+                f"[following={followed_authors_count}]",
+                run=lambda follower=follower: profiles_service.get_followed_profiles_by_user_id(
+                    follower_id=follower.id
+                ),
+            )
+        )
+
+    multiple_articles_response = await _make_multiple_articles_response(
+        articles_service=articles_service, profiles_service=profiles_service
+    )
+    article_response = _make_article_response(
+        multiple_articles_response=multiple_articles_response
+    )
+
+    benchmarks.extend(
+        [
+            Benchmark(
+                name="serialize.ArticleResponse",
+                run=lambda: serialize(response=article_response),
+            ),
+            Benchmark(
+                name="serialize.MultipleArticlesResponse[articles=20]",
+                run=lambda: serialize(response=multiple_articles_response),
+            ),
+        ]
+    )
+
+    return benchmarks
+
+
+async def _make_multiple_articles_response(
+    articles_service: ArticlesService, profiles_service: ProfilesService
+) -> MultipleArticlesResponse:
+    articles = await articles_service.list_articles(limit=20)
+
+    author_profiles: Dict[str, MultipleArticlesResponseAuthorProfile] = {}
+
+    for article in articles:
+        if article.author_id not in author_profiles:
+            author_profile = await profiles_service.get_profile_by_user_id(
+                user_id=article.author_id
+            )
+            author_profiles[article.author_id] = MultipleArticlesResponseAuthorProfile(
+                username=author_profile.username,
+                bio=author_profile.bio,
+                image=author_profile.image,
+                following=author_profile.following,
+            )
+
+    return MultipleArticlesResponse(
+        articles=[
+            MultipleArticlesResponseArticle(
+                slug=article.slug,
+                title=article.title,
+                description=article.description,
+                body=article.body,
+                tag_list=article.tags,
+                created_at=article.created_at,
+                updated_at=article.updated_at,
+                favorited=False,
+                favorites_count=article.favorites_count,
+                author=author_profiles[article.author_id],
+            )
+            for article in articles
+        ],
+        articles_count=len(articles),
+    )
+
+
+def _make_article_response(
+    multiple_articles_response: MultipleArticlesResponse,
+) -> ArticleResponse:
+    article = multiple_articles_response.articles[0]
+
+    return ArticleResponse(
+        article=ArticleResponseArticle(
+            **{
+                field.name: getattr(article, field.name)
+                for field in dataclasses.fields(ArticleResponseArticle)
+                if field.name != "author"
+            },
+            author=ArticleResponseArticleAuthorProfile(
+                **dataclasses.asdict(article.author)
+            ),
+        )
+    )
@@ -0,0 +1,65 @@
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable, Optional
+
+
+@dataclass
+class Timing:
+    iterations: int
+    min_seconds: float
+    median_seconds: float
+    mean_seconds: float
+    p95_seconds: float
+    stdev_seconds: float
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+async def time_async(
+    function: Callable[[], Awaitable],
+    warmup_iterations: int,
+    min_iterations: int,
+    max_iterations: int,
+    min_seconds: float,
+    reset: Optional[Callable[[], Awaitable]] = None,
+) -> Timing:
+    """Times function, calling it at least min_iterations times and then until
+    min_seconds have passed or max_iterations is reached.
+
+    If given, reset is called after each call, untimed, to undo what function
+    did, such as unfavoriting an article function favorited.
+    """
+    for _ in range(warmup_iterations):
+        await function()
+
+        if reset:
+            await reset()
+
+    durations_seconds = []
+    started_at = time.perf_counter()
+
+    while len(durations_seconds) < max_iterations and (
+        len(durations_seconds) < min_iterations
+        or time.perf_counter() - started_at < min_seconds
+    ):
+        iteration_started_at = time.perf_counter()
+        await function()
+        durations_seconds.append(time.perf_counter() - iteration_started_at)
+
+        if reset:
+            await reset()
+
+    durations_seconds.sort()
+
+    return Timing(
+        iterations=len(durations_seconds),
+        min_seconds=durations_seconds[0],
+        median_seconds=statistics.median(durations_seconds),
+        mean_seconds=statistics.fmean(durations_seconds),
+        p95_seconds=durations_seconds[max(round(0.95 * len(durations_seconds)) - 1, 0)],
+        stdev_seconds=statistics.stdev(durations_seconds)
+        if len(durations_seconds) > 1
+        else 0,
+    )
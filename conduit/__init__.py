@@ -1,11 +1,43 @@
-import psycopg
+import asyncio
+import contextlib
 from quart import Quart, Blueprint
 from quart_jwt_extended import JWTManager
 from quart_schema import QuartSchema
 from .users import UsersService, users_blueprint
 from .profiles import ProfilesService, profiles_blueprint
-from .articles import ArticlesService, articles_blueprint
+from .articles import (
+    ArticlesService,
+    CommentsStream,
+    FavoritesBuffer,
+    FeedStream,
+    HotArticles,
+    TagIndex,
+    articles_blueprint,
+)
+from .auth import get_jwt_identity
+from .database import (
+    ConnectionRouter,
+    NotificationListener,
+    QueryInstrumentation,
+    SlowQueryLog,
+    add_request_queries_tracking,
+)
 from .error_handlers import add_error_handlers, add_jwt_manager_error_loaders
+from .metrics import (
+    EventLoopMonitor,
+    MetricsRegistry,
+    add_request_metrics,
+    metrics_blueprint,
+)
+from .profiling import add_request_profiling, profiling_blueprint
+from .structured_logging import configure_logging
+from .subscriptions import Subscriptions
+from .tracing import (
+    OtlpHttpExporter,
+    StdoutJsonlExporter,
+    Tracer,
+    add_request_tracing,
+)
 from .config import config
 
 app = Quart(__name__)
@@ -22,19 +54,174 @@ QuartSchema(
 
 app.config.from_object(config)
 
+app.log_listener = configure_logging(app=app)
+
 add_jwt_manager_error_loaders(app=app, jwt_manager=jwt_manager)
 
 add_error_handlers(app=app)
 
+app.metrics_registry = MetricsRegistry(directory=app.config["METRICS_DIR"])
+
+add_request_metrics(app=app, metrics_registry=app.metrics_registry)
+
+app.query_instrumentation = QueryInstrumentation(metrics_registry=app.metrics_registry)
+
+add_request_queries_tracking(
+    app=app,
+    query_instrumentation=app.query_instrumentation,
+    metrics_registry=app.metrics_registry,
+)
+
+add_request_profiling(app=app)
+
+if app.config["TRACING_EXPORTER"] == "otlp":
+    span_exporter = OtlpHttpExporter(
+        endpoint=app.config["TRACING_OTLP_ENDPOINT"],
+        service_name=app.config["TRACING_SERVICE_NAME"],
+    )
+else:
+    span_exporter = StdoutJsonlExporter()
+
+app.tracer = Tracer(
+    exporter=span_exporter, sample_ratio=app.config["TRACING_SAMPLE_RATIO"]
+)
+
+add_request_tracing(
+    app=app, tracer=app.tracer, query_instrumentation=app.query_instrumentation
+)
+
 
 @app.before_serving
 async def startup():
-    app.aconn = await psycopg.AsyncConnection.connect(app.config["DATABASE_URI"])
+    app.log_listener.start()
+
+    app.aconn = await ConnectionRouter.connect(
+        primary_uri=app.config["DATABASE_URI"],
+        replica_uris=app.config["DATABASE_REPLICA_URIS"],
+        read_your_writes_seconds=app.config["DATABASE_READ_YOUR_WRITES_SECONDS"],
+        replica_max_lag_seconds=app.config["DATABASE_REPLICA_MAX_LAG_SECONDS"],
+        get_caller=get_jwt_identity,
+        query_instrumentation=app.query_instrumentation,
+        max_dedicated_connections=app.config["DATABASE_MAX_DEDICATED_CONNECTIONS"],
+    )
+
+    app.replicas_lag_monitor = asyncio.create_task(
+        app.aconn.monitor_replicas_lag(
+            interval_seconds=app.config["DATABASE_REPLICA_LAG_CHECK_INTERVAL_SECONDS"]
+        )
+    )
+
+    app.metrics_flusher = asyncio.create_task(
+        app.metrics_registry.flush_periodically(
+            interval_seconds=app.config["METRICS_FLUSH_INTERVAL_SECONDS"]
+        )
+    )
+
+    if app.config["DEBUG"]:
+        blocking_threshold_seconds = app.config["EVENT_LOOP_BLOCKING_THRESHOLD_SECONDS"]
+    else:
+        blocking_threshold_seconds = None
+
+    event_loop_monitor = EventLoopMonitor(
+        metrics_registry=app.metrics_registry,
+        interval_seconds=app.config["EVENT_LOOP_LAG_CHECK_INTERVAL_SECONDS"],
+        blocking_threshold_seconds=blocking_threshold_seconds,
+    )
+
+    app.event_loop_monitor = asyncio.create_task(event_loop_monitor.monitor())
+
+    app.slow_query_log = SlowQueryLog(
+        conninfo=app.config["DATABASE_URI"],
+        threshold_seconds=app.config["DATABASE_SLOW_QUERY_SECONDS"],
+        explain_interval_seconds=app.config[
+            "DATABASE_SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS"
+        ],
+    )
+
+    app.query_instrumentation.add_listener(app.slow_query_log.observe)
+
+    app.hot_articles = HotArticles(
+        rate_threshold=app.config["FAVORITES_HOT_ARTICLE_RATE"]
+    )
 
     users_service = UsersService(aconn=app.aconn)
     profiles_service = ProfilesService(aconn=app.aconn, users_service=users_service)
     articles_service = ArticlesService(
-        aconn=app.aconn, profiles_service=profiles_service
+        aconn=app.aconn,
+        profiles_service=profiles_service,
+        tag_index=TagIndex(max_suggestions=app.config["TAG_SUGGESTIONS_MAX_LIMIT"]),
+        favorites_buffer=FavoritesBuffer(
+            max_size=app.config["FAVORITES_BUFFER_MAX_SIZE"]
+        )
+        if app.config["FAVORITES_WRITE_BEHIND"]
+        else None,
+        hot_articles=app.hot_articles,
+        comments_max_limit=app.config["COMMENTS_MAX_LIMIT"],
+        search_max_limit=app.config["SEARCH_MAX_LIMIT"],
+    )
+
+    await articles_service.refresh_tag_index()
+
+    app.tag_index_refresher = asyncio.create_task(
+        articles_service.refresh_tag_index_periodically(
+            interval_seconds=app.config["TAG_INDEX_REFRESH_INTERVAL_SECONDS"]
+        )
+    )
+
+    app.trending_rescorer = asyncio.create_task(
+        articles_service.rescore_trending_articles_periodically(
+            interval_seconds=app.config["TRENDING_RESCORE_INTERVAL_SECONDS"]
+        )
+    )
+
+    app.favorites_count_roller = asyncio.create_task(
+        articles_service.roll_up_favorites_count_shards_periodically(
+            interval_seconds=app.config["FAVORITES_COUNT_ROLLUP_INTERVAL_SECONDS"]
+        )
+    )
+
+    if app.config["FAVORITES_WRITE_BEHIND"]:
+        app.favorites_flusher = asyncio.create_task(
+            articles_service.flush_favorites_periodically(
+                interval_seconds=app.config["FAVORITES_FLUSH_INTERVAL_SECONDS"]
+            )
+        )
+    else:
+        app.favorites_flusher = None
+
+    app.feed_stream = FeedStream(
+        articles_service=articles_service,
+        subscriptions=Subscriptions(
+            name="feed",
+            queue_size=app.config["STREAM_QUEUE_SIZE"],
+            metrics_registry=app.metrics_registry,
+        ),
+    )
+
+    app.comments_stream = CommentsStream(
+        articles_service=articles_service,
+        subscriptions=Subscriptions(
+            name="comments",
+            queue_size=app.config["STREAM_QUEUE_SIZE"],
+            metrics_registry=app.metrics_registry,
+        ),
+    )
+
+    app.notification_listener = NotificationListener(
+        conninfo=app.config["DATABASE_URI"]
+    )
+    app.notification_listener.add_callback(
+        channel=app.feed_stream.channel, callback=app.feed_stream.handle_notification
+    )
+    app.notification_listener.add_callback(
+        channel=app.comments_stream.channel,
+        callback=app.comments_stream.handle_notification,
+    )
+
+    await app.notification_listener.start()
+
+    app.notifications_listener_task = asyncio.create_task(
+        app.notification_listener.listen()
     )
 
     app.users_service = users_service
@@ -44,8 +231,39 @@ async def startup():
     app.register_blueprint(blueprint=users_blueprint)
     app.register_blueprint(blueprint=profiles_blueprint)
     app.register_blueprint(blueprint=articles_blueprint)
+    app.register_blueprint(blueprint=metrics_blueprint)
+    app.register_blueprint(blueprint=profiling_blueprint)
 
 
 @app.after_serving
 async def shutdown():
+    app.replicas_lag_monitor.cancel()
+    app.metrics_flusher.cancel()
+    app.event_loop_monitor.cancel()
+    app.tag_index_refresher.cancel()
+    app.trending_rescorer.cancel()
+    app.favorites_count_roller.cancel()
+
+    if app.favorites_flusher:
+        app.favorites_flusher.cancel()
+
+    await app.articles_service.flush_favorites()
+
+    app.notifications_listener_task.cancel()
+
+    with contextlib.suppress(asyncio.CancelledError):
+        await app.notifications_listener_task
+
+    await app.notification_listener.close()
+
+    await app.metrics_registry.flush()
+
+    app.query_instrumentation.remove_listener(app.slow_query_log.observe)
+
+    await app.slow_query_log.close()
+
     await app.aconn.close()
+
+    await asyncio.to_thread(app.tracer.exporter.shutdown)
+
+    await asyncio.to_thread(app.log_listener.stop)
@@ -1,2 +1,7 @@
 from .articles_service import ArticlesService
+from .tag_index import TagIndex
+from .favorites_buffer import FavoritesBuffer
+from .hot_articles import HotArticles
+from .feed_stream import FeedStream
+from .comments_stream import CommentsStream
 from .articles_blueprint import articles_blueprint
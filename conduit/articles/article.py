@@ -1,6 +1,6 @@
 import datetime
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 
 @dataclass
@@ -10,7 +10,7 @@ class Article:
     slug: str
     title: str
     description: str
-    body: str
+    body: Optional[str]
     tags: List[str]
     created_at: datetime.datetime
     updated_at: datetime.datetime
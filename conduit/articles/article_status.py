@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ArticleStatus:
+    slug: str
+    favorited: bool
+    favorites_count: int
+    comments_count: int
+    author_username: str
+    following: bool
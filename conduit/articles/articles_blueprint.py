@@ -8,14 +8,22 @@ from .CommentResponse import (
     CommentResponseAuthorProfile,
 )
 from .add_comment_request import AddCommentRequest
+from .articles_status_request import ArticlesStatusRequest
+from .articles_status_response import (
+    ArticlesStatusResponse,
+    ArticlesStatusResponseArticle,
+    ArticlesStatusResponseAuthorProfile,
+)
 from .article_response import (
     ArticleResponse,
     ArticleResponseArticle,
     ArticleResponseArticleAuthorProfile,
 )
 from .create_article_request import CreateArticleRequest
+from .export_articles_query_args import ExportArticlesQueryArgs
 from .feed_articles_query_args import FeedArticlesQueryArgs
 from .list_articles_request_query_args import ListArticlesQueryArgs
+from .list_comments_from_article_query_args import ListCommentsFromArticleQueryArgs
 from .list_of_tags_response import ListOfTagsResponse
 from .multiple_articles_response import (
     MultipleArticlesResponse,
@@ -27,9 +35,22 @@ from .multiple_comments_response import (
     MultipleCommentsResponseComment,
     MultipleCommentsResponseAuthorProfile,
 )
+from .search_articles_query_args import SearchArticlesQueryArgs
+from .suggest_tags_query_args import SuggestTagsQueryArgs
 from .update_article_request import UpdateArticleRequest
-from ..auth import jwt_required, jwt_optional, get_jwt_identity
+from ..auth import (
+    jwt_required,
+    jwt_optional,
+    get_jwt_identity,
+    get_websocket_jwt_identity,
+)
 from ..exceptions import UnauthorizedException, NotFoundException
+from ..event_streaming import (
+    reject_websocket,
+    send_websocket_events,
+    stream_events_response,
+)
+from ..json_streaming import stream_json_response
 
 articles_blueprint = Blueprint("articles", __name__, url_prefix="/api")
 
@@ -49,7 +70,7 @@ async def create_article(data: CreateArticleRequest) -> (ArticleResponse, int):
         raise UnauthorizedException(f"author {author_username} not found")
 
     current_app.logger.info(
-        f"received create article request. author_id: {author.id}, data: {data}"
+        "received create article request. author_id: %s, data: %s", author.id, data
     )
 
     article = await current_app.articles_service.create_article(
@@ -134,6 +155,8 @@ async def list_articles(
         articles_favorited_by_user_id=articles_favorited_by_user_id,
         limit=query_args.limit,
         offset=query_args.offset,
+        sort=query_args.sort,
+        include_body=not query_args.compact,
     )
 
     article_responses = []
@@ -179,6 +202,81 @@ async def list_articles(
     )
 
 
+@articles_blueprint.get(rule="/articles/export")
+@jwt_optional
+@validate_querystring(model_class=ExportArticlesQueryArgs)
+async def export_articles(query_args: ExportArticlesQueryArgs) -> Response:
+    username = get_jwt_identity()
+
+    if username:
+        current_user = await current_app.users_service.get_user_by_username(
+            username=username
+        )
+
+        if not current_user:
+            raise UnauthorizedException(f"user {username} not found")
+    else:
+        current_user = None
+
+    if query_args.author:
+        author = await current_app.users_service.get_user_by_username(
+            username=query_args.author
+        )
+        if not author:
+            raise NotFoundException(f"author {query_args.author} not found")
+        author_id = author.id
+    else:
+        author_id = None
+
+    if query_args.favorited:
+        articles_favorited_by_user = (
+            await current_app.users_service.get_user_by_username(
+                username=query_args.favorited
+            )
+        )
+
+        if not articles_favorited_by_user:
+            raise NotFoundException(
+                f"favorited by user {query_args.favorited} not found"
+            )
+        articles_favorited_by_user_id = articles_favorited_by_user.id
+    else:
+        articles_favorited_by_user_id = None
+
+    articles = current_app.articles_service.stream_articles(
+        tag=query_args.tag,
+        author_id=author_id,
+        articles_favorited_by_user_id=articles_favorited_by_user_id,
+        user_id=current_user.id if current_user else None,
+    )
+
+    async def _article_responses():
+        async for article, author_profile, is_favorited in articles:
+            yield MultipleArticlesResponseArticle(
+                slug=article.slug,
+                title=article.title,
+                description=article.description,
+                body=article.body,
+                tag_list=article.tags,
+                created_at=article.created_at,
+                updated_at=article.updated_at,
+                favorited=is_favorited,
+                favorites_count=article.favorites_count,
+                author=MultipleArticlesResponseAuthorProfile(
+                    username=author_profile.username,
+                    bio=author_profile.bio,
+                    image=author_profile.image,
+                    following=author_profile.following,
+                ),
+            )
+
+    return await stream_json_response(
+        items_key="articles",
+        items=_article_responses(),
+        count_key="articles_count",
+    )
+
+
 @articles_blueprint.get(rule="/articles/feed")
 @jwt_required
 @validate_querystring(model_class=FeedArticlesQueryArgs)
@@ -199,6 +297,7 @@ async def feed_articles(
         authors_followed_by_user_id=current_user.id,
         limit=query_args.limit,
         offset=query_args.offset,
+        include_body=not query_args.compact,
     )
 
     article_responses = []
@@ -235,6 +334,142 @@ async def feed_articles(
     )
 
 
+@articles_blueprint.get(rule="/articles/feed/stream")
+@jwt_required
+async def stream_feed_articles() -> Response:
+    username = get_jwt_identity()
+
+    current_user = await current_app.users_service.get_user_by_username(
+        username=username
+    )
+
+    if not current_user:
+        raise UnauthorizedException(f"user {username} not found")
+
+    return stream_events_response(
+        subscribe=current_app.feed_stream.subscribe(user_id=current_user.id),
+        heartbeat_seconds=current_app.config["STREAM_HEARTBEAT_SECONDS"],
+    )
+
+
+@articles_blueprint.websocket(rule="/articles/feed/stream")
+async def stream_feed_articles_websocket():
+    username = get_websocket_jwt_identity()
+
+    current_user = (
+        await current_app.users_service.get_user_by_username(username=username)
+        if username
+        else None
+    )
+
+    if not current_user:
+        await reject_websocket(reason="unauthorized")
+        return
+
+    with current_app.feed_stream.subscribe(user_id=current_user.id) as subscription:
+        await send_websocket_events(subscription=subscription)
+
+
+@articles_blueprint.get(rule="/articles/search")
+@jwt_optional
+@validate_querystring(model_class=SearchArticlesQueryArgs)
+@validate_response(model_class=MultipleArticlesResponse)
+async def search_articles(
+    query_args: SearchArticlesQueryArgs,
+) -> (MultipleArticlesResponse, int):
+    username = get_jwt_identity()
+
+    if username:
+        current_user = await current_app.users_service.get_user_by_username(
+            username=username
+        )
+
+        if not current_user:
+            raise UnauthorizedException(f"user {username} not found")
+    else:
+        current_user = None
+
+    articles, next_cursor = await current_app.articles_service.search_articles(
+        query=query_args.q or "",
+        user_id=current_user.id if current_user else None,
+        limit=query_args.limit,
+        cursor=query_args.cursor,
+        include_body=not query_args.compact,
+    )
+
+    article_responses = []
+    for article, author_profile, is_favorited_by_current_user in articles:
+        article_response_article = MultipleArticlesResponseArticle(
+            slug=article.slug,
+            title=article.title,
+            description=article.description,
+            body=article.body,
+            tag_list=article.tags,
+            created_at=article.created_at,
+            updated_at=article.updated_at,
+            favorited=is_favorited_by_current_user,
+            favorites_count=article.favorites_count,
+            author=MultipleArticlesResponseAuthorProfile(
+                username=author_profile.username,
+                bio=author_profile.bio,
+                image=author_profile.image,
+                following=author_profile.following,
+            ),
+        )
+        article_responses.append(article_response_article)
+
+    return MultipleArticlesResponse(
+        articles=article_responses,
+        articles_count=len(article_responses),
+        next_cursor=next_cursor,
+    )
+
+
+@articles_blueprint.post(rule="/articles/status")
+@jwt_optional
+@validate_request(model_class=ArticlesStatusRequest)
+@validate_response(model_class=ArticlesStatusResponse)
+async def get_articles_status(
+    data: ArticlesStatusRequest,
+) -> (ArticlesStatusResponse, int):
+    max_slugs = current_app.config["ARTICLES_STATUS_MAX_SLUGS"]
+
+    if len(data.slugs) > max_slugs:
+        raise ValueError(f"slugs must have at most {max_slugs} items")
+
+    username = get_jwt_identity()
+
+    if username:
+        current_user = await current_app.users_service.get_user_by_username(
+            username=username
+        )
+
+        if not current_user:
+            raise UnauthorizedException(f"user {username} not found")
+    else:
+        current_user = None
+
+    articles_status = await current_app.articles_service.get_articles_status_by_slugs(
+        slugs=data.slugs, user_id=current_user.id if current_user else None
+    )
+
+    return ArticlesStatusResponse(
+        articles=[
+            ArticlesStatusResponseArticle(
+                slug=article_status.slug,
+                favorited=article_status.favorited,
+                favorites_count=article_status.favorites_count,
+                comments_count=article_status.comments_count,
+                author=ArticlesStatusResponseAuthorProfile(
+                    username=article_status.author_username,
+                    following=article_status.following,
+                ),
+            )
+            for article_status in articles_status
+        ]
+    )
+
+
 @articles_blueprint.get(rule="/articles/<slug>")
 @jwt_optional
 @validate_response(model_class=ArticleResponse)
@@ -303,7 +538,10 @@ async def update_article(
         raise UnauthorizedException(f"author {author_username} not found")
 
     current_app.logger.info(
-        f"received update article request. author_id: {author.id}, slug: {slug}, data: {data}"
+        "received update article request. author_id: %s, slug: %s, data: %s",
+        author.id,
+        slug,
+        data,
     )
 
     article = await current_app.articles_service.get_article_by_slug(slug=slug)
@@ -357,7 +595,7 @@ async def delete_article(slug: str):
         raise UnauthorizedException(f"author {author_username} not found")
 
     current_app.logger.info(
-        f"received delete article request. author_id: {author.id}, slug: {slug}"
+        "received delete article request. author_id: %s, slug: %s", author.id, slug
     )
 
     article = await current_app.articles_service.get_article_by_slug(slug=slug)
@@ -380,6 +618,17 @@ async def get_tags() -> (ListOfTagsResponse, int):
     return ListOfTagsResponse(tags=tags)
 
 
+@articles_blueprint.get(rule="/tags/suggest")
+@validate_querystring(model_class=SuggestTagsQueryArgs)
+@validate_response(model_class=ListOfTagsResponse)
+async def suggest_tags(query_args: SuggestTagsQueryArgs) -> (ListOfTagsResponse, int):
+    tags = current_app.articles_service.suggest_tags(
+        prefix=query_args.prefix or "", limit=query_args.limit
+    )
+
+    return ListOfTagsResponse(tags=tags)
+
+
 @articles_blueprint.post(rule="/articles/<slug>/favorite")
 @jwt_required
 @validate_response(model_class=ArticleResponse)
@@ -394,15 +643,13 @@ async def favorite_article(slug: str) -> (ArticleResponse, int):
         raise UnauthorizedException(f"user {author_username} not found")
 
     current_app.logger.info(
-        f"received favorite article request. user_id: {user.id}, slug: {slug}"
+        "received favorite article request. user_id: %s, slug: %s", user.id, slug
     )
 
-    await current_app.articles_service.favorite_article_by_slug(
+    article = await current_app.articles_service.favorite_article_by_slug(
         slug=slug, user_id=user.id
     )
 
-    article = await current_app.articles_service.get_article_by_slug(slug=slug)
-
     author_profile = await current_app.profiles_service.get_profile_by_user_id(
         user_id=article.author_id, follower_id=user.id
     )
@@ -444,15 +691,13 @@ async def unfavorite_article(slug: str) -> (ArticleResponse, int):
         raise UnauthorizedException(f"user {author_username} not found")
 
     current_app.logger.info(
-        f"received unfavorite article request. user_id: {user.id}, slug: {slug}"
+        "received unfavorite article request. user_id: %s, slug: %s", user.id, slug
     )
 
-    await current_app.articles_service.unfavorite_article_by_slug(
+    article = await current_app.articles_service.unfavorite_article_by_slug(
         slug=slug, user_id=user.id
     )
 
-    article = await current_app.articles_service.get_article_by_slug(slug=slug)
-
     author_profile = await current_app.profiles_service.get_profile_by_user_id(
         user_id=article.author_id, follower_id=user.id
     )
@@ -497,7 +742,10 @@ async def add_comment_to_article(
         raise UnauthorizedException(f"author {author_username} not found")
 
     current_app.logger.info(
-        f"received add comment to article request. author_id: {author.id}, slug: {slug}, data: {data}"
+        "received add comment to article request. author_id: %s, slug: %s, data: %s",
+        author.id,
+        slug,
+        data,
     )
 
     comment = await current_app.articles_service.add_comment_to_article_by_slug(
@@ -525,8 +773,11 @@ async def add_comment_to_article(
 
 @articles_blueprint.get(rule="/articles/<slug>/comments")
 @jwt_optional
+@validate_querystring(model_class=ListCommentsFromArticleQueryArgs)
 @validate_response(model_class=MultipleCommentsResponse)
-async def list_comments_from_article(slug: str) -> (MultipleCommentsResponse, int):
+async def list_comments_from_article(
+    slug: str, query_args: ListCommentsFromArticleQueryArgs
+) -> (MultipleCommentsResponse, int):
     username = get_jwt_identity()
 
     if username:
@@ -539,21 +790,19 @@ async def list_comments_from_article(slug: str) -> (MultipleCommentsResponse, in
     else:
         current_user = None
 
-    comments = await current_app.articles_service.list_article_comments_by_slug(
-        slug=slug
+    (
+        comments,
+        next_cursor,
+    ) = await current_app.articles_service.list_article_comments_by_slug(
+        slug=slug,
+        follower_id=current_user.id if current_user else None,
+        limit=query_args.limit,
+        offset=query_args.offset,
+        cursor=query_args.cursor,
     )
 
     comment_responses = []
-    for comment in comments:
-        if current_user:
-            author_profile = await current_app.profiles_service.get_profile_by_user_id(
-                user_id=comment.author_id, follower_id=current_user.id
-            )
-        else:
-            author_profile = await current_app.profiles_service.get_profile_by_user_id(
-                user_id=comment.author_id
-            )
-
+    for comment, author_profile in comments:
         comment_response_comment = MultipleCommentsResponseComment(
             id=str(comment.id),
             body=comment.body,
@@ -568,7 +817,72 @@ async def list_comments_from_article(slug: str) -> (MultipleCommentsResponse, in
         )
         comment_responses.append(comment_response_comment)
 
-    return MultipleCommentsResponse(comments=comment_responses)
+    return MultipleCommentsResponse(comments=comment_responses, next_cursor=next_cursor)
+
+
+@articles_blueprint.get(rule="/articles/<slug>/comments/export")
+@jwt_optional
+async def export_comments_from_article(slug: str) -> Response:
+    username = get_jwt_identity()
+
+    if username:
+        current_user = await current_app.users_service.get_user_by_username(
+            username=username
+        )
+
+        if not current_user:
+            raise UnauthorizedException(f"user {username} not found")
+    else:
+        current_user = None
+
+    article = await current_app.articles_service.get_article_by_slug(slug=slug)
+
+    comments = current_app.articles_service.stream_article_comments(
+        article_id=article.id,
+        follower_id=current_user.id if current_user else None,
+    )
+
+    async def _comment_responses():
+        async for comment, author_profile in comments:
+            yield MultipleCommentsResponseComment(
+                id=str(comment.id),
+                body=comment.body,
+                created_at=comment.created_at,
+                updated_at=comment.updated_at,
+                author=MultipleCommentsResponseAuthorProfile(
+                    username=author_profile.username,
+                    bio=author_profile.bio,
+                    image=author_profile.image,
+                    following=author_profile.following,
+                ),
+            )
+
+    return await stream_json_response(items_key="comments", items=_comment_responses())
+
+
+@articles_blueprint.get(rule="/articles/<slug>/comments/stream")
+async def stream_comments_from_article(slug: str) -> Response:
+    article = await current_app.articles_service.get_article_by_slug(slug=slug)
+
+    if not article:
+        raise NotFoundException(f"slug {slug} not found")
+
+    return stream_events_response(
+        subscribe=current_app.comments_stream.subscribe(article_id=article.id),
+        heartbeat_seconds=current_app.config["STREAM_HEARTBEAT_SECONDS"],
+    )
+
+
+@articles_blueprint.websocket(rule="/articles/<slug>/comments/stream")
+async def stream_comments_from_article_websocket(slug: str):
+    try:
+        article = await current_app.articles_service.get_article_by_slug(slug=slug)
+    except NotFoundException as e:
+        await reject_websocket(reason=str(e))
+        return
+
+    with current_app.comments_stream.subscribe(article_id=article.id) as subscription:
+        await send_websocket_events(subscription=subscription)
 
 
 @articles_blueprint.delete(rule="/articles/<slug>/comments/<comment_id>")
@@ -584,7 +898,10 @@ async def delete_comment_from_article(slug: str, comment_id: str):
         raise UnauthorizedException(f"author {author_username} not found")
 
     current_app.logger.info(
-        f"received delete comment from article request. author_id: {author.id}, slug: {slug}, comment_id: {comment_id}"
+        "received delete comment from article request. author_id: %s, slug: %s, comment_id: %s",
+        author.id,
+        slug,
+        comment_id,
     )
 
     comment = await current_app.articles_service.get_comment_by_id(
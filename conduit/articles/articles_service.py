@@ -1,26 +1,76 @@
+import asyncio
+import base64
+import binascii
+import datetime
+import json
+import logging
+import random
+import uuid
 import psycopg
 import shortuuid
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from slugify import slugify
 
 from .Comment import Comment
 from .article import Article
+from .article_status import ArticleStatus
+from .favorites_buffer import FavoritesBuffer
+from .hot_articles import HotArticles
+from .tag_index import TagIndex
 from .. import ProfilesService
+from ..profiles import Profile
+from ..database import ConnectionRouter, read_only, read_write
 from ..exceptions import NotFoundException
+from ..tracing import traced
 
+logger = logging.getLogger(__name__)
 
+
+@traced
 class ArticlesService:
     def __init__(
-        self, aconn: psycopg.AsyncConnection, profiles_service: ProfilesService
+        self,
+        aconn: ConnectionRouter,
+        profiles_service: ProfilesService,
+        tag_index: TagIndex,
+        favorites_buffer: Optional[FavoritesBuffer] = None,
+        hot_articles: Optional[HotArticles] = None,
+        comments_max_limit: int = 100,
+        search_max_limit: int = 100,
     ):
         self._aconn = aconn
         self._profiles_service = profiles_service
+        self._tag_index = tag_index
+        self._favorites_buffer = favorites_buffer
+        self._favorites_flush_lock = asyncio.Lock()
+        self._hot_articles = hot_articles
+        self._comments_max_limit = comments_max_limit
+        self._search_max_limit = search_max_limit
         self._articles_table = "articles"
         self._tags_table = "tags"
         self._articles_tags_table = "articles_tags"
         self._favorites_table = "favorites"
         self._comments_table = "comments"
-
+        self._users_table = "users"
+        self._follows_table = "follows"
+        self._favorites_count_shards_table = "articles_favorites_count_shards"
+        self.articles_created_channel = "articles_created"
+        self.comments_changed_channel = "comments_changed"
+        self._favorites_count_shards = 16
+        # Arbitrary key of the advisory lock that lets one worker at a time roll up
+        # the favorites count shards.
+        self._favorites_count_rollup_lock_key = 1804289383
+        self._stream_batch_size = 500
+        self._trending_gravity = 1.8
+        self._trending_comment_weight = 2
+        self._trending_max_age = datetime.timedelta(days=30)
+        self._rescore_batch_size = 1000
+        self._sorts = {
+            "trending": "a.trending_score DESC, a.created_at DESC",
+            "top": "a.favorites_count DESC, a.created_at DESC",
+        }
+
+    @read_write
     async def create_article(
         self,
         author_id: str,
@@ -29,11 +79,19 @@ class ArticlesService:
         body: str,
         tags: Optional[List[str]],
     ) -> Article:
+        """Creates an article, notifying articles_created_channel of its id and
+        author_id when it commits.
+        """
         async with self._aconn.cursor() as acur:
             insert_user_query = f"""
-                INSERT INTO {self._articles_table} (author_id, slug, title, description, body, tags)
-                VALUES (%s, %s, %s, %s, %s, %s)
-                RETURNING id, created_at, updated_at;
+                WITH a AS (
+                    INSERT INTO {self._articles_table} (author_id, slug, title, description, body, tags)
+                    VALUES (%s, %s, %s, %s, %s, %s)
+                    RETURNING id, author_id, created_at, updated_at
+                )
+                SELECT id, created_at, updated_at,
+                    pg_notify(%s, json_build_object('id', id, 'author_id', author_id)::text)
+                FROM a;
             """
 
             slug = self._slugify_title(title=title)
@@ -42,7 +100,16 @@ class ArticlesService:
 
             try:
                 await acur.execute(
-                    insert_user_query, (author_id, slug, title, description, body, tags)
+                    insert_user_query,
+                    (
+                        author_id,
+                        slug,
+                        title,
+                        description,
+                        body,
+                        tags,
+                        self.articles_created_channel,
+                    ),
                 )
             except Exception as e:
                 await self._aconn.rollback()
@@ -65,13 +132,17 @@ class ArticlesService:
 
         await self._aconn.commit()
 
+        self._tag_index.add(tags=tags)
+
         return article
 
+    @read_only
     async def get_article_by_id(self, article_id: str) -> Optional[Article]:
         async with self._aconn.cursor() as acur:
             get_article_by_id_query = f"""
-                SELECT author_id, slug, title, description, body, tags, created_at, updated_at
-                FROM {self._articles_table}
+                SELECT author_id, slug, title, description, body, tags, created_at, updated_at,
+                    {self._favorites_count_column()}
+                FROM {self._articles_table} a
                 WHERE id = %s
                 AND deleted_at IS NULL;
             """
@@ -83,10 +154,6 @@ class ArticlesService:
             if not record:
                 raise NotFoundException(f"article {article_id} not found")
 
-            favorites_count = await self._get_favorites_count(
-                acur=acur, article_id=article_id
-            )
-
             return Article(
                 id=article_id,
                 author_id=record[0],
@@ -97,14 +164,16 @@ class ArticlesService:
                 tags=record[5],
                 created_at=record[6],
                 updated_at=record[7],
-                favorites_count=favorites_count,
+                favorites_count=record[8],
             )
 
+    @read_only
     async def get_article_by_slug(self, slug: str) -> Optional[Article]:
         async with self._aconn.cursor() as acur:
             get_article_by_slug_query = f"""
-                SELECT id, author_id, title, description, body, tags, created_at, updated_at
-                FROM {self._articles_table}
+                SELECT id, author_id, title, description, body, tags, created_at, updated_at,
+                    {self._favorites_count_column()}
+                FROM {self._articles_table} a
                 WHERE slug = %s
                 AND deleted_at IS NULL;
             """
@@ -116,14 +185,8 @@ class ArticlesService:
             if not record:
                 raise NotFoundException(f"slug {slug} not found")
 
-            article_id = record[0]
-
-            favorites_count = await self._get_favorites_count(
-                acur=acur, article_id=article_id
-            )
-
             return Article(
-                id=article_id,
+                id=record[0],
                 author_id=record[1],
                 slug=slug,
                 title=record[2],
@@ -132,9 +195,10 @@ class ArticlesService:
                 tags=record[5],
                 created_at=record[6],
                 updated_at=record[7],
-                favorites_count=favorites_count,
+                favorites_count=record[8],
             )
 
+    @read_only
     async def list_articles(
         self,
         tag: Optional[str] = None,
@@ -143,9 +207,24 @@ class ArticlesService:
         authors_followed_by_user_id: Optional[str] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        sort: Optional[str] = None,
+        include_body: bool = True,
     ) -> List[Article]:
+        """Lists articles newest first or, if sort is set, by trending_score
+        (favorites and comments, decayed by the article's age) or favorites_count.
+
+        Unless include_body, the bodies are not read and are None.
+        """
+        if sort is None:
+            order_by = "a.created_at DESC"
+        elif sort in self._sorts:
+            order_by = self._sorts[sort]
+        else:
+            raise ValueError(f"sort must be one of {', '.join(self._sorts)}")
+
         list_articles_query = f"""
-            SELECT id, author_id, slug, title, description, body, tags, created_at, updated_at
+            SELECT id, author_id, slug, title, description, {self._body_column(include_body=include_body)},
+                tags, created_at, updated_at, {self._favorites_count_column()}
             FROM {self._articles_table} a
             WHERE deleted_at IS NULL
         """
@@ -156,29 +235,16 @@ class ArticlesService:
         if offset is None:
             offset = 0
 
-        query_params = {"limit": limit, "offset": offset}
-
-        if tag:
-            list_articles_query = f"{list_articles_query} AND %(tag)s = ANY (tags)"
-            query_params["tag"] = tag
+        filter_articles_query, query_params = self._filter_articles_query(
+            tag=tag,
+            author_id=author_id,
+            articles_favorited_by_user_id=articles_favorited_by_user_id,
+        )
 
-        if author_id:
-            list_articles_query = f"{list_articles_query} AND author_id = %(author_id)s"
-            query_params["author_id"] = author_id
+        list_articles_query = f"{list_articles_query} {filter_articles_query}"
 
-        if articles_favorited_by_user_id:
-            list_articles_query = f"""
-                {list_articles_query}
-                AND EXISTS (
-                    SELECT 1 FROM {self._favorites_table} f
-                    WHERE f.article_id = a.id
-                    AND user_id = %(articles_favorited_by_user_id)s
-                    AND deleted_at IS NULL
-                )
-            """
-            query_params[
-                "articles_favorited_by_user_id"
-            ] = articles_favorited_by_user_id
+        query_params["limit"] = limit
+        query_params["offset"] = offset
 
         if authors_followed_by_user_id:
             followed_authors = (
@@ -197,7 +263,7 @@ class ArticlesService:
 
         list_articles_query = f"""
             {list_articles_query}
-            ORDER BY created_at DESC
+            ORDER BY {order_by}
             LIMIT %(limit)s
             OFFSET %(offset)s;
         """
@@ -210,14 +276,8 @@ class ArticlesService:
             articles = []
 
             for record in records:
-                article_id = record[0]
-
-                favorites_count = await self._get_favorites_count(
-                    acur=acur, article_id=article_id
-                )
-
                 article = Article(
-                    id=article_id,
+                    id=record[0],
                     author_id=record[1],
                     slug=record[2],
                     title=record[3],
@@ -226,13 +286,206 @@ class ArticlesService:
                     tags=record[6],
                     created_at=record[7],
                     updated_at=record[8],
-                    favorites_count=favorites_count,
+                    favorites_count=record[9],
                 )
 
                 articles.append(article)
 
             return articles
 
+    async def stream_articles(
+        self,
+        tag: Optional[str] = None,
+        author_id: Optional[str] = None,
+        articles_favorited_by_user_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[Article, Profile, bool]]:
+        """Yields every matching article with its author profile and whether user_id
+        favorited it, fetching them in batches from a server-side cursor.
+        """
+        filter_articles_query, query_params = self._filter_articles_query(
+            tag=tag,
+            author_id=author_id,
+            articles_favorited_by_user_id=articles_favorited_by_user_id,
+        )
+
+        query_params["user_id"] = user_id
+
+        stream_articles_query = f"""
+            SELECT a.id, a.author_id, a.slug, a.title, a.description, a.body, a.tags,
+                a.created_at, a.updated_at,
+                {self._favorites_count_column()},
+                EXISTS(
+                    SELECT 1 FROM {self._favorites_table} f
+                    WHERE f.article_id = a.id
+                    AND f.user_id = %(user_id)s
+                    AND f.deleted_at IS NULL
+                ),
+                u.username, u.bio, u.image,
+                {self._is_following_subquery(followed_id_column="a.author_id", follower_id_param="user_id")}
+            FROM {self._articles_table} a
+            JOIN {self._users_table} u ON u.id = a.author_id
+            WHERE a.deleted_at IS NULL
+            {filter_articles_query}
+            ORDER BY a.created_at DESC;
+        """
+
+        async with self._aconn.dedicated_connection(read_only=True) as aconn:
+            async with aconn.cursor(name="stream_articles") as acur:
+                acur.itersize = self._stream_batch_size
+
+                await acur.execute(stream_articles_query, query_params)
+
+                async for record in acur:
+                    article = Article(
+                        id=record[0],
+                        author_id=record[1],
+                        slug=record[2],
+                        title=record[3],
+                        description=record[4],
+                        body=record[5],
+                        tags=record[6],
+                        created_at=record[7],
+                        updated_at=record[8],
+                        favorites_count=record[9],
+                    )
+
+                    author_profile = Profile(
+                        user_id=record[1],
+                        username=record[11],
+                        bio=record[12],
+                        image=record[13],
+                        following=record[14],
+                    )
+
+                    yield article, author_profile, record[10]
+
+    @read_only
+    async def search_articles(
+        self,
+        query: str,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_body: bool = True,
+    ) -> Tuple[List[Tuple[Article, Profile, bool]], Optional[str]]:
+        """Lists a page of the articles matching query, best ranked first, with
+        their author profiles and whether user_id favorited them.
+
+        query uses the web search syntax (quoted phrases, "or" and "-" for
+        negation). Returns the articles and the cursor to pass to get the next
+        page, which is None on the last page. Unless include_body, the bodies are
+        not read and are None.
+        """
+        if not query.strip():
+            raise ValueError("q must not be empty")
+
+        if limit is None:
+            limit = 20
+
+        if not 0 < limit <= self._search_max_limit:
+            raise ValueError(
+                f"limit must be greater than 0 and at most {self._search_max_limit}"
+            )
+
+        search_articles_query = f"""
+            SELECT a.id, a.author_id, a.slug, a.title, a.description, {self._body_column(include_body=include_body, table_alias="a")}, a.tags,
+                a.created_at, a.updated_at,
+                {self._favorites_count_column()},
+                EXISTS(
+                    SELECT 1 FROM {self._favorites_table} f
+                    WHERE f.article_id = a.id
+                    AND f.user_id = %(user_id)s
+                    AND f.deleted_at IS NULL
+                ),
+                u.username, u.bio, u.image,
+                {self._is_following_subquery(followed_id_column="a.author_id", follower_id_param="user_id")},
+                a.rank
+            FROM (
+                SELECT a.*, ts_rank(a.search_vector, q) AS rank
+                FROM {self._articles_table} a, websearch_to_tsquery('english', %(query)s) q
+                WHERE a.search_vector @@ q
+                AND a.deleted_at IS NULL
+            ) a
+            JOIN {self._users_table} u ON u.id = a.author_id
+        """
+
+        query_params = {"query": query, "user_id": user_id, "limit": limit + 1}
+
+        if cursor:
+            cursor_rank, cursor_id = self._decode_search_cursor(cursor=cursor)
+
+            search_articles_query = f"""
+                {search_articles_query}
+                WHERE (a.rank, a.id) < (%(cursor_rank)s::real, %(cursor_id)s)
+            """
+            query_params["cursor_rank"] = cursor_rank
+            query_params["cursor_id"] = cursor_id
+
+        search_articles_query = f"""
+            {search_articles_query}
+            ORDER BY a.rank DESC, a.id DESC
+            LIMIT %(limit)s;
+        """
+
+        async with self._aconn.cursor() as acur:
+            try:
+                await acur.execute(search_articles_query, query_params)
+            except Exception as e:
+                await self._aconn.rollback()
+                raise e
+
+            records = await acur.fetchall()
+
+        articles = []
+        author_profiles = {}
+
+        for record in records[:limit]:
+            article = Article(
+                id=record[0],
+                author_id=record[1],
+                slug=record[2],
+                title=record[3],
+                description=record[4],
+                body=record[5],
+                tags=record[6],
+                created_at=record[7],
+                updated_at=record[8],
+                favorites_count=record[9],
+            )
+
+            if article.author_id not in author_profiles:
+                author_profiles[article.author_id] = Profile(
+                    user_id=record[1],
+                    username=record[11],
+                    bio=record[12],
+                    image=record[13],
+                    following=record[14],
+                )
+
+            buffered_favorited = self._get_buffered_favorited(
+                article_id=article.id, user_id=user_id
+            )
+
+            articles.append(
+                (
+                    article,
+                    author_profiles[article.author_id],
+                    record[10] if buffered_favorited is None else buffered_favorited,
+                )
+            )
+
+        if len(records) > limit and articles:
+            last_record = records[limit - 1]
+            next_cursor = self._encode_search_cursor(
+                rank=last_record[15], article_id=last_record[0]
+            )
+        else:
+            next_cursor = None
+
+        return articles, next_cursor
+
+    @read_write
     async def update_article_by_id(
         self,
         article_id: str,
@@ -241,16 +494,11 @@ class ArticlesService:
         body: Optional[str] = None,
         tags: Optional[List[str]] = None,
     ) -> Article:
-        article = await self.get_article_by_id(article_id=article_id)
-
-        if not article:
-            raise NotFoundException(f"article {article_id} not found")
-
-        initial_update_article_query = f"UPDATE {self._articles_table}"
+        initial_update_article_query = f"UPDATE {self._articles_table} a"
 
         update_article_query = initial_update_article_query
 
-        query_params = {"id": article.id}
+        query_params = {"id": article_id}
 
         if title:
             if update_article_query == initial_update_article_query:
@@ -293,34 +541,71 @@ class ArticlesService:
 
             query_params["tags"] = self._slugify_tags(tags=tags)
 
+        if update_article_query == initial_update_article_query:
+            return await self.get_article_by_id(article_id=article_id)
+
+        # Joining the article to itself returns its tags from before the update,
+        # to update the tag index with.
+        update_article_query = f"""
+            {update_article_query}, updated_at = current_timestamp
+            FROM {self._articles_table} old
+            WHERE a.id = %(id)s
+            AND old.id = a.id
+            AND a.deleted_at IS NULL
+            RETURNING a.author_id, a.slug, a.title, a.description, a.body, a.tags,
+                a.created_at, a.updated_at,
+                {self._favorites_count_column()},
+                old.tags;
+        """
+
         async with self._aconn.cursor() as acur:
-            if update_article_query != initial_update_article_query:
-                update_article_query = f"""
-                    {update_article_query}, updated_at = current_timestamp
-                    WHERE id = %(id)s
-                    AND deleted_at IS NULL;
-                """
+            try:
+                await acur.execute(
+                    update_article_query,
+                    params=query_params,
+                )
+            except Exception as e:
+                await self._aconn.rollback()
+                raise e
 
-                try:
-                    await acur.execute(
-                        update_article_query,
-                        params=query_params,
-                    )
-                except Exception as e:
-                    await self._aconn.rollback()
-                    raise e
+            record = await acur.fetchone()
+
+            if not record:
+                await self._aconn.rollback()
+                raise NotFoundException(f"article {article_id} not found")
+
+            article = Article(
+                id=article_id,
+                author_id=record[0],
+                slug=record[1],
+                title=record[2],
+                description=record[3],
+                body=record[4],
+                tags=record[5],
+                created_at=record[6],
+                updated_at=record[7],
+                favorites_count=record[8],
+            )
+
+            previous_tags = record[9]
 
         await self._aconn.commit()
 
-        return await self.get_article_by_id(article_id=article.id)
+        if previous_tags != article.tags:
+            self._tag_index.remove(tags=previous_tags or [])
+            self._tag_index.add(tags=article.tags or [])
+
+        return article
 
+    @read_write
     async def delete_article_by_id(self, article_id: str):
         async with self._aconn.cursor() as acur:
             delete_article_query = f"""
                 UPDATE {self._articles_table}
                 SET deleted_at = current_timestamp
                 WHERE id = %s
-                AND deleted_at IS NULL;
+                AND deleted_at IS NULL
+                RETURNING tags;
             """
 
             try:
@@ -329,12 +614,17 @@ class ArticlesService:
                 await self._aconn.rollback()
                 raise e
 
-            if acur.rowcount == 0:
+            record = await acur.fetchone()
+
+            if not record:
                 await self._aconn.rollback()
                 raise NotFoundException(f"article {article_id} not found")
 
         await self._aconn.commit()
 
+        self._tag_index.remove(tags=record[0] or [])
+
+    @read_only
     async def get_tags(self) -> List[str]:
         async with self._aconn.cursor() as acur:
             get_tags_query = f"""
@@ -349,54 +639,178 @@ class ArticlesService:
 
             return record[0] if record[0] is not None else []
 
-    async def favorite_article_by_slug(self, slug: str, user_id: str):
-        article = await self.get_article_by_slug(slug=slug)
+    @read_only
+    async def get_tags_usage_counts(self) -> Dict[str, int]:
+        async with self._aconn.cursor() as acur:
+            get_tags_usage_counts_query = f"""
+                SELECT t, COUNT(*)
+                FROM {self._articles_table}, UNNEST(tags) as t
+                WHERE deleted_at IS NULL
+                GROUP BY t;
+            """
 
-        if not article:
-            raise NotFoundException(f"slug {slug} not found")
+            await acur.execute(get_tags_usage_counts_query)
+
+            records = await acur.fetchall()
+
+            return {record[0]: record[1] for record in records}
+
+    def suggest_tags(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """Returns the most used tags starting with prefix, from the tag index.
+
+        The index is updated by this worker's article writes, and refreshed from
+        the database by refresh_tag_index to pick up those of other workers.
+        """
+        if limit is None:
+            limit = 10
+
+        if not 0 < limit <= self._tag_index.max_suggestions:
+            raise ValueError(
+                f"limit must be greater than 0 and at most {self._tag_index.max_suggestions}"
+            )
+
+        return self._tag_index.suggest(prefix=prefix.strip().lower(), limit=limit)
+
+    async def refresh_tag_index(self):
+        tags_usage_counts = await self.get_tags_usage_counts()
+
+        await asyncio.to_thread(self._tag_index.replace, tags_usage_counts)
+
+    async def refresh_tag_index_periodically(self, interval_seconds: float):
+        while True:
+            await asyncio.sleep(interval_seconds)
+
+            try:
+                await self.refresh_tag_index()
+            except psycopg.Error as e:
+                logger.warning("could not refresh the tag index: %s", e)
+
+    @read_write
+    async def favorite_article_by_slug(self, slug: str, user_id: str) -> Article:
+        if self._favorites_buffer:
+            return await self._buffer_favorite(
+                slug=slug, user_id=user_id, favorited=True
+            )
 
         async with self._aconn.cursor() as acur:
+            # The favorite is upserted in a data-modifying CTE, whose effects are not
+            # visible to the outer SELECT, so the count read is from before it, and
+            # the favorite is added if it was upserted.
             favorite_article_query = f"""
-                INSERT INTO {self._favorites_table} (article_id, user_id)
-                VALUES (%s, %s)
-                ON CONFLICT(article_id, user_id) WHERE deleted_at IS NOT NULL
-                DO UPDATE SET deleted_at = NULL;
+                WITH a AS (
+                    SELECT id, author_id, title, description, body, tags, created_at, updated_at,
+                        favorites_count
+                    FROM {self._articles_table}
+                    WHERE slug = %(slug)s
+                    AND deleted_at IS NULL
+                ), f AS (
+                    INSERT INTO {self._favorites_table} (article_id, user_id)
+                    SELECT id, %(user_id)s FROM a
+                    ON CONFLICT(article_id, user_id) WHERE deleted_at IS NOT NULL
+                    DO UPDATE SET deleted_at = NULL
+                    WHERE {self._favorites_table}.deleted_at IS NOT NULL
+                    RETURNING article_id
+                ), counts AS (
+                    {self._update_favorites_count_query(slug=slug, favorites_delta=1, changed_cte="f")}
+                )
+                SELECT id, author_id, title, description, body, tags, created_at, updated_at,
+                    {self._favorites_count_column()} + (SELECT COUNT(*) FROM f)
+                FROM a;
             """
 
             try:
-                await acur.execute(favorite_article_query, (article.id, user_id))
+                await acur.execute(
+                    favorite_article_query,
+                    {
+                        "slug": slug,
+                        "user_id": user_id,
+                        "shard": random.randrange(self._favorites_count_shards),
+                        **self._trending_params(),
+                    },
+                )
             except Exception as e:
                 await self._aconn.rollback()
                 raise e
 
-        await self._aconn.commit()
+            record = await acur.fetchone()
 
-    async def unfavorite_article_by_slug(self, slug: str, user_id: str):
-        article = await self.get_article_by_slug(slug=slug)
+            if not record:
+                await self._aconn.rollback()
+                raise NotFoundException(f"slug {slug} not found")
 
-        if not article:
-            raise NotFoundException(f"slug {slug} not found")
+            article = self._favorited_article_from_record(slug=slug, record=record)
 
-        if not await self.is_favorited(article_id=article.id, user_id=user_id):
-            return
+        await self._aconn.commit()
+
+        return article
+
+    @read_write
+    async def unfavorite_article_by_slug(self, slug: str, user_id: str) -> Article:
+        if self._favorites_buffer:
+            return await self._buffer_favorite(
+                slug=slug, user_id=user_id, favorited=False
+            )
 
         async with self._aconn.cursor() as acur:
+            # As in favorite_article_by_slug, the count read is from before the
+            # favorite is deleted, and it is subtracted if it was.
             unfavorite_article_query = f"""
-                UPDATE {self._favorites_table}
-                SET deleted_at = current_timestamp
-                WHERE article_id = %s
-                AND user_id = %s;
+                WITH a AS (
+                    SELECT id, author_id, title, description, body, tags, created_at, updated_at,
+                        favorites_count
+                    FROM {self._articles_table}
+                    WHERE slug = %(slug)s
+                    AND deleted_at IS NULL
+                ), f AS (
+                    UPDATE {self._favorites_table}
+                    SET deleted_at = current_timestamp
+                    WHERE article_id = (SELECT id FROM a)
+                    AND user_id = %(user_id)s
+                    AND deleted_at IS NULL
+                    RETURNING article_id
+                ), counts AS (
+                    {self._update_favorites_count_query(slug=slug, favorites_delta=-1, changed_cte="f")}
+                )
+                SELECT id, author_id, title, description, body, tags, created_at, updated_at,
+                    {self._favorites_count_column()} - (SELECT COUNT(*) FROM f)
+                FROM a;
             """
 
             try:
-                await acur.execute(unfavorite_article_query, (article.id, user_id))
+                await acur.execute(
+                    unfavorite_article_query,
+                    {
+                        "slug": slug,
+                        "user_id": user_id,
+                        "shard": random.randrange(self._favorites_count_shards),
+                        **self._trending_params(),
+                    },
+                )
             except Exception as e:
                 await self._aconn.rollback()
                 raise e
 
+            record = await acur.fetchone()
+
+            if not record:
+                await self._aconn.rollback()
+                raise NotFoundException(f"slug {slug} not found")
+
+            article = self._favorited_article_from_record(slug=slug, record=record)
+
         await self._aconn.commit()
 
+        return article
+
+    @read_only
     async def is_favorited(self, article_id: str, user_id: str) -> bool:
+        buffered_favorited = self._get_buffered_favorited(
+            article_id=article_id, user_id=user_id
+        )
+
+        if buffered_favorited is not None:
+            return buffered_favorited
+
         async with self._aconn.cursor() as acur:
             is_following_query = f"""
                 SELECT EXISTS(
@@ -413,9 +827,136 @@ class ArticlesService:
 
             return record[0]
 
+    @read_write
+    async def get_new_article_for_followers(
+        self, article_id: str, follower_ids: List[str]
+    ) -> Optional[Tuple[Article, Profile, List[str]]]:
+        """Gets a new article, without its body, with its author profile and which
+        of follower_ids follow the author, or None if it was deleted.
+
+        It reads from the primary, as it is called as soon as the article is
+        committed, before the replicas may have replayed it.
+        """
+        get_new_article_query = f"""
+            SELECT a.id, a.author_id, a.slug, a.title, a.description, a.tags,
+                a.created_at, a.updated_at, {self._favorites_count_column()},
+                u.username, u.bio, u.image,
+                ARRAY(
+                    SELECT fo.follower_id FROM {self._follows_table} fo
+                    WHERE fo.followed_id = a.author_id
+                    AND fo.follower_id = ANY(%(follower_ids)s::uuid[])
+                    AND fo.deleted_at IS NULL
+                )
+            FROM {self._articles_table} a
+            JOIN {self._users_table} u ON u.id = a.author_id
+            WHERE a.id = %(article_id)s
+            AND a.deleted_at IS NULL;
+        """
+
+        async with self._aconn.cursor() as acur:
+            await acur.execute(
+                get_new_article_query,
+                {"article_id": article_id, "follower_ids": follower_ids},
+            )
+
+            record = await acur.fetchone()
+
+        if not record:
+            return None
+
+        article = Article(
+            id=record[0],
+            author_id=record[1],
+            slug=record[2],
+            title=record[3],
+            description=record[4],
+            body=None,
+            tags=record[5],
+            created_at=record[6],
+            updated_at=record[7],
+            favorites_count=record[8],
+        )
+
+        author_profile = Profile(
+            user_id=record[1],
+            username=record[9],
+            bio=record[10],
+            image=record[11],
+            following=True,
+        )
+
+        return article, author_profile, [str(follower_id) for follower_id in record[12]]
+
+    @read_only
+    async def get_articles_status_by_slugs(
+        self, slugs: List[str], user_id: Optional[str] = None
+    ) -> List[ArticleStatus]:
+        """Gets the counts of the articles with the given slugs, whether user_id
+        favorited them and follows their authors, in a single query.
+
+        The statuses are in the order of the slugs. Unknown slugs are skipped.
+        """
+        get_articles_status_query = f"""
+            SELECT a.id, a.slug,
+                EXISTS(
+                    SELECT 1 FROM {self._favorites_table} f
+                    WHERE f.article_id = a.id
+                    AND f.user_id = %(user_id)s
+                    AND f.deleted_at IS NULL
+                ),
+                {self._favorites_count_column()}, a.comments_count, u.username,
+                {self._is_following_subquery(followed_id_column="a.author_id", follower_id_param="user_id")}
+            FROM (
+                SELECT slug, MIN(position) AS position
+                FROM unnest(%(slugs)s::text[]) WITH ORDINALITY s(slug, position)
+                GROUP BY slug
+            ) s
+            JOIN {self._articles_table} a ON a.slug = s.slug
+            JOIN {self._users_table} u ON u.id = a.author_id
+            WHERE a.deleted_at IS NULL
+            ORDER BY s.position;
+        """
+
+        async with self._aconn.cursor() as acur:
+            try:
+                await acur.execute(
+                    get_articles_status_query, {"slugs": slugs, "user_id": user_id}
+                )
+            except Exception as e:
+                await self._aconn.rollback()
+                raise e
+
+            records = await acur.fetchall()
+
+        articles_status = []
+
+        for record in records:
+            buffered_favorited = self._get_buffered_favorited(
+                article_id=record[0], user_id=user_id
+            )
+
+            articles_status.append(
+                ArticleStatus(
+                    slug=record[1],
+                    favorited=record[2]
+                    if buffered_favorited is None
+                    else buffered_favorited,
+                    favorites_count=record[3],
+                    comments_count=record[4],
+                    author_username=record[5],
+                    following=record[6],
+                )
+            )
+
+        return articles_status
+
+    @read_write
     async def add_comment_to_article_by_slug(
         self, slug: str, author_id: str, body: str
     ) -> Comment:
+        """Adds a comment to the article, notifying comments_changed_channel of its
+        id and article_id when it commits.
+        """
         article = await self.get_article_by_slug(slug=slug)
 
         if not article:
@@ -423,14 +964,28 @@ class ArticlesService:
 
         async with self._aconn.cursor() as acur:
             add_comment_to_article_query = f"""
-                INSERT INTO {self._comments_table} (article_id, author_id, body)
-                VALUES (%s, %s, %s)
-                RETURNING id, created_at, updated_at;
+                WITH c AS (
+                    INSERT INTO {self._comments_table} (article_id, author_id, body)
+                    VALUES (%(article_id)s, %(author_id)s, %(body)s)
+                    RETURNING id, article_id, created_at, updated_at
+                ), counts AS (
+                    {self._update_counts_query(comments_delta=1, changed_cte="c")}
+                )
+                SELECT id, created_at, updated_at,
+                    {self._notify_comment_changed_expression(deleted=False)}
+                FROM c;
             """
 
             try:
                 await acur.execute(
-                    add_comment_to_article_query, (article.id, author_id, body)
+                    add_comment_to_article_query,
+                    {
+                        "article_id": article.id,
+                        "author_id": author_id,
+                        "body": body,
+                        "comments_changed_channel": self.comments_changed_channel,
+                        **self._trending_params(),
+                    },
                 )
             except Exception as e:
                 await self._aconn.rollback()
@@ -451,6 +1006,7 @@ class ArticlesService:
 
         return comment
 
+    @read_only
     async def get_comment_by_id(self, comment_id: str) -> Optional[Comment]:
         async with self._aconn.cursor() as acur:
             get_article_comments_by_slug = f"""
@@ -480,23 +1036,126 @@ class ArticlesService:
                 updated_at=record[4],
             )
 
-    async def list_article_comments_by_slug(self, slug: str) -> List[Comment]:
+    @read_write
+    async def get_new_comment_by_id(
+        self, comment_id: str
+    ) -> Optional[Tuple[Comment, Profile]]:
+        """Gets a new comment with its author profile, as seen by anonymous
+        readers, or None if it was deleted.
+
+        It reads from the primary, as it is called as soon as the comment is
+        committed, before the replicas may have replayed it.
+        """
+        get_new_comment_query = f"""
+            SELECT c.article_id, c.author_id, c.body, c.created_at, c.updated_at,
+                u.username, u.bio, u.image
+            FROM {self._comments_table} c
+            JOIN {self._users_table} u ON u.id = c.author_id
+            WHERE c.id = %(comment_id)s
+            AND c.deleted_at IS NULL;
+        """
+
+        async with self._aconn.cursor() as acur:
+            await acur.execute(get_new_comment_query, {"comment_id": comment_id})
+
+            record = await acur.fetchone()
+
+        if not record:
+            return None
+
+        comment = Comment(
+            id=comment_id,
+            article_id=record[0],
+            author_id=record[1],
+            body=record[2],
+            created_at=record[3],
+            updated_at=record[4],
+        )
+
+        author_profile = Profile(
+            user_id=record[1],
+            username=record[5],
+            bio=record[6],
+            image=record[7],
+            following=False,
+        )
+
+        return comment, author_profile
+
+    @read_only
+    async def list_article_comments_by_slug(
+        self,
+        slug: str,
+        follower_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Tuple[Comment, Profile]], Optional[str]]:
+        """Lists a page of the article's comments, newest first, with their author
+        profiles as seen by follower_id.
+
+        Returns the comments and the cursor to pass to get the next page, which is
+        None on the last page. Comments by the same author share its Profile.
+        """
+        if limit is None:
+            limit = 20
+
+        if not 0 < limit <= self._comments_max_limit:
+            raise ValueError(
+                f"limit must be greater than 0 and at most {self._comments_max_limit}"
+            )
+
+        if offset is not None and cursor:
+            raise ValueError("offset cannot be used with cursor")
+
+        if offset is None:
+            offset = 0
+
+        if offset < 0:
+            raise ValueError("offset must be greater than or equal to 0")
+
         article = await self.get_article_by_slug(slug=slug)
 
         if not article:
             raise NotFoundException(f"slug {slug} not found")
 
-        async with self._aconn.cursor() as acur:
-            get_article_comments_by_slug = f"""
-                SELECT id, author_id, body, created_at, updated_at
-                FROM {self._comments_table}
-                WHERE article_id = %s
-                AND deleted_at IS NULL
-                ORDER BY created_at DESC;
+        list_article_comments_query = f"""
+            SELECT c.id, c.author_id, c.body, c.created_at, c.updated_at,
+                u.username, u.bio, u.image,
+                {self._is_following_subquery(followed_id_column="c.author_id", follower_id_param="follower_id")}
+            FROM {self._comments_table} c
+            JOIN {self._users_table} u ON u.id = c.author_id
+            WHERE c.article_id = %(article_id)s
+            AND c.deleted_at IS NULL
+        """
+
+        query_params = {
+            "article_id": article.id,
+            "follower_id": follower_id,
+            "limit": limit + 1,
+            "offset": offset,
+        }
+
+        if cursor:
+            cursor_created_at, cursor_id = self._decode_comments_cursor(cursor=cursor)
+
+            list_article_comments_query = f"""
+                {list_article_comments_query}
+                AND (c.created_at, c.id) < (%(cursor_created_at)s, %(cursor_id)s)
             """
+            query_params["cursor_created_at"] = cursor_created_at
+            query_params["cursor_id"] = cursor_id
+
+        list_article_comments_query = f"""
+            {list_article_comments_query}
+            ORDER BY c.created_at DESC, c.id DESC
+            LIMIT %(limit)s
+            OFFSET %(offset)s;
+        """
 
+        async with self._aconn.cursor() as acur:
             try:
-                await acur.execute(get_article_comments_by_slug, (article.id,))
+                await acur.execute(list_article_comments_query, query_params)
             except Exception as e:
                 await self._aconn.rollback()
                 raise e
@@ -504,8 +1163,9 @@ class ArticlesService:
             records = await acur.fetchall()
 
             comments = []
+            author_profiles = {}
 
-            for record in records:
+            for record in records[:limit]:
                 comment = Comment(
                     id=record[0],
                     article_id=article.id,
@@ -514,11 +1174,77 @@ class ArticlesService:
                     created_at=record[3],
                     updated_at=record[4],
                 )
-                comments.append(comment)
 
-            return comments
+                if comment.author_id not in author_profiles:
+                    author_profiles[comment.author_id] = Profile(
+                        user_id=record[1],
+                        username=record[5],
+                        bio=record[6],
+                        image=record[7],
+                        following=record[8],
+                    )
+
+                comments.append((comment, author_profiles[comment.author_id]))
+
+            if len(records) > limit and comments:
+                last_comment, _ = comments[-1]
+                next_cursor = self._encode_comments_cursor(comment=last_comment)
+            else:
+                next_cursor = None
+
+            return comments, next_cursor
+
+    async def stream_article_comments(
+        self, article_id: str, follower_id: Optional[str] = None
+    ) -> AsyncIterator[Tuple[Comment, Profile]]:
+        """Yields every comment of the article with its author profile, fetching
+        them in batches from a server-side cursor.
+        """
+        stream_article_comments_query = f"""
+            SELECT c.id, c.author_id, c.body, c.created_at, c.updated_at,
+                u.username, u.bio, u.image,
+                {self._is_following_subquery(followed_id_column="c.author_id", follower_id_param="follower_id")}
+            FROM {self._comments_table} c
+            JOIN {self._users_table} u ON u.id = c.author_id
+            WHERE c.article_id = %(article_id)s
+            AND c.deleted_at IS NULL
+            ORDER BY c.created_at DESC, c.id DESC;
+        """
+
+        async with self._aconn.dedicated_connection(read_only=True) as aconn:
+            async with aconn.cursor(name="stream_article_comments") as acur:
+                acur.itersize = self._stream_batch_size
+
+                await acur.execute(
+                    stream_article_comments_query,
+                    {"article_id": article_id, "follower_id": follower_id},
+                )
+
+                async for record in acur:
+                    comment = Comment(
+                        id=record[0],
+                        article_id=article_id,
+                        author_id=record[1],
+                        body=record[2],
+                        created_at=record[3],
+                        updated_at=record[4],
+                    )
 
+                    author_profile = Profile(
+                        user_id=record[1],
+                        username=record[5],
+                        bio=record[6],
+                        image=record[7],
+                        following=record[8],
+                    )
+
+                    yield comment, author_profile
+
+    @read_write
     async def delete_comment_from_article_by_slug(self, slug: str, comment_id: str):
+        """Deletes the comment from the article, notifying comments_changed_channel
+        of its id and article_id when it commits.
+        """
         article = await self.get_article_by_slug(slug=slug)
 
         if not article:
@@ -526,19 +1252,150 @@ class ArticlesService:
 
         async with self._aconn.cursor() as acur:
             delete_comment_from_article_query = f"""
-                UPDATE {self._comments_table}
-                SET deleted_at = current_timestamp
-                WHERE id = %s
-                AND article_id = %s;
+                WITH c AS (
+                    UPDATE {self._comments_table}
+                    SET deleted_at = current_timestamp
+                    WHERE id = %(comment_id)s
+                    AND article_id = %(article_id)s
+                    AND deleted_at IS NULL
+                    RETURNING id, article_id
+                ), counts AS (
+                    {self._update_counts_query(comments_delta=-1, changed_cte="c")}
+                )
+                SELECT {self._notify_comment_changed_expression(deleted=True)}
+                FROM c;
             """
 
             try:
                 await acur.execute(
                     delete_comment_from_article_query,
+                    {
+                        "comment_id": comment_id,
+                        "article_id": article.id,
+                        "comments_changed_channel": self.comments_changed_channel,
+                        **self._trending_params(),
+                    },
+                )
+            except Exception as e:
+                await self._aconn.rollback()
+                raise e
+
+        await self._aconn.commit()
+
+    @read_write
+    async def rescore_trending_articles(self):
+        """Recomputes the trending score of the articles younger than the trending
+        max age, which decays with time, and zeroes those of older articles.
+
+        Articles are updated in batches, each committed on its own, so that the
+        rescoring does not hold locks on all of them at once.
+        """
+        last_id = None
+
+        while True:
+            rescore_articles_query = f"""
+                WITH batch AS (
+                    SELECT id
+                    FROM {self._articles_table}
+                    WHERE deleted_at IS NULL
+                    AND created_at > current_timestamp - %(trending_max_age)s
+                    AND (%(last_id)s::uuid IS NULL OR id > %(last_id)s::uuid)
+                    ORDER BY id
+                    LIMIT %(batch_size)s
+                )
+                UPDATE {self._articles_table} a
+                SET trending_score = {self._trending_score_expression(favorites_count="a.favorites_count", comments_count="a.comments_count")}
+                FROM batch
+                WHERE a.id = batch.id
+                RETURNING a.id;
+            """
+
+            async with self._aconn.cursor() as acur:
+                try:
+                    await acur.execute(
+                        rescore_articles_query,
+                        {
+                            "trending_max_age": self._trending_max_age,
+                            "last_id": last_id,
+                            "batch_size": self._rescore_batch_size,
+                            **self._trending_params(),
+                        },
+                    )
+                except Exception as e:
+                    await self._aconn.rollback()
+                    raise e
+
+                records = await acur.fetchall()
+
+            await self._aconn.commit()
+
+            if len(records) < self._rescore_batch_size:
+                break
+
+            last_id = max(record[0] for record in records)
+
+        async with self._aconn.cursor() as acur:
+            zero_old_articles_scores_query = f"""
+                UPDATE {self._articles_table}
+                SET trending_score = 0
+                WHERE created_at <= current_timestamp - %s
+                AND trending_score <> 0;
+            """
+
+            try:
+                await acur.execute(
+                    zero_old_articles_scores_query, (self._trending_max_age,)
+                )
+            except Exception as e:
+                await self._aconn.rollback()
+                raise e
+
+        await self._aconn.commit()
+
+    @read_write
+    async def recount_articles(self, article_ids: List[str]):
+        """Recomputes the counts and trending score of the articles from their
+        favorites and comments, and drops their favorites count shards, for when
+        those were written or deleted without going through this service.
+        """
+        recount_articles_query = f"""
+            WITH counts AS (
+                SELECT a.id,
                     (
-                        comment_id,
-                        article.id,
-                    ),
+                        SELECT COUNT(*) FROM {self._favorites_table} f
+                        WHERE f.article_id = a.id AND f.deleted_at IS NULL
+                    ) AS favorites_count,
+                    (
+                        SELECT COUNT(*) FROM {self._comments_table} c
+                        WHERE c.article_id = a.id AND c.deleted_at IS NULL
+                    ) AS comments_count
+                FROM {self._articles_table} a
+                WHERE a.id = ANY(%(article_ids)s::uuid[])
+            ), shards AS (
+                DELETE FROM {self._favorites_count_shards_table}
+                WHERE article_id = ANY(%(article_ids)s::uuid[])
+            )
+            UPDATE {self._articles_table} a
+            SET favorites_count = counts.favorites_count,
+                comments_count = counts.comments_count,
+                trending_score = CASE
+                    WHEN a.created_at > current_timestamp - %(trending_max_age)s
+                    THEN {self._trending_score_expression(favorites_count="counts.favorites_count", comments_count="counts.comments_count")}
+                    ELSE 0
+                END
+            FROM counts
+            WHERE a.id = counts.id;
+        """
+
+        async with self._aconn.cursor() as acur:
+            try:
+                await acur.execute(
+                    recount_articles_query,
+                    {
+                        "article_ids": article_ids,
+                        "trending_max_age": self._trending_max_age,
+                        **self._trending_params(),
+                    },
                 )
             except Exception as e:
                 await self._aconn.rollback()
@@ -546,19 +1403,388 @@ class ArticlesService:
 
         await self._aconn.commit()
 
-    async def _get_favorites_count(self, acur: psycopg.AsyncCursor, article_id) -> int:
-        get_favorites_count_query = f"""
-            SELECT COUNT(*)
-            FROM {self._favorites_table}
-            WHERE article_id = %s
-            AND deleted_at IS NULL;
+    async def rescore_trending_articles_periodically(self, interval_seconds: float):
+        while True:
+            await asyncio.sleep(interval_seconds)
+
+            try:
+                await self.rescore_trending_articles()
+            except psycopg.Error as e:
+                logger.warning("could not rescore the trending articles: %s", e)
+
+    @read_write
+    async def flush_favorites(self):
+        """Writes the buffered favorite changes, and the resulting counts, in a
+        single statement.
+
+        Changes that cannot be written are put back in the buffer to be retried on
+        the next flush.
+        """
+        if not self._favorites_buffer:
+            return
+
+        async with self._favorites_flush_lock:
+            changes = self._favorites_buffer.drain()
+
+            if not changes:
+                self._favorites_buffer.done()
+                return
+
+            keys = sorted(changes)
+
+            # The articles are locked in id order, so flushes from other workers
+            # touching the same articles wait for each other instead of deadlocking.
+            flush_favorites_query = f"""
+                WITH changes AS (
+                    SELECT *
+                    FROM unnest(%(article_ids)s::uuid[], %(user_ids)s::uuid[], %(favorited)s::boolean[])
+                        AS c(article_id, user_id, favorited)
+                ), favorited AS (
+                    INSERT INTO {self._favorites_table} (article_id, user_id)
+                    SELECT article_id, user_id FROM changes
+                    WHERE favorited
+                    ON CONFLICT(article_id, user_id) WHERE deleted_at IS NOT NULL
+                    DO UPDATE SET deleted_at = NULL
+                    WHERE {self._favorites_table}.deleted_at IS NOT NULL
+                    RETURNING article_id
+                ), unfavorited AS (
+                    UPDATE {self._favorites_table} f
+                    SET deleted_at = current_timestamp
+                    FROM changes c
+                    WHERE NOT c.favorited
+                    AND f.article_id = c.article_id
+                    AND f.user_id = c.user_id
+                    AND f.deleted_at IS NULL
+                    RETURNING f.article_id
+                ), deltas AS (
+                    SELECT article_id, SUM(delta) AS delta
+                    FROM (
+                        SELECT article_id, 1 AS delta FROM favorited
+                        UNION ALL
+                        SELECT article_id, -1 AS delta FROM unfavorited
+                    ) d
+                    GROUP BY article_id
+                ), locked AS (
+                    SELECT id FROM {self._articles_table}
+                    WHERE id IN (SELECT article_id FROM deltas)
+                    ORDER BY id
+                    FOR UPDATE
+                )
+                UPDATE {self._articles_table} a
+                SET favorites_count = a.favorites_count + d.delta,
+                    trending_score = {self._trending_score_expression(favorites_count="a.favorites_count + d.delta", comments_count="a.comments_count")}
+                FROM deltas d
+                WHERE a.id = d.article_id
+                AND a.id IN (SELECT id FROM locked);
+            """
+
+            async with self._aconn.cursor() as acur:
+                try:
+                    await acur.execute(
+                        flush_favorites_query,
+                        {
+                            "article_ids": [article_id for article_id, _ in keys],
+                            "user_ids": [user_id for _, user_id in keys],
+                            "favorited": [changes[key] for key in keys],
+                            **self._trending_params(),
+                        },
+                    )
+
+                    await self._aconn.commit()
+                except Exception as e:
+                    await self._aconn.rollback()
+                    self._favorites_buffer.restore()
+                    raise e
+
+            self._favorites_buffer.done()
+
+    async def flush_favorites_periodically(self, interval_seconds: float):
+        """Flushes the buffered favorite changes every interval_seconds, or as soon
+        as the buffer is full.
+        """
+        while True:
+            await self._favorites_buffer.wait_until_full(timeout=interval_seconds)
+
+            try:
+                # Shielded, so that cancelling on shutdown lets the flush finish
+                # before the final one.
+                await asyncio.shield(self.flush_favorites())
+            except psycopg.Error as e:
+                logger.warning("could not flush the favorites: %s", e)
+
+    @read_write
+    async def roll_up_favorites_count_shards(self):
+        """Adds the favorites count shards to the articles' favorites_count, and
+        updates their trending_score, deleting the shards.
+
+        Only one worker rolls them up at a time. The others skip it.
         """
+        async with self._aconn.cursor() as acur:
+            lock_query = "SELECT pg_try_advisory_xact_lock(%s);"
+
+            roll_up_query = f"""
+                WITH shards AS (
+                    DELETE FROM {self._favorites_count_shards_table}
+                    RETURNING article_id, delta
+                ), deltas AS (
+                    SELECT article_id, SUM(delta) AS delta
+                    FROM shards
+                    GROUP BY article_id
+                )
+                UPDATE {self._articles_table} a
+                SET favorites_count = a.favorites_count + d.delta,
+                    trending_score = {self._trending_score_expression(favorites_count="a.favorites_count + d.delta", comments_count="a.comments_count")}
+                FROM deltas d
+                WHERE a.id = d.article_id;
+            """
+
+            try:
+                await acur.execute(lock_query, (self._favorites_count_rollup_lock_key,))
+
+                record = await acur.fetchone()
 
-        await acur.execute(get_favorites_count_query, (article_id,))
+                if record[0]:
+                    await acur.execute(roll_up_query, self._trending_params())
+            except Exception as e:
+                await self._aconn.rollback()
+                raise e
+
+        await self._aconn.commit()
+
+    async def roll_up_favorites_count_shards_periodically(
+        self, interval_seconds: float
+    ):
+        while True:
+            await asyncio.sleep(interval_seconds)
+
+            try:
+                await self.roll_up_favorites_count_shards()
+            except psycopg.Error as e:
+                logger.warning("could not roll up the favorites count shards: %s", e)
+
+    async def _buffer_favorite(
+        self, slug: str, user_id: str, favorited: bool
+    ) -> Article:
+        async with self._aconn.cursor() as acur:
+            get_article_by_slug_query = f"""
+                SELECT id, author_id, title, description, body, tags, created_at, updated_at,
+                    {self._favorites_count_column()},
+                    EXISTS(
+                        SELECT 1 FROM {self._favorites_table} f
+                        WHERE f.article_id = a.id
+                        AND f.user_id = %(user_id)s
+                        AND f.deleted_at IS NULL
+                    )
+                FROM {self._articles_table} a
+                WHERE slug = %(slug)s
+                AND deleted_at IS NULL;
+            """
+
+            await acur.execute(
+                get_article_by_slug_query, {"slug": slug, "user_id": user_id}
+            )
+
+            record = await acur.fetchone()
+
+        if not record:
+            raise NotFoundException(f"slug {slug} not found")
+
+        self._favorites_buffer.set(
+            article_id=record[0], user_id=user_id, favorited=favorited
+        )
+
+        # The count is as written, with the user's favorite as buffered.
+        favorites_count = record[8] - record[9] + favorited
+
+        return self._favorited_article_from_record(
+            slug=slug, record=(*record[:8], favorites_count)
+        )
 
-        record = await acur.fetchone()
+    def _get_buffered_favorited(
+        self, article_id: str, user_id: Optional[str]
+    ) -> Optional[bool]:
+        if not self._favorites_buffer or not user_id:
+            return None
+
+        return self._favorites_buffer.get(article_id=article_id, user_id=user_id)
+
+    @staticmethod
+    def _body_column(include_body: bool, table_alias: Optional[str] = None) -> str:
+        if not include_body:
+            return "NULL"
 
-        return record[0]
+        return f"{table_alias}.body" if table_alias else "body"
+
+    def _trending_score_expression(
+        self, favorites_count: str, comments_count: str
+    ) -> str:
+        """The article's activity, divided by its age in hours to the power of
+        the gravity, as in Hacker News' ranking.
+        """
+        return f"""
+            (({favorites_count}) + %(trending_comment_weight)s * ({comments_count}))
+            / POWER(
+                EXTRACT(EPOCH FROM current_timestamp - a.created_at) / 3600 + 2,
+                %(trending_gravity)s
+            )
+        """
+
+    def _trending_params(self) -> dict:
+        return {
+            "trending_gravity": self._trending_gravity,
+            "trending_comment_weight": self._trending_comment_weight,
+        }
+
+    def _update_counts_query(
+        self, changed_cte: str, favorites_delta: int = 0, comments_delta: int = 0
+    ) -> str:
+        """Updates the counts and trending score of the article in changed_cte's
+        article_id, if it returned a row, in the same statement as the change.
+        """
+        favorites_count = f"a.favorites_count + {favorites_delta}"
+        comments_count = f"a.comments_count + {comments_delta}"
+
+        return f"""
+            UPDATE {self._articles_table} a
+            SET favorites_count = {favorites_count},
+                comments_count = {comments_count},
+                trending_score = {self._trending_score_expression(favorites_count=favorites_count, comments_count=comments_count)}
+            WHERE a.id IN (SELECT article_id FROM {changed_cte})
+        """
+
+    def _notify_comment_changed_expression(self, deleted: bool) -> str:
+        """Notifies comments_changed_channel of the id and article_id of the comment
+        in the c CTE, so that it is only sent if the comment changed.
+        """
+        return f"""
+            pg_notify(
+                %(comments_changed_channel)s,
+                json_build_object(
+                    'id', id, 'article_id', article_id, 'deleted', {str(deleted).lower()}
+                )::text
+            )
+        """
+
+    def _update_favorites_count_query(
+        self, slug: str, changed_cte: str, favorites_delta: int
+    ) -> str:
+        """Updates the favorites count of the article in changed_cte like
+        _update_counts_query or, if the article is hot, adds favorites_delta to
+        one of its favorites count shards, picked at random by the caller, so
+        that concurrent favorites of the article do not wait on its row lock.
+        """
+        if not self._hot_articles or not self._hot_articles.record(slug=slug):
+            return self._update_counts_query(
+                changed_cte=changed_cte, favorites_delta=favorites_delta
+            )
+
+        return f"""
+            INSERT INTO {self._favorites_count_shards_table} AS s (article_id, shard, delta)
+            SELECT article_id, %(shard)s, {favorites_delta} FROM {changed_cte}
+            ON CONFLICT(article_id, shard)
+            DO UPDATE SET delta = s.delta + EXCLUDED.delta
+        """
+
+    def _favorites_count_column(self, table_alias: str = "a") -> str:
+        """The article's favorites_count plus its shards not rolled up yet."""
+        return f"""
+            ({table_alias}.favorites_count + COALESCE((
+                SELECT SUM(s.delta)
+                FROM {self._favorites_count_shards_table} s
+                WHERE s.article_id = {table_alias}.id
+            ), 0))
+        """
+
+    def _filter_articles_query(
+        self,
+        tag: Optional[str] = None,
+        author_id: Optional[str] = None,
+        articles_favorited_by_user_id: Optional[str] = None,
+    ) -> Tuple[str, dict]:
+        filter_articles_query = ""
+
+        query_params = {}
+
+        if tag:
+            filter_articles_query = (
+                f"{filter_articles_query} AND %(tag)s = ANY (a.tags)"
+            )
+            query_params["tag"] = tag
+
+        if author_id:
+            filter_articles_query = (
+                f"{filter_articles_query} AND a.author_id = %(author_id)s"
+            )
+            query_params["author_id"] = author_id
+
+        if articles_favorited_by_user_id:
+            filter_articles_query = f"""
+                {filter_articles_query}
+                AND EXISTS (
+                    SELECT 1 FROM {self._favorites_table} f
+                    WHERE f.article_id = a.id
+                    AND f.user_id = %(articles_favorited_by_user_id)s
+                    AND f.deleted_at IS NULL
+                )
+            """
+            query_params[
+                "articles_favorited_by_user_id"
+            ] = articles_favorited_by_user_id
+
+        return filter_articles_query, query_params
+
+    def _is_following_subquery(
+        self, followed_id_column: str, follower_id_param: str
+    ) -> str:
+        return f"""
+            EXISTS(
+                SELECT 1 FROM {self._follows_table} fo
+                WHERE fo.follower_id = %({follower_id_param})s
+                AND fo.followed_id = {followed_id_column}
+                AND fo.deleted_at IS NULL
+            )
+        """
+
+    @staticmethod
+    def _favorited_article_from_record(slug: str, record: tuple) -> Article:
+        return Article(
+            id=record[0],
+            author_id=record[1],
+            slug=slug,
+            title=record[2],
+            description=record[3],
+            body=record[4],
+            tags=record[5],
+            created_at=record[6],
+            updated_at=record[7],
+            favorites_count=record[8],
+        )
+
+    @staticmethod
+    def _encode_comments_cursor(comment: Comment) -> str:
+        cursor = json.dumps([comment.created_at.isoformat(), str(comment.id)])
+        return base64.urlsafe_b64encode(cursor.encode()).decode()
+
+    @staticmethod
+    def _decode_comments_cursor(cursor: str) -> Tuple[datetime.datetime, uuid.UUID]:
+        try:
+            created_at, comment_id = json.loads(base64.urlsafe_b64decode(cursor))
+            return datetime.datetime.fromisoformat(created_at), uuid.UUID(comment_id)
+        except (binascii.Error, TypeError, ValueError):
+            raise ValueError(f"invalid cursor {cursor}")
+
+    @staticmethod
+    def _encode_search_cursor(rank: float, article_id: uuid.UUID) -> str:
+        cursor = json.dumps([rank, str(article_id)])
+        return base64.urlsafe_b64encode(cursor.encode()).decode()
+
+    @staticmethod
+    def _decode_search_cursor(cursor: str) -> Tuple[float, uuid.UUID]:
+        try:
+            rank, article_id = json.loads(base64.urlsafe_b64decode(cursor))
+            return float(rank), uuid.UUID(article_id)
+        except (binascii.Error, TypeError, ValueError):
+            raise ValueError(f"invalid cursor {cursor}")
 
     @staticmethod
     def _slugify(string: str) -> str:
@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass
+class ArticlesStatusRequest:
+    slugs: List[str]
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass
+class ArticlesStatusResponseAuthorProfile:
+    username: str
+    following: bool
+
+
+@dataclass
+class ArticlesStatusResponseArticle:
+    slug: str
+    favorited: bool
+    favorites_count: int
+    comments_count: int
+    author: ArticlesStatusResponseAuthorProfile
+
+
+@dataclass
+class ArticlesStatusResponse:
+    articles: List[ArticlesStatusResponseArticle]
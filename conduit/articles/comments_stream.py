@@ -0,0 +1,81 @@
+import contextlib
+import dataclasses
+import json
+from typing import Iterator
+
+from quart import current_app
+
+from .articles_service import ArticlesService
+from .multiple_comments_response import (
+    MultipleCommentsResponseAuthorProfile,
+    MultipleCommentsResponseComment,
+)
+from ..subscriptions import Event, Subscription, Subscriptions
+
+
+class CommentsStream:
+    """Pushes the comments added to and deleted from each subscribed article, as
+    they are committed in any worker.
+
+    Each worker is notified of every comment change, and only looks up an added
+    comment if it has subscribers to its article, once for all of them. Deleted
+    comments are pushed as their id alone, without a query.
+    """
+
+    def __init__(self, articles_service: ArticlesService, subscriptions: Subscriptions):
+        self._articles_service = articles_service
+        self._subscriptions = subscriptions
+
+    @property
+    def channel(self) -> str:
+        return self._articles_service.comments_changed_channel
+
+    @contextlib.contextmanager
+    def subscribe(self, article_id: str) -> Iterator[Subscription]:
+        with self._subscriptions.subscribe(key=article_id) as subscription:
+            yield subscription
+
+    async def handle_notification(self, payload: str):
+        notification = json.loads(payload)
+
+        article_id = notification["article_id"]
+
+        if not self._subscriptions.has_subscriptions(key=article_id):
+            return
+
+        if notification["deleted"]:
+            event = Event(
+                name="deletedComment",
+                data=current_app.json.dumps({"id": notification["id"]}),
+            )
+        else:
+            new_comment = await self._articles_service.get_new_comment_by_id(
+                comment_id=notification["id"]
+            )
+
+            if not new_comment:
+                return
+
+            comment, author_profile = new_comment
+
+            comment_response_comment = MultipleCommentsResponseComment(
+                id=str(comment.id),
+                body=comment.body,
+                created_at=comment.created_at,
+                updated_at=comment.updated_at,
+                author=MultipleCommentsResponseAuthorProfile(
+                    username=author_profile.username,
+                    bio=author_profile.bio,
+                    image=author_profile.image,
+                    following=author_profile.following,
+                ),
+            )
+
+            event = Event(
+                name="comment",
+                data=current_app.json.dumps(
+                    dataclasses.asdict(comment_response_comment)
+                ),
+            )
+
+        self._subscriptions.publish(key=article_id, event=event)
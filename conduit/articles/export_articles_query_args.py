@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class ExportArticlesQueryArgs:
+    tag: Optional[str] = None
+    author: Optional[str] = None
+    favorited: Optional[str] = None
@@ -0,0 +1,66 @@
+import asyncio
+from typing import Dict, Optional, Tuple
+
+FavoriteKey = Tuple[str, str]
+
+
+class FavoritesBuffer:
+    """Favorite and unfavorite changes waiting to be written, keyed by
+    (article_id, user_id).
+
+    Only the last change of each user to each article is kept, so a burst of
+    toggles is written as a single row. Changes being written stay readable until
+    the write is done, so readers see the buffered state throughout.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._changes: Dict[FavoriteKey, bool] = {}
+        self._flushing: Dict[FavoriteKey, bool] = {}
+        self._full = asyncio.Event()
+
+    def set(self, article_id: str, user_id: str, favorited: bool):
+        self._changes[(str(article_id), str(user_id))] = favorited
+
+        if len(self._changes) >= self.max_size:
+            self._full.set()
+
+    def get(self, article_id: str, user_id: str) -> Optional[bool]:
+        """Returns whether user_id favorited article_id, or None if there is no
+        buffered change.
+        """
+        key = (str(article_id), str(user_id))
+
+        if key in self._changes:
+            return self._changes[key]
+
+        return self._flushing.get(key)
+
+    def drain(self) -> Dict[FavoriteKey, bool]:
+        """Takes the changes to write. Call done once they are written, or restore
+        if they could not be.
+        """
+        self._flushing = self._changes
+        self._changes = {}
+        self._full.clear()
+
+        return self._flushing
+
+    def done(self):
+        self._flushing = {}
+
+    def restore(self):
+        """Puts back the changes that could not be written, unless they have been
+        superseded since.
+        """
+        self._changes = {**self._flushing, **self._changes}
+        self._flushing = {}
+
+        if len(self._changes) >= self.max_size:
+            self._full.set()
+
+    async def wait_until_full(self, timeout: float):
+        try:
+            await asyncio.wait_for(self._full.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
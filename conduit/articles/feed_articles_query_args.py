@@ -6,3 +6,4 @@ from typing import Optional
 class FeedArticlesQueryArgs:
     limit: Optional[int] = None
     offset: Optional[int] = None
+    compact: Optional[bool] = None
@@ -0,0 +1,82 @@
+import contextlib
+import dataclasses
+import json
+from typing import Iterator
+
+from quart import current_app
+
+from .articles_service import ArticlesService
+from .multiple_articles_response import (
+    MultipleArticlesResponseArticle,
+    MultipleArticlesResponseAuthorProfile,
+)
+from ..subscriptions import Event, Subscription, Subscriptions
+
+
+class FeedStream:
+    """Pushes the articles created by the authors each subscribed user follows,
+    as they are committed in any worker.
+
+    Each worker is notified of every new article, and, if it has subscribers,
+    looks up which of them follow its author in a single query. Followers are
+    looked up per article, so follows made while subscribed take effect at once.
+    """
+
+    def __init__(self, articles_service: ArticlesService, subscriptions: Subscriptions):
+        self._articles_service = articles_service
+        self._subscriptions = subscriptions
+
+    @property
+    def channel(self) -> str:
+        return self._articles_service.articles_created_channel
+
+    @contextlib.contextmanager
+    def subscribe(self, user_id: str) -> Iterator[Subscription]:
+        with self._subscriptions.subscribe(key=user_id) as subscription:
+            yield subscription
+
+    async def handle_notification(self, payload: str):
+        follower_ids = self._subscriptions.keys()
+
+        if not follower_ids:
+            return
+
+        article_id = json.loads(payload)["id"]
+
+        new_article = await self._articles_service.get_new_article_for_followers(
+            article_id=article_id, follower_ids=follower_ids
+        )
+
+        if not new_article:
+            return
+
+        article, author_profile, follower_ids = new_article
+
+        if not follower_ids:
+            return
+
+        article_response_article = MultipleArticlesResponseArticle(
+            slug=article.slug,
+            title=article.title,
+            description=article.description,
+            body=article.body,
+            tag_list=article.tags,
+            created_at=article.created_at,
+            updated_at=article.updated_at,
+            favorited=False,
+            favorites_count=article.favorites_count,
+            author=MultipleArticlesResponseAuthorProfile(
+                username=author_profile.username,
+                bio=author_profile.bio,
+                image=author_profile.image,
+                following=author_profile.following,
+            ),
+        )
+
+        event = Event(
+            name="article",
+            data=current_app.json.dumps(dataclasses.asdict(article_response_article)),
+        )
+
+        for follower_id in follower_ids:
+            self._subscriptions.publish(key=follower_id, event=event)
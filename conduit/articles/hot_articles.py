@@ -0,0 +1,46 @@
+import time
+from typing import Callable, Dict
+
+
+class HotArticles:
+    """Tracks how often each article's favorites are written, flagging the
+    articles written more than rate_threshold times in a second as hot for
+    hot_seconds.
+
+    Only the current second's counts are kept, so memory is bounded by the
+    articles written in a second plus the hot ones.
+    """
+
+    def __init__(
+        self,
+        rate_threshold: float,
+        hot_seconds: float = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate_threshold = rate_threshold
+        self.hot_seconds = hot_seconds
+        self._clock = clock
+        self._window_started_at = clock()
+        self._counts: Dict[str, int] = {}
+        self._hot_until: Dict[str, float] = {}
+
+    def record(self, slug: str) -> bool:
+        """Records a write to slug's favorites, returning whether it is hot."""
+        now = self._clock()
+
+        if now - self._window_started_at >= 1:
+            self._window_started_at = now
+            self._counts = {}
+            self._hot_until = {
+                hot_slug: hot_until
+                for hot_slug, hot_until in self._hot_until.items()
+                if hot_until > now
+            }
+
+        count = self._counts.get(slug, 0) + 1
+        self._counts[slug] = count
+
+        if count > self.rate_threshold:
+            self._hot_until[slug] = now + self.hot_seconds
+
+        return self._hot_until.get(slug, 0) > now
@@ -9,3 +9,5 @@ class ListArticlesQueryArgs:
     favorited: Optional[str] = None
     limit: Optional[int] = None
     offset: Optional[int] = None
+    sort: Optional[str] = None
+    compact: Optional[bool] = None
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class ListCommentsFromArticleQueryArgs:
+    limit: Optional[int] = None
+    offset: Optional[int] = None
+    cursor: Optional[str] = None
@@ -16,7 +16,7 @@ class MultipleArticlesResponseArticle:
     slug: str
     title: str
     description: str
-    body: str
+    body: Optional[str]
     tag_list: List[str]
     created_at: datetime.datetime
     updated_at: datetime.datetime
@@ -29,3 +29,4 @@ class MultipleArticlesResponseArticle:
 class MultipleArticlesResponse:
     articles: List[MultipleArticlesResponseArticle]
     articles_count: int
+    next_cursor: Optional[str] = None
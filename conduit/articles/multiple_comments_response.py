@@ -23,3 +23,4 @@ class MultipleCommentsResponseComment:
 @dataclass
 class MultipleCommentsResponse:
     comments: List[MultipleCommentsResponseComment]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class SearchArticlesQueryArgs:
+    q: Optional[str] = None
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
+    compact: Optional[bool] = None
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class SuggestTagsQueryArgs:
+    prefix: Optional[str] = None
+    limit: Optional[int] = None
@@ -0,0 +1,101 @@
+import heapq
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class _Node:
+    __slots__ = ("children", "count", "top")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.count = 0
+        # The node's most used tags, as (-count, tag), or None when a tag under the
+        # node changed since they were computed.
+        self.top: Optional[List[Tuple[int, str]]] = None
+
+
+class TagIndex:
+    """A trie of tags and how many articles use them, suggesting the most used
+    tags starting with a prefix.
+
+    Each node caches its max_suggestions most used tags, so suggesting takes time
+    proportional to the prefix length. Adding or removing a tag invalidates the
+    caches on its path, which are recomputed from the children's on the next
+    suggestion.
+    """
+
+    def __init__(self, max_suggestions: int):
+        self.max_suggestions = max_suggestions
+        self._root = _Node()
+
+    def replace(self, counts: Dict[str, int]):
+        """Replaces the tags with counts. The new trie and its caches are built
+        before being swapped in, so it can run in another thread while suggest is
+        called.
+        """
+        root = _Node()
+
+        for tag, count in counts.items():
+            self._update(root=root, tag=tag, delta=count)
+
+        self._get_top(node=root, prefix="")
+
+        self._root = root
+
+    def add(self, tags: Iterable[str]):
+        for tag in tags:
+            self._update(root=self._root, tag=tag, delta=1)
+
+    def remove(self, tags: Iterable[str]):
+        for tag in tags:
+            self._update(root=self._root, tag=tag, delta=-1)
+
+    def suggest(self, prefix: str, limit: int) -> List[str]:
+        node = self._root
+
+        for character in prefix:
+            node = node.children.get(character)
+
+            if not node:
+                return []
+
+        return [tag for _, tag in self._get_top(node=node, prefix=prefix)[:limit]]
+
+    def _get_top(self, node: _Node, prefix: str) -> List[Tuple[int, str]]:
+        # Computes the invalid caches bottom-up, iteratively, as tags can be
+        # longer than the recursion limit.
+        stack = [(node, prefix, False)]
+
+        while stack:
+            current, current_prefix, children_done = stack.pop()
+
+            if current.top is not None:
+                continue
+
+            if not children_done:
+                stack.append((current, current_prefix, True))
+                stack.extend(
+                    (child, current_prefix + character, False)
+                    for character, child in current.children.items()
+                    if child.top is None
+                )
+                continue
+
+            candidates = [(-current.count, current_prefix)] if current.count > 0 else []
+
+            for child in current.children.values():
+                candidates.extend(child.top)
+
+            current.top = heapq.nsmallest(self.max_suggestions, candidates)
+
+        return node.top
+
+    @staticmethod
+    def _update(root: _Node, tag: str, delta: int):
+        node = root
+        node.top = None
+
+        for character in tag:
+            node = node.children.setdefault(character, _Node())
+            node.top = None
+
+        node.count = max(node.count + delta, 0)
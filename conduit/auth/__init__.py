@@ -1,15 +1,38 @@
-from quart import current_app, Request
+import functools
+from typing import Optional
+
+import jwt
+from quart import current_app, Request, websocket
 from quart_jwt_extended import (
-    jwt_required,
-    jwt_optional,
+    decode_token,
     get_jwt_identity,
     verify_jwt_in_request,
+    verify_jwt_in_request_optional,
     create_access_token as _create_access_token,
 )
+from quart_jwt_extended.exceptions import JWTExtendedException
+from ..tracing import start_span
 from ..users import User
 
 
-verify_jwt_in_request
+def jwt_required(fn):
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        with start_span("jwt.verify"):
+            await verify_jwt_in_request()
+        return await fn(*args, **kwargs)
+
+    return wrapper
+
+
+def jwt_optional(fn):
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        with start_span("jwt.verify"):
+            await verify_jwt_in_request_optional()
+        return await fn(*args, **kwargs)
+
+    return wrapper
 
 
 def create_access_token(user: User) -> str:
@@ -20,3 +43,29 @@ def get_jwt_token(request: Request) -> str:
     header_value = request.headers.get(current_app.config["JWT_HEADER_NAME"])
     token = header_value.split(sep=current_app.config.get("JWT_HEADER_TYPE"))[1].strip()
     return token
+
+
+def get_websocket_jwt_identity() -> Optional[str]:
+    """Returns the identity of the JWT sent to the current WebSocket, or None if
+    it is missing or invalid.
+
+    Browsers cannot set headers on WebSockets, so the token can also be sent in
+    the token query argument.
+    """
+    header_value = websocket.headers.get(current_app.config["JWT_HEADER_NAME"])
+
+    if header_value:
+        token = header_value.split(sep=current_app.config["JWT_HEADER_TYPE"])[-1]
+    else:
+        token = websocket.args.get("token", "")
+
+    if not token.strip():
+        return None
+
+    with start_span("jwt.verify"):
+        try:
+            decoded_token = decode_token(token.strip())
+        except (jwt.PyJWTError, JWTExtendedException):
+            return None
+
+    return decoded_token[current_app.config["JWT_IDENTITY_CLAIM"]]
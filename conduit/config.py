@@ -4,6 +4,91 @@ import os
 
 class _Config:
     DATABASE_URI = os.environ["DATABASE_URI"]
+    DATABASE_REPLICA_URIS = [
+        uri for uri in os.environ.get("DATABASE_REPLICA_URIS", "").split(",") if uri
+    ]
+    DATABASE_REPLICA_MAX_LAG_SECONDS = float(
+        os.environ.get("DATABASE_REPLICA_MAX_LAG_SECONDS", 1)
+    )
+    DATABASE_REPLICA_LAG_CHECK_INTERVAL_SECONDS = float(
+        os.environ.get("DATABASE_REPLICA_LAG_CHECK_INTERVAL_SECONDS", 5)
+    )
+    DATABASE_READ_YOUR_WRITES_SECONDS = float(
+        os.environ.get("DATABASE_READ_YOUR_WRITES_SECONDS", 5)
+    )
+    DATABASE_MAX_DEDICATED_CONNECTIONS = int(
+        os.environ.get("DATABASE_MAX_DEDICATED_CONNECTIONS", 10)
+    )
+    DATABASE_QUERY_LOG_COUNT_THRESHOLD = int(
+        os.environ.get("DATABASE_QUERY_LOG_COUNT_THRESHOLD", 20)
+    )
+    DATABASE_QUERY_LOG_SECONDS_THRESHOLD = float(
+        os.environ.get("DATABASE_QUERY_LOG_SECONDS_THRESHOLD", 0.5)
+    )
+    DATABASE_SLOW_QUERY_SECONDS = float(
+        os.environ.get("DATABASE_SLOW_QUERY_SECONDS", 0.2)
+    )
+    DATABASE_SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS = float(
+        os.environ.get("DATABASE_SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS", 300)
+    )
+    EVENT_LOOP_LAG_CHECK_INTERVAL_SECONDS = float(
+        os.environ.get("EVENT_LOOP_LAG_CHECK_INTERVAL_SECONDS", 0.1)
+    )
+    EVENT_LOOP_BLOCKING_THRESHOLD_SECONDS = float(
+        os.environ.get("EVENT_LOOP_BLOCKING_THRESHOLD_SECONDS", 0.1)
+    )
+    METRICS_DIR = os.environ.get("METRICS_DIR")
+    TAG_INDEX_REFRESH_INTERVAL_SECONDS = float(
+        os.environ.get("TAG_INDEX_REFRESH_INTERVAL_SECONDS", 60)
+    )
+    TRENDING_RESCORE_INTERVAL_SECONDS = float(
+        os.environ.get("TRENDING_RESCORE_INTERVAL_SECONDS", 300)
+    )
+    TAG_SUGGESTIONS_MAX_LIMIT = int(os.environ.get("TAG_SUGGESTIONS_MAX_LIMIT", 20))
+    FAVORITES_WRITE_BEHIND = os.environ.get("FAVORITES_WRITE_BEHIND", "").lower() in (
+        "1",
+        "true",
+    )
+    FAVORITES_FLUSH_INTERVAL_SECONDS = float(
+        os.environ.get("FAVORITES_FLUSH_INTERVAL_SECONDS", 0.5)
+    )
+    FAVORITES_BUFFER_MAX_SIZE = int(os.environ.get("FAVORITES_BUFFER_MAX_SIZE", 10000))
+    FAVORITES_HOT_ARTICLE_RATE = float(os.environ.get("FAVORITES_HOT_ARTICLE_RATE", 20))
+    FAVORITES_COUNT_ROLLUP_INTERVAL_SECONDS = float(
+        os.environ.get("FAVORITES_COUNT_ROLLUP_INTERVAL_SECONDS", 5)
+    )
+    STREAM_QUEUE_SIZE = int(os.environ.get("STREAM_QUEUE_SIZE", 100))
+    STREAM_HEARTBEAT_SECONDS = float(os.environ.get("STREAM_HEARTBEAT_SECONDS", 15))
+    SEARCH_MAX_LIMIT = int(os.environ.get("SEARCH_MAX_LIMIT", 100))
+    COMMENTS_MAX_LIMIT = int(os.environ.get("COMMENTS_MAX_LIMIT", 100))
+    ARTICLES_STATUS_MAX_SLUGS = int(os.environ.get("ARTICLES_STATUS_MAX_SLUGS", 100))
+    METRICS_FLUSH_INTERVAL_SECONDS = float(
+        os.environ.get("METRICS_FLUSH_INTERVAL_SECONDS", 5)
+    )
+    PROFILER_ENABLED = os.environ.get("PROFILER_ENABLED", "").lower() in ("1", "true")
+    PROFILER_SECRET = os.environ.get("PROFILER_SECRET")
+    PROFILER_INTERVAL_SECONDS = float(
+        os.environ.get("PROFILER_INTERVAL_SECONDS", 0.005)
+    )
+    PROFILER_MAX_SECONDS = float(os.environ.get("PROFILER_MAX_SECONDS", 60))
+    TRACING_EXPORTER = os.environ.get("TRACING_EXPORTER", "stdout")
+    TRACING_SAMPLE_RATIO = float(os.environ.get("TRACING_SAMPLE_RATIO", 0))
+    TRACING_OTLP_ENDPOINT = os.environ.get(
+        "TRACING_OTLP_ENDPOINT", "http://localhost:4318/v1/traces"
+    )
+    TRACING_SERVICE_NAME = os.environ.get("TRACING_SERVICE_NAME", "conduit")
+    LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
+    LOG_QUEUE_SIZE = int(os.environ.get("LOG_QUEUE_SIZE", 10000))
+    LOG_SAMPLE_RATIO = float(os.environ.get("LOG_SAMPLE_RATIO", 1))
+    LOG_SAMPLE_RATIOS = {
+        route: float(sample_ratio)
+        for route, sample_ratio in (
+            route_sample_ratio.split("=")
+            for route_sample_ratio in os.environ.get("LOG_SAMPLE_RATIOS", "").split(",")
+            if route_sample_ratio
+        )
+    }
+    LOG_MAX_PAYLOAD_LENGTH = int(os.environ.get("LOG_MAX_PAYLOAD_LENGTH", 1000))
     PORT = int(os.environ["PORT"])
     SECRET_KEY = os.environ["SECRET_KEY"]
     JWT_ACCESS_TOKEN_EXPIRES = datetime.timedelta(
@@ -0,0 +1,11 @@
+from .connection_router import ConnectionRouter
+from .routing import read_only, read_write
+from .executed_query import ExecutedQuery
+from .query_instrumentation import (
+    QueryInstrumentation,
+    fingerprint_statement,
+    normalize_statement,
+)
+from .notification_listener import NotificationListener
+from .request_queries import add_request_queries_tracking
+from .slow_query_log import SlowQueryLog
@@ -0,0 +1,270 @@
+import asyncio
+import contextlib
+import itertools
+import logging
+import random
+import time
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+import psycopg
+
+from ..exceptions import ServiceUnavailableException
+from .query_instrumentation import QueryInstrumentation
+from .routing import routed_connection
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionRouter:
+    """Routes service queries between the primary and its read replicas.
+
+    It exposes the parts of psycopg.AsyncConnection the services use, delegating
+    them to the connection routed for the current service call (see read_only and
+    read_write), or to the primary when the call is not routed.
+    """
+
+    def __init__(
+        self,
+        primary_uri: str,
+        primary: psycopg.AsyncConnection,
+        replicas: Dict[str, psycopg.AsyncConnection],
+        read_your_writes_seconds: float,
+        replica_max_lag_seconds: float,
+        get_caller: Callable[[], Optional[str]],
+        query_instrumentation: Optional[QueryInstrumentation] = None,
+        max_dedicated_connections: int = 10,
+    ):
+        self.primary = primary
+        self._primary_uri = primary_uri
+        self._replicas = replicas
+        self._read_your_writes_seconds = read_your_writes_seconds
+        self._replica_max_lag_seconds = replica_max_lag_seconds
+        self._get_caller = get_caller
+        self._query_instrumentation = query_instrumentation
+        self._healthy_replicas = list(replicas.values())
+        self._replicas_cycle = itertools.cycle(self._healthy_replicas)
+        self._last_write_at: Dict[str, float] = {}
+        self._max_tracked_callers = 10000
+        self._dedicated_connections = asyncio.Semaphore(max_dedicated_connections)
+
+    @classmethod
+    async def connect(
+        cls,
+        primary_uri: str,
+        replica_uris: List[str],
+        read_your_writes_seconds: float,
+        replica_max_lag_seconds: float,
+        get_caller: Callable[[], Optional[str]],
+        query_instrumentation: Optional[QueryInstrumentation] = None,
+        max_dedicated_connections: int = 10,
+    ) -> "ConnectionRouter":
+        primary = await cls._connect(
+            conninfo=primary_uri, query_instrumentation=query_instrumentation
+        )
+
+        replicas = {
+            replica_uri: await cls._connect(
+                conninfo=replica_uri,
+                query_instrumentation=query_instrumentation,
+                autocommit=True,
+            )
+            for replica_uri in replica_uris
+        }
+
+        return cls(
+            primary_uri=primary_uri,
+            primary=primary,
+            replicas=replicas,
+            read_your_writes_seconds=read_your_writes_seconds,
+            replica_max_lag_seconds=replica_max_lag_seconds,
+            get_caller=get_caller,
+            query_instrumentation=query_instrumentation,
+            max_dedicated_connections=max_dedicated_connections,
+        )
+
+    @property
+    def replicas(self) -> List[psycopg.AsyncConnection]:
+        return list(self._replicas.values())
+
+    @property
+    def connections(self) -> List[psycopg.AsyncConnection]:
+        return [self.primary, *self.replicas]
+
+    def cursor(self, *args, **kwargs):
+        return self._get_current_connection().cursor(*args, **kwargs)
+
+    async def commit(self):
+        await self._get_current_connection().commit()
+
+    async def rollback(self):
+        await self._get_current_connection().rollback()
+
+    async def close(self):
+        for aconn in self.connections:
+            await aconn.close()
+
+    @contextlib.asynccontextmanager
+    async def dedicated_connection(
+        self, read_only: bool = False
+    ) -> AsyncIterator[psycopg.AsyncConnection]:
+        """Opens a connection that is not shared with other requests, to a healthy
+        replica if read_only.
+
+        Used for long-running reads, such as server-side cursors, that must not be
+        interrupted by other requests committing on the shared connections. At most
+        max_dedicated_connections are open at once, so that they cannot exhaust
+        the server's connections; beyond that, ServiceUnavailableException is
+        raised instead of waiting.
+        """
+        if self._dedicated_connections.locked():
+            raise ServiceUnavailableException("too many dedicated connections open")
+
+        async with self._dedicated_connections:
+            aconn = await self._connect(
+                conninfo=self._get_read_uri() if read_only else self._primary_uri,
+                query_instrumentation=self._query_instrumentation,
+            )
+
+            try:
+                yield aconn
+            finally:
+                await aconn.close()
+
+    def get_read_connection(self) -> psycopg.AsyncConnection:
+        if not self._healthy_replicas or self._has_caller_written_recently():
+            return self.primary
+
+        return next(self._replicas_cycle)
+
+    def record_write(self):
+        caller = self._get_caller()
+
+        if not caller:
+            return
+
+        now = time.monotonic()
+
+        if len(self._last_write_at) >= self._max_tracked_callers:
+            self._last_write_at = {
+                tracked_caller: last_write_at
+                for tracked_caller, last_write_at in self._last_write_at.items()
+                if now - last_write_at < self._read_your_writes_seconds
+            }
+
+        self._last_write_at[caller] = now
+
+    async def monitor_replicas_lag(self, interval_seconds: float):
+        while True:
+            await self.check_replicas_lag()
+            await asyncio.sleep(interval_seconds)
+
+    async def check_replicas_lag(self):
+        healthy_replicas = []
+
+        for replica_uri, replica in self._replicas.items():
+            try:
+                if replica.closed:
+                    replica = await self._connect(
+                        conninfo=replica_uri,
+                        query_instrumentation=self._query_instrumentation,
+                        autocommit=True,
+                    )
+                    self._replicas[replica_uri] = replica
+
+                lag_seconds = await self._get_replica_lag_seconds(replica=replica)
+            except psycopg.Error as e:
+                logger.warning(
+                    "ejecting replica %s: %s",
+                    self._get_host(conninfo=replica_uri),
+                    e.__class__.__name__,
+                )
+                continue
+
+            if lag_seconds > self._replica_max_lag_seconds:
+                logger.warning(
+                    "ejecting replica %s: lag %.3fs",
+                    self._get_host(conninfo=replica_uri),
+                    lag_seconds,
+                )
+                continue
+
+            healthy_replicas.append(replica)
+
+        if healthy_replicas != self._healthy_replicas:
+            self._healthy_replicas = healthy_replicas
+            self._replicas_cycle = itertools.cycle(healthy_replicas)
+
+    def _get_read_uri(self) -> str:
+        """Picks the URI of a healthy replica, like get_read_connection, without
+        advancing its round-robin.
+        """
+        if not self._healthy_replicas or self._has_caller_written_recently():
+            return self._primary_uri
+
+        return random.choice(
+            [
+                replica_uri
+                for replica_uri, replica in self._replicas.items()
+                if replica in self._healthy_replicas
+            ]
+        )
+
+    def _get_current_connection(self) -> psycopg.AsyncConnection:
+        return routed_connection.get() or self.primary
+
+    def _has_caller_written_recently(self) -> bool:
+        caller = self._get_caller()
+
+        if not caller or caller not in self._last_write_at:
+            return False
+
+        return (
+            time.monotonic() - self._last_write_at[caller]
+            < self._read_your_writes_seconds
+        )
+
+    @staticmethod
+    async def _connect(
+        conninfo: str,
+        query_instrumentation: Optional[QueryInstrumentation],
+        autocommit: bool = False,
+    ) -> psycopg.AsyncConnection:
+        """Connects to conninfo.
+
+        Replicas are connected in autocommit, as read_only methods do not commit,
+        so that they are not left idle in a transaction between reads, which would
+        hold back recovery on the standby.
+        """
+        aconn = await psycopg.AsyncConnection.connect(conninfo, autocommit=autocommit)
+
+        if query_instrumentation:
+            query_instrumentation.instrument(aconn=aconn)
+
+        return aconn
+
+    @staticmethod
+    def _get_host(conninfo: str) -> Optional[str]:
+        return psycopg.conninfo.conninfo_to_dict(conninfo).get("host")
+
+    @staticmethod
+    async def _get_replica_lag_seconds(replica: psycopg.AsyncConnection) -> float:
+        async with replica.cursor() as acur:
+            get_replica_lag_query = """
+                SELECT CASE
+                    WHEN NOT pg_is_in_recovery() THEN 0
+                    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+                    ELSE COALESCE(EXTRACT(EPOCH FROM clock_timestamp() - pg_last_xact_replay_timestamp()), 0)
+                END;
+            """
+
+            try:
+                await acur.execute(get_replica_lag_query)
+            except Exception as e:
+                await replica.rollback()
+                raise e
+
+            record = await acur.fetchone()
+
+        await replica.commit()
+
+        return float(record[0])
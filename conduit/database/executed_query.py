@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class ExecutedQuery:
+    statement: str
+    fingerprint: str
+    duration_seconds: float
+    rows: int
+    params: Any = None
@@ -0,0 +1,69 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import psycopg
+from psycopg import sql
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationListener:
+    """Listens for NOTIFY on a dedicated connection, passing each channel's
+    payloads to its callbacks, one at a time in the order they were sent.
+
+    Notifications are delivered to every worker listening, once the transaction
+    sending them commits. Those sent while the connection is lost, until it
+    reconnects, are missed.
+    """
+
+    def __init__(self, conninfo: str, reconnect_interval_seconds: float = 1):
+        self._conninfo = conninfo
+        self._reconnect_interval_seconds = reconnect_interval_seconds
+        self._callbacks: Dict[str, List[Callable[[str], Awaitable]]] = {}
+        self._aconn: Optional[psycopg.AsyncConnection] = None
+
+    def add_callback(self, channel: str, callback: Callable[[str], Awaitable]):
+        """Adds callback for channel's payloads. Must be called before start."""
+        self._callbacks.setdefault(channel, []).append(callback)
+
+    async def start(self):
+        """Connects and listens to the channels, so that notifications sent once
+        it returns are received.
+        """
+        self._aconn = await self._connect()
+
+    async def listen(self):
+        while True:
+            try:
+                if not self._aconn or self._aconn.closed:
+                    self._aconn = await self._connect()
+
+                async for notify in self._aconn.notifies():
+                    await self._dispatch(channel=notify.channel, payload=notify.payload)
+            except psycopg.Error as e:
+                logger.warning("lost the notifications connection: %s", e)
+
+                await self.close()
+
+                await asyncio.sleep(self._reconnect_interval_seconds)
+
+    async def close(self):
+        if self._aconn:
+            await self._aconn.close()
+            self._aconn = None
+
+    async def _connect(self) -> psycopg.AsyncConnection:
+        aconn = await psycopg.AsyncConnection.connect(self._conninfo, autocommit=True)
+
+        for channel in self._callbacks:
+            await aconn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(channel)))
+
+        return aconn
+
+    async def _dispatch(self, channel: str, payload: str):
+        for callback in self._callbacks.get(channel, []):
+            try:
+                await callback(payload)
+            except Exception:
+                logger.exception("could not handle notification on %s", channel)
@@ -0,0 +1,153 @@
+import contextvars
+import functools
+import hashlib
+import re
+import time
+from typing import Callable, List, Optional
+
+import psycopg
+
+from .executed_query import ExecutedQuery
+from ..metrics import MetricsRegistry
+
+_string_literal_pattern = re.compile(r"'(?:[^']|'')*'")
+_number_literal_pattern = re.compile(r"\b\d+(?:\.\d+)?\b")
+_placeholder_pattern = re.compile(r"%(?:\(\w+\))?s")
+_whitespace_pattern = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """Replaces the literals and placeholders of the statement with ? and collapses
+    its whitespace, so executions of the same query normalize alike.
+    """
+    statement = _string_literal_pattern.sub("?", statement)
+    statement = _number_literal_pattern.sub("?", statement)
+    statement = _placeholder_pattern.sub("?", statement)
+    statement = _whitespace_pattern.sub(" ", statement)
+    return statement.strip().rstrip(";").strip()
+
+
+@functools.lru_cache(maxsize=1024)
+def fingerprint_statement(statement: str) -> str:
+    return hashlib.sha1(normalize_statement(statement).encode()).hexdigest()[:16]
+
+
+class QueryInstrumentation:
+    """Records the duration, row count and fingerprint of every statement executed
+    by cursors made with its cursor factories.
+
+    Executions are counted in the metrics registry, appended to the queries of
+    the current request when tracking them (see track_request_queries) and passed
+    to the listeners.
+    """
+
+    def __init__(self, metrics_registry: MetricsRegistry):
+        self._listeners: List[Callable[[ExecutedQuery], None]] = []
+        self._request_queries: contextvars.ContextVar[
+            Optional[List[ExecutedQuery]]
+        ] = contextvars.ContextVar("request_queries", default=None)
+
+        self._queries_total = metrics_registry.counter(
+            name="db_queries_total",
+            documentation="Total database statements executed.",
+            label_names=("fingerprint",),
+        )
+        self._query_duration_seconds = metrics_registry.histogram(
+            name="db_query_duration_seconds",
+            documentation="Database statement execution time in seconds.",
+            label_names=("fingerprint",),
+        )
+        self._query_rows_total = metrics_registry.counter(
+            name="db_query_rows_total",
+            documentation="Total rows returned or affected by database statements.",
+            label_names=("fingerprint",),
+        )
+
+        self.cursor_factory = self._make_cursor_factory(base=psycopg.AsyncCursor)
+        self.server_cursor_factory = self._make_cursor_factory(
+            base=psycopg.AsyncServerCursor
+        )
+
+    def instrument(self, aconn: psycopg.AsyncConnection) -> psycopg.AsyncConnection:
+        aconn.cursor_factory = self.cursor_factory
+        aconn.server_cursor_factory = self.server_cursor_factory
+        return aconn
+
+    def track_request_queries(self) -> contextvars.Token:
+        """Starts collecting the queries executed in the current context."""
+        return self._request_queries.set([])
+
+    def untrack_request_queries(self, token: contextvars.Token):
+        self._request_queries.reset(token)
+
+    def get_request_queries(self) -> Optional[List[ExecutedQuery]]:
+        return self._request_queries.get()
+
+    def add_listener(self, listener: Callable[[ExecutedQuery], None]):
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[ExecutedQuery], None]):
+        self._listeners.remove(listener)
+
+    def record(self, executed_query: ExecutedQuery):
+        self._queries_total.inc(fingerprint=executed_query.fingerprint)
+        self._query_duration_seconds.observe(
+            executed_query.duration_seconds, fingerprint=executed_query.fingerprint
+        )
+        self._query_rows_total.inc(
+            executed_query.rows, fingerprint=executed_query.fingerprint
+        )
+
+        request_queries = self._request_queries.get()
+
+        if request_queries is not None:
+            request_queries.append(executed_query)
+
+        for listener in self._listeners:
+            listener(executed_query)
+
+    def _make_cursor_factory(self, base: type) -> type:
+        instrumentation = self
+
+        class _InstrumentedCursor(base):
+            async def execute(self, query, params=None, **kwargs):
+                started_at = time.perf_counter()
+
+                try:
+                    return await super().execute(query, params, **kwargs)
+                finally:
+                    instrumentation._record_execution(
+                        cursor=self, query=query, params=params, started_at=started_at
+                    )
+
+            async def executemany(self, query, params_seq, **kwargs):
+                started_at = time.perf_counter()
+
+                try:
+                    return await super().executemany(query, params_seq, **kwargs)
+                finally:
+                    instrumentation._record_execution(
+                        cursor=self, query=query, params=None, started_at=started_at
+                    )
+
+        return _InstrumentedCursor
+
+    def _record_execution(self, cursor, query, params, started_at: float):
+        duration_seconds = time.perf_counter() - started_at
+
+        if isinstance(query, str):
+            statement = query
+        elif isinstance(query, bytes):
+            statement = query.decode()
+        else:
+            statement = query.as_string(cursor)
+
+        self.record(
+            ExecutedQuery(
+                statement=statement,
+                fingerprint=fingerprint_statement(statement),
+                duration_seconds=duration_seconds,
+                rows=max(cursor.rowcount, 0),
+                params=params,
+            )
+        )
@@ -0,0 +1,88 @@
+import logging
+from quart import Quart, g, request
+
+from .query_instrumentation import QueryInstrumentation, normalize_statement
+from ..metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+
+def add_request_queries_tracking(
+    app: Quart,
+    query_instrumentation: QueryInstrumentation,
+    metrics_registry: MetricsRegistry,
+):
+    """Tracks the queries executed by each request.
+
+    The number of queries and the time spent in them are recorded per endpoint,
+    and the request's queries are logged when they exceed the
+    DATABASE_QUERY_LOG_COUNT_THRESHOLD or DATABASE_QUERY_LOG_SECONDS_THRESHOLD.
+    """
+    request_queries_count = metrics_registry.histogram(
+        name="http_request_db_queries",
+        documentation="Database statements executed per HTTP request.",
+        label_names=("endpoint", "method"),
+        buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+    )
+    request_queries_duration_seconds = metrics_registry.histogram(
+        name="http_request_db_duration_seconds",
+        documentation="Time spent executing database statements per HTTP request.",
+        label_names=("endpoint", "method"),
+    )
+
+    @app.before_request
+    async def start_request_queries_tracking():
+        g.request_queries_token = query_instrumentation.track_request_queries()
+
+    @app.after_request
+    async def record_request_queries(response):
+        request_queries = query_instrumentation.get_request_queries()
+
+        if request_queries is None:
+            return response
+
+        endpoint = request.endpoint or "unmatched"
+
+        queries_count = len(request_queries)
+        queries_duration_seconds = sum(
+            executed_query.duration_seconds for executed_query in request_queries
+        )
+
+        request_queries_count.observe(
+            queries_count, endpoint=endpoint, method=request.method
+        )
+        request_queries_duration_seconds.observe(
+            queries_duration_seconds, endpoint=endpoint, method=request.method
+        )
+
+        if (
+            queries_count > app.config["DATABASE_QUERY_LOG_COUNT_THRESHOLD"]
+            or queries_duration_seconds
+            > app.config["DATABASE_QUERY_LOG_SECONDS_THRESHOLD"]
+        ):
+            logger.warning(
+                "%s %s ran %d queries in %.3fs:\n%s",
+                request.method,
+                request.path,
+                queries_count,
+                queries_duration_seconds,
+                "\n".join(
+                    f"{executed_query.duration_seconds:.4f}s {executed_query.rows} rows "
+                    f"[{executed_query.fingerprint}] {normalize_statement(executed_query.statement)}"
+                    for executed_query in request_queries
+                ),
+            )
+
+        return response
+
+    @app.teardown_request
+    async def finish_request_queries_tracking(exc):
+        token = g.pop("request_queries_token", None)
+
+        if token is None:
+            return
+
+        try:
+            query_instrumentation.untrack_request_queries(token)
+        except ValueError:
+            pass
@@ -0,0 +1,50 @@
+import contextvars
+import functools
+from typing import Optional
+
+import psycopg
+
+routed_connection: contextvars.ContextVar[
+    Optional[psycopg.AsyncConnection]
+] = contextvars.ContextVar("routed_connection", default=None)
+
+
+def read_only(method):
+    """Lets the service method read from a replica.
+
+    Calls nested in a method that is already routed keep that connection, so reads
+    made on behalf of a write stay on the primary.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if routed_connection.get() is not None:
+            return await method(self, *args, **kwargs)
+
+        token = routed_connection.set(self._aconn.get_read_connection())
+
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            routed_connection.reset(token)
+
+    return wrapper
+
+
+def read_write(method):
+    """Pins the service method to the primary and records the caller's write."""
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        token = routed_connection.set(self._aconn.primary)
+
+        try:
+            result = await method(self, *args, **kwargs)
+        finally:
+            routed_connection.reset(token)
+
+        self._aconn.record_write()
+
+        return result
+
+    return wrapper
@@ -0,0 +1,118 @@
+import asyncio
+import json
+import logging
+import time
+from typing import Dict, Optional, Set
+
+import psycopg
+from quart import has_request_context, request
+
+from .executed_query import ExecutedQuery
+from .query_instrumentation import normalize_statement
+
+logger = logging.getLogger(__name__)
+
+
+class SlowQueryLog:
+    """Logs the queries that take longer than threshold_seconds with their plans.
+
+    The plan is captured in the background by running EXPLAIN (FORMAT JSON) on the
+    query with the same parameters, on a side connection that is not
+    instrumented. Each fingerprint is explained at most once every
+    explain_interval_seconds; slow executions in between are logged without plan.
+    """
+
+    def __init__(
+        self,
+        conninfo: str,
+        threshold_seconds: float,
+        explain_interval_seconds: float,
+    ):
+        self.threshold_seconds = threshold_seconds
+        self._conninfo = conninfo
+        self._explain_interval_seconds = explain_interval_seconds
+        self._explained_at: Dict[str, float] = {}
+        self._explain_lock = asyncio.Lock()
+        self._explain_tasks: Set[asyncio.Task] = set()
+        self._aconn: Optional[psycopg.AsyncConnection] = None
+
+    def observe(self, executed_query: ExecutedQuery):
+        if executed_query.duration_seconds < self.threshold_seconds:
+            return
+
+        if has_request_context():
+            route = f"{request.method} {request.endpoint or request.path}"
+        else:
+            route = None
+
+        now = time.monotonic()
+
+        explained_at = self._explained_at.get(executed_query.fingerprint)
+
+        if (
+            explained_at is not None
+            and now - explained_at < self._explain_interval_seconds
+        ):
+            self._log(executed_query=executed_query, route=route, plan=None)
+            return
+
+        self._explained_at[executed_query.fingerprint] = now
+
+        explain_task = asyncio.create_task(
+            self._explain(executed_query=executed_query, route=route)
+        )
+        self._explain_tasks.add(explain_task)
+        explain_task.add_done_callback(self._explain_tasks.discard)
+
+    async def join(self):
+        """Waits for the plans being captured to be logged."""
+        if self._explain_tasks:
+            await asyncio.gather(*self._explain_tasks, return_exceptions=True)
+
+    async def close(self):
+        for explain_task in self._explain_tasks:
+            explain_task.cancel()
+
+        await self.join()
+
+        if self._aconn:
+            await self._aconn.close()
+
+    async def _explain(self, executed_query: ExecutedQuery, route: Optional[str]):
+        explain_query = f"EXPLAIN (FORMAT JSON) {executed_query.statement}"
+
+        async with self._explain_lock:
+            try:
+                if not self._aconn or self._aconn.closed:
+                    self._aconn = await psycopg.AsyncConnection.connect(
+                        self._conninfo, autocommit=True
+                    )
+
+                async with psycopg.AsyncClientCursor(self._aconn) as acur:
+                    await acur.execute(explain_query, executed_query.params)
+                    record = await acur.fetchone()
+            except psycopg.Error as e:
+                logger.warning(
+                    "could not explain query [%s]: %s",
+                    executed_query.fingerprint,
+                    e.__class__.__name__,
+                )
+                record = None
+
+        self._log(
+            executed_query=executed_query,
+            route=route,
+            plan=record[0] if record else None,
+        )
+
+    @staticmethod
+    def _log(executed_query: ExecutedQuery, route: Optional[str], plan):
+        logger.warning(
+            "slow query %.3fs %d rows on %s [%s] %s\nplan: %s",
+            executed_query.duration_seconds,
+            executed_query.rows,
+            route or "background task",
+            executed_query.fingerprint,
+            normalize_statement(executed_query.statement),
+            json.dumps(plan) if plan is not None else "not captured",
+        )
@@ -1,13 +1,17 @@
 import dataclasses
 import json
-import traceback
 from dataclasses import dataclass
 from http import HTTPStatus
 from typing import List
 from quart import Quart, Response
 from quart_jwt_extended import JWTManager
 from werkzeug.exceptions import HTTPException
-from .exceptions import AlreadyExistsException, UnauthorizedException, NotFoundException
+from .exceptions import (
+    AlreadyExistsException,
+    UnauthorizedException,
+    NotFoundException,
+    ServiceUnavailableException,
+)
 
 
 @dataclass
@@ -22,8 +26,7 @@ class _ErrorResponse:
 
 def add_jwt_manager_error_loaders(app: Quart, jwt_manager: JWTManager):
     def unauthorized_callback(reason: str) -> Response:
-        app.logger.error(reason)
-        app.logger.error(traceback.format_exc())
+        app.logger.error("%s", reason, exc_info=True)
 
         response = Response(
             response=json.dumps(
@@ -42,8 +45,7 @@ def add_jwt_manager_error_loaders(app: Quart, jwt_manager: JWTManager):
 def add_error_handlers(app: Quart):
     @app.errorhandler(AlreadyExistsException)
     def handle_value_error(e: AlreadyExistsException):
-        app.logger.error(e)
-        app.logger.error(traceback.format_exc())
+        app.logger.error("%s", e, exc_info=e)
 
         return (
             _ErrorResponse(_ErrorResponseBody([str(e)])),
@@ -52,8 +54,7 @@ def add_error_handlers(app: Quart):
 
     @app.errorhandler(UnauthorizedException)
     def handle_value_error(e: UnauthorizedException):
-        app.logger.error(e)
-        app.logger.error(traceback.format_exc())
+        app.logger.error("%s", e, exc_info=e)
 
         return (
             _ErrorResponse(_ErrorResponseBody(["unauthorized"])),
@@ -62,18 +63,25 @@ def add_error_handlers(app: Quart):
 
     @app.errorhandler(NotFoundException)
     def handle_value_error(e: NotFoundException):
-        app.logger.error(e)
-        app.logger.error(traceback.format_exc())
+        app.logger.error("%s", e, exc_info=e)
 
         return (
             _ErrorResponse(_ErrorResponseBody([str(e)])),
             HTTPStatus.NOT_FOUND,
         )
 
+    @app.errorhandler(ServiceUnavailableException)
+    def handle_value_error(e: ServiceUnavailableException):
+        app.logger.error("%s", e, exc_info=e)
+
+        return (
+            _ErrorResponse(_ErrorResponseBody([str(e)])),
+            HTTPStatus.SERVICE_UNAVAILABLE,
+        )
+
     @app.errorhandler(ValueError)
     def handle_value_error(e: ValueError):
-        app.logger.error(e)
-        app.logger.error(traceback.format_exc())
+        app.logger.error("%s", e, exc_info=e)
 
         return (
             _ErrorResponse(_ErrorResponseBody([str(e)])),
@@ -82,19 +90,13 @@ def add_error_handlers(app: Quart):
 
     @app.errorhandler(HTTPException)
     def handle_http_exception(e: HTTPException):
-        try:
-            app.logger.error(e.validation_error.json())
-        except AttributeError:
-            app.logger.error(e)
-
-        app.logger.error(traceback.format_exc())
+        app.logger.error("%s", getattr(e, "validation_error", e), exc_info=e)
 
         return _ErrorResponse(_ErrorResponseBody([e.description])), e.code
 
     @app.errorhandler(Exception)
     def handle_exception(e: Exception):
-        app.logger.error(f"{e.__class__.__name__}: {e}")
-        app.logger.error(traceback.format_stack())
+        app.logger.error("%s: %s", e.__class__.__name__, e, exc_info=e)
 
         return (
             _ErrorResponse(_ErrorResponseBody(["internal server error"])),
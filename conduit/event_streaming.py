@@ -0,0 +1,80 @@
+import asyncio
+import json
+from typing import AsyncIterator, ContextManager
+
+from quart import Response, stream_with_context, websocket
+
+from .subscriptions import Subscription
+
+# WebSocket close codes, for clients that are not allowed to subscribe, and for
+# those dropped for reading too slowly, which should reconnect later.
+POLICY_VIOLATION = 1008
+TRY_AGAIN_LATER = 1013
+
+
+def stream_events_response(
+    subscribe: ContextManager[Subscription], heartbeat_seconds: float
+) -> Response:
+    """Streams the events published to the subscription subscribe enters as
+    Server-Sent Events, unsubscribing when the stream ends.
+
+    A comment is written as soon as the stream starts, once subscribed, and
+    whenever no event is published for heartbeat_seconds, so that clients and
+    proxies keep idle streams open and dead clients are noticed. If the
+    subscription overflows, the stream ends and the client reconnects.
+    """
+
+    @stream_with_context
+    async def _generate_events() -> AsyncIterator[str]:
+        with subscribe as subscription:
+            yield ": subscribed\n\n"
+
+            while True:
+                try:
+                    event = await subscription.get(timeout=heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+
+                if event is None:
+                    return
+
+                yield f"event: {event.name}\ndata: {event.data}\n\n"
+
+    response = Response(_generate_events(), content_type="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    response.timeout = None
+
+    return response
+
+
+async def reject_websocket(reason: str):
+    """Closes the current WebSocket with code 1008 (policy violation) and reason.
+
+    It is accepted first, as closing it during the handshake would reject it with
+    a 403 and lose the code and reason.
+    """
+    await websocket.accept()
+    await websocket.close(code=POLICY_VIOLATION, reason=reason)
+
+
+async def send_websocket_events(subscription: Subscription):
+    """Sends the events published to subscription over the current WebSocket, as
+    {"event": name, "data": data} messages.
+
+    If the subscription overflows, the WebSocket is closed with code 1013 (try
+    again later).
+    """
+    await websocket.accept()
+
+    while True:
+        event = await subscription.get()
+
+        if event is None:
+            await websocket.close(code=TRY_AGAIN_LATER, reason="too slow")
+            return
+
+        await websocket.send(
+            f'{{"event": {json.dumps(event.name)}, "data": {event.data}}}'
+        )
@@ -1,3 +1,4 @@
 from .already_exists_exception import AlreadyExistsException
 from .not_found_exception import NotFoundException
+from .service_unavailable_exception import ServiceUnavailableException
 from .unauthorized_exception import UnauthorizedException
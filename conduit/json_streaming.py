@@ -0,0 +1,47 @@
+import dataclasses
+from typing import Any, AsyncIterator, Optional
+from quart import Response, current_app, stream_with_context
+
+
+async def stream_json_response(
+    items_key: str, items: AsyncIterator[Any], count_key: Optional[str] = None
+) -> Response:
+    """Streams a JSON object whose items_key holds the dataclasses yielded by items.
+
+    Each item is encoded and written as soon as it is yielded, so memory use does
+    not grow with the number of items. If count_key is set, the number of items is
+    written after them under that key.
+
+    The first item is awaited before the response starts, so that errors raised
+    while opening items, such as when no connection is available, are returned as
+    error responses rather than cutting off a 200 response.
+    """
+    json_provider = current_app.json
+
+    first_item = await anext(items, None)
+
+    @stream_with_context
+    async def _generate_json() -> AsyncIterator[str]:
+        head, tail = json_provider.dumps({items_key: []}).split("[]")
+
+        yield f"{head}["
+
+        if first_item is None:
+            count = 0
+        else:
+            yield json_provider.dumps(dataclasses.asdict(first_item))
+            count = 1
+
+        async for item in items:
+            item_json = json_provider.dumps(dataclasses.asdict(item))
+            yield f",{item_json}" if count else item_json
+            count += 1
+
+        yield "]"
+
+        if count_key:
+            yield f",{json_provider.dumps({count_key: count})[1:-1]}"
+
+        yield tail
+
+    return Response(_generate_json(), content_type="application/json")
@@ -0,0 +1,7 @@
+from .counter import Counter
+from .event_loop_monitor import EventLoopMonitor
+from .gauge import Gauge
+from .histogram import Histogram
+from .metrics_registry import MetricsRegistry
+from .metrics_blueprint import metrics_blueprint
+from .request_metrics import add_request_metrics
@@ -0,0 +1,101 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from .metrics_registry import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class EventLoopMonitor:
+    """Measures how late the event loop runs a callback scheduled every
+    interval_seconds, which is how long requests wait behind synchronous work.
+
+    When blocking_threshold_seconds is set, a watchdog thread also logs the stack
+    of the event loop thread whenever the loop has not run for that long, which
+    points at the code blocking it. It is meant for debugging, since it takes the
+    stack of a running thread.
+    """
+
+    def __init__(
+        self,
+        metrics_registry: MetricsRegistry,
+        interval_seconds: float,
+        blocking_threshold_seconds: Optional[float] = None,
+    ):
+        self._interval_seconds = interval_seconds
+        self._blocking_threshold_seconds = blocking_threshold_seconds
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+
+        self._lag_seconds = metrics_registry.histogram(
+            name="event_loop_lag_seconds",
+            documentation="Delay of the event loop in running scheduled callbacks.",
+            buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+        )
+        self._blocked_total = metrics_registry.counter(
+            name="event_loop_blocked_total",
+            documentation="Times the event loop was blocked for longer than the threshold.",
+        )
+
+    async def monitor(self):
+        loop = asyncio.get_running_loop()
+
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+
+        stopped = threading.Event()
+
+        if self._blocking_threshold_seconds is not None:
+            threading.Thread(
+                target=self._watch_blocking,
+                args=(stopped,),
+                name="event-loop-watchdog",
+                daemon=True,
+            ).start()
+
+        try:
+            while True:
+                scheduled_at = loop.time()
+
+                await asyncio.sleep(self._interval_seconds)
+
+                self._heartbeat = time.monotonic()
+                self._lag_seconds.observe(
+                    max(loop.time() - scheduled_at - self._interval_seconds, 0)
+                )
+        finally:
+            stopped.set()
+
+    def _watch_blocking(self, stopped: threading.Event):
+        blocked_heartbeat = None
+
+        while not stopped.wait(self._blocking_threshold_seconds / 2):
+            heartbeat = self._heartbeat
+
+            blocked_seconds = time.monotonic() - heartbeat - self._interval_seconds
+
+            if blocked_seconds < self._blocking_threshold_seconds:
+                continue
+
+            if heartbeat == blocked_heartbeat:
+                continue
+
+            blocked_heartbeat = heartbeat
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+
+            if frame is None:
+                continue
+
+            self._blocked_total.inc()
+
+            logger.warning(
+                "event loop blocked for more than %.3fs at:\n%s",
+                blocked_seconds,
+                "".join(traceback.format_stack(frame)),
+            )
@@ -0,0 +1,32 @@
+from typing import Any, Dict, List
+
+from .metric import Metric
+
+
+class Gauge(Metric):
+    """A value that goes up and down.
+
+    When merged across workers, only the workers that are still alive count.
+    """
+
+    type = "gauge"
+
+    def inc(self, amount: float = 1, **labels: str):
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: str):
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str):
+        self._values[self._key(labels)] = value
+
+    def merge(
+        self, snapshots: List[Dict[str, Any]], alive: List[bool]
+    ) -> Dict[str, Any]:
+        return super().merge(
+            snapshots=[
+                snapshot for snapshot, is_alive in zip(snapshots, alive) if is_alive
+            ],
+            alive=alive,
+        )
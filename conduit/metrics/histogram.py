@@ -0,0 +1,89 @@
+import bisect
+from typing import Any, Dict, Iterable, List
+
+from .metric import Metric
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class Histogram(Metric):
+    """Counts observations in buckets of upper bounds.
+
+    Each labelled value holds the per-bucket counts, the last one being +Inf, the
+    sum and the count of the observations. Buckets are made cumulative only when
+    rendered, so an observation increments a single bucket.
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(
+            name=name, documentation=documentation, label_names=label_names
+        )
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: str):
+        key = self._key(labels)
+
+        histogram_value = self._values.get(key)
+
+        if histogram_value is None:
+            histogram_value = {
+                "buckets": [0] * (len(self.buckets) + 1),
+                "sum": 0,
+                "count": 0,
+            }
+            self._values[key] = histogram_value
+
+        histogram_value["buckets"][bisect.bisect_left(self.buckets, value)] += 1
+        histogram_value["sum"] += value
+        histogram_value["count"] += 1
+
+    def merge(
+        self, snapshots: List[Dict[str, Any]], alive: List[bool]
+    ) -> Dict[str, Any]:
+        merged = {}
+
+        for snapshot in snapshots:
+            for key, value in snapshot.items():
+                if key not in merged:
+                    merged[key] = {
+                        "buckets": list(value["buckets"]),
+                        "sum": value["sum"],
+                        "count": value["count"],
+                    }
+                    continue
+
+                merged_value = merged[key]
+                merged_value["buckets"] = [
+                    merged_bucket + bucket
+                    for merged_bucket, bucket in zip(
+                        merged_value["buckets"], value["buckets"]
+                    )
+                ]
+                merged_value["sum"] += value["sum"]
+                merged_value["count"] += value["count"]
+
+        return merged
+
+    def _render_samples(self, label_values: List[str], value: Any) -> List[str]:
+        lines = []
+
+        cumulative_count = 0
+
+        for upper_bound, bucket_count in zip([*self.buckets, "+Inf"], value["buckets"]):
+            cumulative_count += bucket_count
+            labels = self._format_labels(label_values, le=str(upper_bound))
+            lines.append(f"{self.name}_bucket{labels} {float(cumulative_count)}")
+
+        labels = self._format_labels(label_values)
+        lines.append(f"{self.name}_sum{labels} {float(value['sum'])}")
+        lines.append(f"{self.name}_count{labels} {float(value['count'])}")
+
+        return lines
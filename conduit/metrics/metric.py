@@ -0,0 +1,71 @@
+import json
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+class Metric:
+    """Base class of the in-process metrics.
+
+    Values are kept per tuple of label values in a plain dict. Updates happen on
+    the event loop thread without awaiting, so they need no lock.
+    """
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values: Dict[Tuple[str, ...], Any] = {}
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {json.dumps(key): value for key, value in self._values.items()}
+
+    def merge(
+        self, snapshots: List[Dict[str, Any]], alive: List[bool]
+    ) -> Dict[str, Any]:
+        """Merges the snapshots taken by each worker into a single one."""
+        merged = {}
+
+        for snapshot in snapshots:
+            for key, value in snapshot.items():
+                merged[key] = merged.get(key, 0) + value
+
+        return merged
+
+    def render(self, snapshot: Dict[str, Any]) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+
+        for key, value in sorted(snapshot.items()):
+            lines.extend(
+                self._render_samples(label_values=json.loads(key), value=value)
+            )
+
+        return lines
+
+    def _render_samples(self, label_values: List[str], value: Any) -> List[str]:
+        return [f"{self.name}{self._format_labels(label_values)} {float(value)}"]
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels[label_name]) for label_name in self.label_names)
+
+    def _format_labels(self, label_values: List[str], **extra_labels: str) -> str:
+        labels = list(zip(self.label_names, label_values)) + list(extra_labels.items())
+
+        if not labels:
+            return ""
+
+        formatted_labels = ",".join(
+            f'{label_name}="{self._escape(label_value)}"'
+            for label_name, label_value in labels
+        )
+
+        return f"{{{formatted_labels}}}"
+
+    @staticmethod
+    def _escape(label_value: str) -> str:
+        return (
+            label_value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
@@ -0,0 +1,10 @@
+from quart import Blueprint, Response, current_app
+
+metrics_blueprint = Blueprint("metrics", __name__)
+
+
+@metrics_blueprint.get(rule="/metrics")
+async def get_metrics() -> Response:
+    metrics = await current_app.metrics_registry.render()
+
+    return Response(metrics, content_type="text/plain; version=0.0.4; charset=utf-8")
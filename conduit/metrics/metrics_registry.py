@@ -0,0 +1,133 @@
+import asyncio
+import glob
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+from .counter import Counter
+from .gauge import Gauge
+from .histogram import DEFAULT_BUCKETS, Histogram
+from .metric import Metric
+
+
+class MetricsRegistry:
+    """Holds the process metrics and renders them in the Prometheus text format.
+
+    Each Hypercorn worker is a separate process with its own registry. When a
+    directory is set, every worker flushes a snapshot of its metrics to a file in
+    it, and the metrics are rendered from the merge of all the workers snapshots,
+    so scraping any worker gives the totals of the whole server.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory
+        self._metrics: Dict[str, Metric] = {}
+
+    def counter(
+        self, name: str, documentation: str, label_names: Iterable[str] = ()
+    ) -> Counter:
+        return self._register(
+            Counter(name=name, documentation=documentation, label_names=label_names)
+        )
+
+    def gauge(
+        self, name: str, documentation: str, label_names: Iterable[str] = ()
+    ) -> Gauge:
+        return self._register(
+            Gauge(name=name, documentation=documentation, label_names=label_names)
+        )
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(
+            Histogram(
+                name=name,
+                documentation=documentation,
+                label_names=label_names,
+                buckets=buckets,
+            )
+        )
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: metric.snapshot() for name, metric in self._metrics.items()}
+
+    async def flush(self):
+        if not self.directory:
+            return
+
+        await asyncio.to_thread(
+            self._write_snapshot, pid=os.getpid(), snapshot=self.snapshot()
+        )
+
+    async def flush_periodically(self, interval_seconds: float):
+        while True:
+            await asyncio.sleep(interval_seconds)
+            await self.flush()
+
+    async def render(self) -> str:
+        if self.directory:
+            await self.flush()
+            snapshots, alive = await asyncio.to_thread(self._read_snapshots)
+        else:
+            snapshots, alive = [self.snapshot()], [True]
+
+        lines = []
+
+        for name, metric in self._metrics.items():
+            metric_snapshots = [snapshot.get(name, {}) for snapshot in snapshots]
+            lines.extend(
+                metric.render(snapshot=metric.merge(metric_snapshots, alive=alive))
+            )
+
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: Metric) -> Any:
+        if metric.name in self._metrics:
+            return self._metrics[metric.name]
+
+        self._metrics[metric.name] = metric
+
+        return metric
+
+    def _write_snapshot(self, pid: int, snapshot: Dict[str, Dict[str, Any]]):
+        os.makedirs(self.directory, exist_ok=True)
+
+        path = os.path.join(self.directory, f"{pid}.json")
+        tmp_path = f"{path}.tmp"
+
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f)
+
+        os.replace(tmp_path, path)
+
+    def _read_snapshots(self) -> (List[Dict[str, Dict[str, Any]]], List[bool]):
+        snapshots = []
+        alive = []
+
+        for path in glob.glob(os.path.join(self.directory, "*.json")):
+            try:
+                with open(path) as f:
+                    snapshots.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+
+            pid = int(os.path.splitext(os.path.basename(path))[0])
+            alive.append(self._is_alive(pid=pid))
+
+        return snapshots, alive
+
+    @staticmethod
+    def _is_alive(pid: int) -> bool:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+
+        return True
@@ -0,0 +1,59 @@
+import time
+from quart import Quart, g, request
+
+from .metrics_registry import MetricsRegistry
+
+
+def add_request_metrics(app: Quart, metrics_registry: MetricsRegistry):
+    requests_total = metrics_registry.counter(
+        name="http_requests_total",
+        documentation="Total HTTP requests.",
+        label_names=("endpoint", "method", "status"),
+    )
+    request_duration_seconds = metrics_registry.histogram(
+        name="http_request_duration_seconds",
+        documentation="HTTP request latency in seconds, until the response headers.",
+        label_names=("endpoint", "method", "status"),
+    )
+    requests_in_flight = metrics_registry.gauge(
+        name="http_requests_in_flight",
+        documentation="HTTP requests being handled.",
+        label_names=("endpoint", "method"),
+    )
+
+    def get_endpoint() -> str:
+        return request.endpoint or "unmatched"
+
+    @app.before_request
+    async def start_request_metrics():
+        g.request_started_at = time.perf_counter()
+
+        requests_in_flight.inc(endpoint=get_endpoint(), method=request.method)
+
+    @app.after_request
+    async def record_request_metrics(response):
+        request_started_at = g.get("request_started_at")
+
+        if request_started_at is None:
+            return response
+
+        endpoint = get_endpoint()
+
+        request_duration_seconds.observe(
+            time.perf_counter() - request_started_at,
+            endpoint=endpoint,
+            method=request.method,
+            status=response.status_code,
+        )
+        requests_total.inc(
+            endpoint=endpoint, method=request.method, status=response.status_code
+        )
+
+        return response
+
+    @app.teardown_request
+    async def finish_request_metrics(exc):
+        if g.get("request_started_at") is None:
+            return
+
+        requests_in_flight.dec(endpoint=get_endpoint(), method=request.method)
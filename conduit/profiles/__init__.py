@@ -1,2 +1,3 @@
+from .profile import Profile
 from .profiles_service import ProfilesService
 from .profiles_blueprint import profiles_blueprint
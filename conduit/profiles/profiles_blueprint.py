@@ -21,7 +21,9 @@ async def follow_user(username: str) -> (ProfileResponse, int):
         raise UnauthorizedException(f"follower {follower_username} not found")
 
     current_app.logger.info(
-        f"received follow user request. follower_id: {follower.id}, followed_username: {username}"
+        "received follow user request. follower_id: %s, followed_username: %s",
+        follower.id,
+        username,
     )
 
     await current_app.profiles_service.follow_user_by_username(
@@ -88,7 +90,9 @@ async def unfollow_user(username: str) -> (ProfileResponse, int):
         raise UnauthorizedException(f"follower {follower_username} not found")
 
     current_app.logger.info(
-        f"received unfollow user request. follower_id: {follower.id}, followed_username: {username}"
+        "received unfollow user request. follower_id: %s, followed_username: %s",
+        follower.id,
+        username,
     )
 
     await current_app.profiles_service.unfollow_user_by_username(
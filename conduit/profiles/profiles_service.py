@@ -1,16 +1,19 @@
-import psycopg
 from typing import List, Optional
 from .profile import Profile
 from .. import UsersService
+from ..database import ConnectionRouter, read_only, read_write
 from ..exceptions import NotFoundException
+from ..tracing import traced
 
 
+@traced
 class ProfilesService:
-    def __init__(self, aconn: psycopg.AsyncConnection, users_service: UsersService):
+    def __init__(self, aconn: ConnectionRouter, users_service: UsersService):
         self._aconn = aconn
         self._users_service = users_service
         self._follows_table = "follows"
 
+    @read_only
     async def get_profile_by_user_id(
         self, user_id: str, follower_id: Optional[str] = None
     ) -> Profile:
@@ -39,6 +42,7 @@ class ProfilesService:
 
         return profile
 
+    @read_only
     async def get_profile_by_username(
         self, username: str, follower_id: Optional[str] = None
     ) -> Profile:
@@ -51,6 +55,7 @@ class ProfilesService:
             user_id=user.id, follower_id=follower_id
         )
 
+    @read_only
     async def get_followed_profiles_by_user_id(self, follower_id: str) -> List[Profile]:
         async with self._aconn.cursor() as acur:
             follow_user_query = f"""
@@ -75,6 +80,7 @@ class ProfilesService:
 
             return profiles
 
+    @read_write
     async def follow_user_by_username(self, follower_id: str, followed_username: str):
         followed = await self._users_service.get_user_by_username(
             username=followed_username
@@ -105,6 +111,7 @@ class ProfilesService:
 
         await self._aconn.commit()
 
+    @read_write
     async def unfollow_user_by_username(self, follower_id: str, followed_username: str):
         followed = await self._users_service.get_user_by_username(
             username=followed_username
@@ -0,0 +1,3 @@
+from .sampling_profiler import SamplingProfiler
+from .profiling_blueprint import profiling_blueprint
+from .request_profiling import add_request_profiling
@@ -0,0 +1,7 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class ProfileQueryArgs:
+    seconds: Optional[float] = None
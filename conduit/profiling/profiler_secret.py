@@ -0,0 +1,26 @@
+import hmac
+from quart import current_app, request
+
+from ..exceptions import UnauthorizedException
+
+PROFILER_SECRET_HEADER = "X-Profiler-Secret"
+
+
+def has_profiler_secret() -> bool:
+    """Whether profiling is enabled and the request carries the profiler secret."""
+    profiler_secret = current_app.config["PROFILER_SECRET"]
+
+    if not current_app.config["PROFILER_ENABLED"] or not profiler_secret:
+        return False
+
+    request_secret = request.headers.get(PROFILER_SECRET_HEADER)
+
+    if not request_secret:
+        return False
+
+    return hmac.compare_digest(request_secret.encode(), profiler_secret.encode())
+
+
+def verify_profiler_secret():
+    if not has_profiler_secret():
+        raise UnauthorizedException("invalid profiler secret")
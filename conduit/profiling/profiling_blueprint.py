@@ -0,0 +1,51 @@
+import asyncio
+from quart import Blueprint, Response, current_app
+from quart_schema import validate_querystring
+
+from .profile_query_args import ProfileQueryArgs
+from .profiler_secret import verify_profiler_secret
+from .sampling_profiler import SamplingProfiler
+from ..exceptions import NotFoundException
+
+profiling_blueprint = Blueprint("profiling", __name__, url_prefix="/admin")
+
+_profiling_lock = asyncio.Lock()
+
+
+@profiling_blueprint.get(rule="/profile")
+@validate_querystring(model_class=ProfileQueryArgs)
+async def profile(query_args: ProfileQueryArgs) -> Response:
+    if not current_app.config["PROFILER_ENABLED"]:
+        raise NotFoundException("profiler is not enabled")
+
+    verify_profiler_secret()
+
+    seconds = query_args.seconds
+
+    if seconds is None:
+        seconds = 10
+
+    max_seconds = current_app.config["PROFILER_MAX_SECONDS"]
+
+    if not 0 < seconds <= max_seconds:
+        raise ValueError(f"seconds must be greater than 0 and at most {max_seconds}")
+
+    if _profiling_lock.locked():
+        raise ValueError("profiler is already running")
+
+    async with _profiling_lock:
+        profiler = SamplingProfiler(
+            interval_seconds=current_app.config["PROFILER_INTERVAL_SECONDS"]
+        )
+
+        profiler.start()
+
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            stacks = profiler.stop()
+
+    return Response(
+        SamplingProfiler.render_collapsed(stacks=stacks),
+        content_type="text/plain; charset=utf-8",
+    )
@@ -0,0 +1,54 @@
+import logging
+import threading
+from quart import Quart, g, request
+
+from .profiler_secret import has_profiler_secret
+from .sampling_profiler import SamplingProfiler
+
+logger = logging.getLogger(__name__)
+
+
+def add_request_profiling(app: Quart):
+    """Profiles the requests that carry the profiler secret header, logging their
+    collapsed stacks.
+
+    Only the event loop thread is sampled, but it also runs the other requests
+    being handled concurrently, so the profile is clearest on a quiet worker.
+    """
+
+    @app.before_request
+    async def start_request_profiling():
+        if request.blueprint == "profiling" or not has_profiler_secret():
+            return
+
+        g.request_profiler = SamplingProfiler(
+            interval_seconds=app.config["PROFILER_INTERVAL_SECONDS"],
+            thread_id=threading.get_ident(),
+        )
+        g.request_profiler.start()
+
+    @app.after_request
+    async def log_request_profile(response):
+        request_profiler = g.pop("request_profiler", None)
+
+        if request_profiler is None:
+            return response
+
+        stacks = request_profiler.stop()
+
+        logger.warning(
+            "profile of %s %s (%d samples):\n%s",
+            request.method,
+            request.path,
+            sum(stacks.values()),
+            SamplingProfiler.render_collapsed(stacks=stacks),
+        )
+
+        return response
+
+    @app.teardown_request
+    async def stop_request_profiling(exc):
+        request_profiler = g.pop("request_profiler", None)
+
+        if request_profiler is not None:
+            request_profiler.stop()
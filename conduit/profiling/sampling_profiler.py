@@ -0,0 +1,73 @@
+import collections
+import os
+import sys
+import threading
+from typing import Dict, Optional
+
+
+class SamplingProfiler:
+    """Samples the stacks of the running threads every interval_seconds from a
+    background thread, while started.
+
+    The samples are counted per collapsed stack, the format read by flamegraph
+    tools: the thread name and the frames from the outermost one, separated by
+    semicolons. Nothing runs while the profiler is stopped.
+    """
+
+    def __init__(
+        self, interval_seconds: float = 0.005, thread_id: Optional[int] = None
+    ):
+        self._interval_seconds = interval_seconds
+        self._thread_id = thread_id
+        self._stacks: Dict[str, int] = collections.Counter()
+        self._stopped = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+
+    def start(self):
+        self._sampler = threading.Thread(
+            target=self._sample, name="sampling-profiler", daemon=True
+        )
+        self._sampler.start()
+
+    def stop(self) -> Dict[str, int]:
+        self._stopped.set()
+        self._sampler.join()
+        return dict(self._stacks)
+
+    @staticmethod
+    def render_collapsed(stacks: Dict[str, int]) -> str:
+        return "".join(
+            f"{stack} {count}\n"
+            for stack, count in sorted(
+                stacks.items(), key=lambda item: item[1], reverse=True
+            )
+        )
+
+    def _sample(self):
+        sampler_thread_id = threading.get_ident()
+
+        while not self._stopped.wait(self._interval_seconds):
+            thread_names = {
+                thread.ident: thread.name for thread in threading.enumerate()
+            }
+
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == sampler_thread_id:
+                    continue
+
+                if self._thread_id is not None and thread_id != self._thread_id:
+                    continue
+
+                frames = []
+
+                while frame is not None:
+                    code = frame.f_code
+                    frames.append(
+                        f"{code.co_name} "
+                        f"({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                    )
+                    frame = frame.f_back
+
+                frames.append(thread_names.get(thread_id, str(thread_id)))
+
+                self._stacks[";".join(reversed(frames))] += 1
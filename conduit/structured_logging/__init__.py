@@ -0,0 +1,3 @@
+from .configure_logging import configure_logging
+from .json_formatter import JSONFormatter
+from .truncate_payload import truncate_payload
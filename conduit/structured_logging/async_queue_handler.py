@@ -0,0 +1,21 @@
+import logging
+import logging.handlers
+import queue
+
+
+class AsyncQueueHandler(logging.handlers.QueueHandler):
+    """Hands records to a QueueListener thread without formatting them.
+
+    logging.handlers.QueueHandler formats the message, arguments and traceback
+    when enqueuing, which would do that work on the event loop; here it is left
+    to the listener's handlers. When the queue is full, records are dropped.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
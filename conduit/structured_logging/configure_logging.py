@@ -0,0 +1,39 @@
+import logging
+import logging.handlers
+import queue
+import sys
+from quart import Quart
+from quart.logging import default_handler
+
+from .async_queue_handler import AsyncQueueHandler
+from .json_formatter import JSONFormatter
+from .request_context_filter import RequestContextFilter
+
+
+def configure_logging(app: Quart) -> logging.handlers.QueueListener:
+    """Sends the app logs, as JSON lines, to stdout from a background thread.
+
+    Returns the listener writing them, to be started when serving.
+    """
+    log_queue = queue.Queue(maxsize=app.config["LOG_QUEUE_SIZE"])
+
+    queue_handler = AsyncQueueHandler(log_queue)
+    queue_handler.addFilter(
+        RequestContextFilter(
+            sample_ratios=app.config["LOG_SAMPLE_RATIOS"],
+            default_sample_ratio=app.config["LOG_SAMPLE_RATIO"],
+        )
+    )
+
+    stream_handler = logging.StreamHandler(stream=sys.stdout)
+    stream_handler.setFormatter(
+        JSONFormatter(max_payload_length=app.config["LOG_MAX_PAYLOAD_LENGTH"])
+    )
+
+    app.logger.removeHandler(default_handler)
+    app.logger.addHandler(queue_handler)
+    app.logger.setLevel(app.config["LOG_LEVEL"])
+
+    return logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
@@ -0,0 +1,64 @@
+import datetime
+import json
+import logging
+
+from .truncate_payload import truncate_payload
+
+_RECORD_CONTEXT_ATTRIBUTES = ("route", "method", "path", "trace_id", "span_id")
+
+
+class JSONFormatter(logging.Formatter):
+    """Formats records as JSON lines.
+
+    The message arguments are truncated with truncate_payload before being
+    interpolated, and the records context attributes, set by RequestContextFilter,
+    are added as fields.
+    """
+
+    def __init__(self, max_payload_length: int):
+        super().__init__()
+        self._max_payload_length = max_payload_length
+
+    def format(self, record: logging.LogRecord) -> str:
+        log = {
+            "timestamp": datetime.datetime.fromtimestamp(
+                record.created, tz=datetime.timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": self._get_message(record=record),
+        }
+
+        for attribute in _RECORD_CONTEXT_ATTRIBUTES:
+            value = getattr(record, attribute, None)
+
+            if value is not None:
+                log[attribute] = value
+
+        if record.exc_info:
+            log["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log["exception"] = record.exc_text
+
+        if record.stack_info:
+            log["stack"] = self.formatStack(record.stack_info)
+
+        return json.dumps(log, default=str)
+
+    def _get_message(self, record: logging.LogRecord) -> str:
+        message = str(record.msg)
+
+        if not record.args:
+            return message
+
+        if isinstance(record.args, dict):
+            args = truncate_payload(record.args, self._max_payload_length)
+        else:
+            args = tuple(
+                truncate_payload(arg, self._max_payload_length) for arg in record.args
+            )
+
+        try:
+            return message % args
+        except (TypeError, ValueError):
+            return f"{message} {args}"
@@ -0,0 +1,48 @@
+import logging
+import random
+from typing import Dict
+
+from quart import has_request_context, request
+
+from ..tracing import get_current_span
+
+
+class RequestContextFilter(logging.Filter):
+    """Adds the request route, method, path and trace ids to the records logged
+    while handling a request, and samples them per route.
+
+    Records below WARNING logged by a route are kept with the probability
+    configured for it in sample_ratios, or default_sample_ratio.
+
+    It runs when the record is logged, so it reads the request and trace before
+    the record is handed to another thread.
+    """
+
+    def __init__(self, sample_ratios: Dict[str, float], default_sample_ratio: float):
+        super().__init__()
+        self._sample_ratios = sample_ratios
+        self._default_sample_ratio = default_sample_ratio
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not has_request_context():
+            return True
+
+        route = request.endpoint or "unmatched"
+
+        if record.levelno < logging.WARNING:
+            sample_ratio = self._sample_ratios.get(route, self._default_sample_ratio)
+
+            if sample_ratio < 1 and random.random() >= sample_ratio:
+                return False
+
+        record.route = route
+        record.method = request.method
+        record.path = request.path
+
+        span = get_current_span()
+
+        if span is not None:
+            record.trace_id = span.trace_id
+            record.span_id = span.span_id
+
+        return True
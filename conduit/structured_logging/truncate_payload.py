@@ -0,0 +1,41 @@
+import dataclasses
+from typing import Any
+
+
+def truncate_payload(value: Any, max_length: int) -> Any:
+    """Returns a copy of value whose strings and sequences are cut to max_length.
+
+    Dataclasses, such as request payloads, are turned into dicts so their fields
+    are cut too, instead of being formatted whole by their repr.
+    """
+    if isinstance(value, (str, bytes)):
+        if len(value) <= max_length:
+            return value
+
+        return f"{value[:max_length]!s}... ({len(value)} long)"
+
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            field.name: truncate_payload(getattr(value, field.name), max_length)
+            for field in dataclasses.fields(value)
+        }
+
+    if isinstance(value, dict):
+        return {
+            key: truncate_payload(item, max_length)
+            for key, item in list(value.items())[:max_length]
+        }
+
+    if isinstance(value, (list, tuple, set)):
+        items = list(value)
+
+        truncated_items = [
+            truncate_payload(item, max_length) for item in items[:max_length]
+        ]
+
+        if len(items) > max_length:
+            truncated_items.append(f"... ({len(items)} items)")
+
+        return truncated_items
+
+    return value
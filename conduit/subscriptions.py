@@ -0,0 +1,109 @@
+import asyncio
+import contextlib
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set
+
+from .metrics import MetricsRegistry
+
+
+class Event(NamedTuple):
+    name: str
+    # The event's JSON, encoded once however many subscribers it is sent to.
+    data: str
+
+
+class Subscription:
+    """A subscriber's bounded queue of messages.
+
+    A subscriber reading slower than events are published would otherwise make
+    its queue, and the worker's memory, grow without bounds. So when its queue
+    overflows, the queued events are discarded and get returns None, telling
+    the subscriber to disconnect.
+    """
+
+    __slots__ = ("_queue", "overflowed")
+
+    def __init__(self, max_size: int):
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        self.overflowed = False
+
+    def publish(self, event: Event) -> bool:
+        """Queues event, returning False if the queue overflowed."""
+        if self.overflowed:
+            return False
+
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+            while not self._queue.empty():
+                self._queue.get_nowait()
+
+            self._queue.put_nowait(None)
+
+            return False
+
+        return True
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Event]:
+        """Waits for the next event, or returns None if the queue overflowed.
+
+        Raises asyncio.TimeoutError if no event is published within timeout.
+        """
+        return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+
+
+class Subscriptions:
+    """The subscriptions of a worker's connections to a stream, by key, such as
+    the subscribed user or article id.
+
+    An idle subscription is only its queue and its entry here, so a worker can
+    hold many of them.
+    """
+
+    def __init__(self, name: str, queue_size: int, metrics_registry: MetricsRegistry):
+        self.name = name
+        self.queue_size = queue_size
+        self._subscriptions: Dict[str, Set[Subscription]] = {}
+        self._subscriptions_count = metrics_registry.gauge(
+            name="stream_subscriptions",
+            documentation="Connections subscribed to a stream.",
+            label_names=("stream",),
+        )
+        self._dropped_subscriptions_total = metrics_registry.counter(
+            name="stream_dropped_subscriptions_total",
+            documentation="Subscriptions dropped because their queue overflowed.",
+            label_names=("stream",),
+        )
+
+    @contextlib.contextmanager
+    def subscribe(self, key: str) -> Iterator[Subscription]:
+        subscription = Subscription(max_size=self.queue_size)
+
+        self._subscriptions.setdefault(str(key), set()).add(subscription)
+        self._subscriptions_count.inc(stream=self.name)
+
+        try:
+            yield subscription
+        finally:
+            key_subscriptions = self._subscriptions.get(str(key), set())
+            key_subscriptions.discard(subscription)
+
+            if not key_subscriptions:
+                self._subscriptions.pop(str(key), None)
+
+            self._subscriptions_count.dec(stream=self.name)
+
+    def keys(self) -> List[str]:
+        return list(self._subscriptions)
+
+    def has_subscriptions(self, key: str) -> bool:
+        return str(key) in self._subscriptions
+
+    def publish(self, key: str, event: Event):
+        for subscription in list(self._subscriptions.get(str(key), ())):
+            if subscription.overflowed:
+                continue
+
+            if not subscription.publish(event):
+                self._dropped_subscriptions_total.inc(stream=self.name)
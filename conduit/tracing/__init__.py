@@ -0,0 +1,7 @@
+from .otlp_http_exporter import OtlpHttpExporter
+from .span import Span
+from .span_exporter import SpanExporter
+from .spans import get_current_span, record_span, start_span, traced
+from .stdout_jsonl_exporter import StdoutJsonlExporter
+from .tracer import Tracer
+from .request_tracing import add_request_tracing
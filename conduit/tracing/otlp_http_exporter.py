@@ -0,0 +1,90 @@
+import json
+import urllib.request
+from typing import Any, Dict, List
+
+from .span import Span
+from .span_exporter import SpanExporter
+
+_STATUS_CODE_UNSET = 0
+_STATUS_CODE_ERROR = 2
+
+
+class OtlpHttpExporter(SpanExporter):
+    """Posts spans to an OpenTelemetry collector with OTLP/HTTP in JSON encoding."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        service_name: str,
+        timeout_seconds: float = 10,
+        max_queue_size: int = 1000,
+    ):
+        super().__init__(max_queue_size=max_queue_size)
+        self._endpoint = endpoint
+        self._service_name = service_name
+        self._timeout_seconds = timeout_seconds
+
+    def _export_spans(self, spans: List[Span]):
+        export_trace_service_request = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            self._attribute(
+                                key="service.name", value=self._service_name
+                            )
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "conduit"},
+                            "spans": [self._span(span=span) for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+        request = urllib.request.Request(
+            self._endpoint,
+            data=json.dumps(export_trace_service_request).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+
+        with urllib.request.urlopen(request, timeout=self._timeout_seconds):
+            pass
+
+    def _span(self, span: Span) -> Dict[str, Any]:
+        otlp_span = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "startTimeUnixNano": str(span.start_time_unix_nano),
+            "endTimeUnixNano": str(span.end_time_unix_nano),
+            "attributes": [
+                self._attribute(key=key, value=value)
+                for key, value in span.attributes.items()
+            ],
+            "status": {
+                "code": _STATUS_CODE_ERROR if span.error else _STATUS_CODE_UNSET
+            },
+        }
+
+        if span.parent_span_id:
+            otlp_span["parentSpanId"] = span.parent_span_id
+
+        return otlp_span
+
+    @staticmethod
+    def _attribute(key: str, value: Any) -> Dict[str, Any]:
+        if isinstance(value, bool):
+            otlp_value = {"boolValue": value}
+        elif isinstance(value, int):
+            otlp_value = {"intValue": str(value)}
+        elif isinstance(value, float):
+            otlp_value = {"doubleValue": value}
+        else:
+            otlp_value = {"stringValue": str(value)}
+
+        return {"key": key, "value": otlp_value}
@@ -0,0 +1,48 @@
+import time
+from quart import Quart, request
+
+from .spans import get_current_span, record_span
+from .tracer import Tracer
+from .tracing_json_provider import TracingJSONProvider
+from .tracing_middleware import TracingMiddleware
+from ..database import ExecutedQuery, QueryInstrumentation, normalize_statement
+
+
+def add_request_tracing(
+    app: Quart, tracer: Tracer, query_instrumentation: QueryInstrumentation
+):
+    """Traces the app requests: the request itself, its SQL statements, the JSON
+    serialization and the response write. Services are traced with traced.
+    """
+    app.asgi_app = TracingMiddleware(asgi_app=app.asgi_app, tracer=tracer)
+
+    app.json = TracingJSONProvider(app=app, json_provider=app.json)
+
+    @app.before_request
+    async def name_request_span():
+        span = get_current_span()
+
+        if span is None:
+            return
+
+        span.name = f"{request.method} {request.endpoint or 'unmatched'}"
+
+        if request.url_rule:
+            span.attributes["http.route"] = request.url_rule.rule
+
+    def record_query_span(executed_query: ExecutedQuery):
+        end_time_unix_nano = time.time_ns()
+
+        record_span(
+            name="sql",
+            start_time_unix_nano=end_time_unix_nano
+            - int(executed_query.duration_seconds * 1e9),
+            end_time_unix_nano=end_time_unix_nano,
+            **{
+                "db.statement": normalize_statement(executed_query.statement),
+                "db.fingerprint": executed_query.fingerprint,
+                "db.rows": executed_query.rows,
+            },
+        )
+
+    query_instrumentation.add_listener(record_query_span)
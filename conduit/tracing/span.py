@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: Optional[str]
+    start_time_unix_nano: int
+    end_time_unix_nano: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: bool = False
@@ -0,0 +1,68 @@
+import abc
+import logging
+import queue
+import threading
+from typing import List, Optional
+
+from .span import Span
+
+logger = logging.getLogger(__name__)
+
+
+class SpanExporter(abc.ABC):
+    """Exports spans from a background thread, so that writing them never blocks
+    the event loop.
+
+    Subclasses implement _export_spans. When the queue is full, spans are dropped.
+    """
+
+    def __init__(self, max_queue_size: int = 1000):
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]):
+        self._ensure_started()
+
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            logger.warning("dropping %d spans: export queue is full", len(spans))
+
+    def shutdown(self):
+        with self._lock:
+            if self._thread is None:
+                return
+
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=self.__class__.__name__, daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            spans = self._queue.get()
+
+            if spans is None:
+                return
+
+            try:
+                self._export_spans(spans)
+            except Exception as e:
+                logger.warning(
+                    "could not export %d spans: %s", len(spans), e.__class__.__name__
+                )
+
+    @abc.abstractmethod
+    def _export_spans(self, spans: List[Span]):
+        pass
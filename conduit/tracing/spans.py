@@ -0,0 +1,140 @@
+import contextlib
+import contextvars
+import functools
+import inspect
+import time
+from typing import Iterator, Optional, Tuple
+
+from .span import Span
+from .trace import Trace, generate_span_id
+
+_current_span: contextvars.ContextVar[
+    Optional[Tuple[Trace, Span]]
+] = contextvars.ContextVar("current_span", default=None)
+
+
+def get_current_span() -> Optional[Span]:
+    current_span = _current_span.get()
+
+    if current_span is None:
+        return None
+
+    _, span = current_span
+
+    return span
+
+
+@contextlib.contextmanager
+def start_span(
+    name: str, trace: Optional[Trace] = None, **attributes
+) -> Iterator[Optional[Span]]:
+    """Records the block as a child span of the current span.
+
+    Outside of a sampled trace, unless one is given, it records nothing.
+    """
+    current_span = _current_span.get()
+
+    if trace is not None:
+        parent_span_id = trace.parent_span_id
+    elif current_span is not None:
+        trace, parent_span = current_span
+        parent_span_id = parent_span.span_id
+    else:
+        yield None
+        return
+
+    span = Span(
+        name=name,
+        trace_id=trace.trace_id,
+        span_id=generate_span_id(),
+        parent_span_id=parent_span_id,
+        start_time_unix_nano=time.time_ns(),
+        attributes=attributes,
+    )
+
+    token = _current_span.set((trace, span))
+
+    try:
+        yield span
+    except BaseException as e:
+        span.error = True
+        span.attributes["exception.type"] = e.__class__.__name__
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end_time_unix_nano = time.time_ns()
+        trace.spans.append(span)
+
+
+def record_span(
+    name: str, start_time_unix_nano: int, end_time_unix_nano: int, **attributes
+):
+    """Records a child span of the current span that has already completed."""
+    current_span = _current_span.get()
+
+    if current_span is None:
+        return
+
+    trace, parent_span = current_span
+
+    trace.spans.append(
+        Span(
+            name=name,
+            trace_id=trace.trace_id,
+            span_id=generate_span_id(),
+            parent_span_id=parent_span.span_id,
+            start_time_unix_nano=start_time_unix_nano,
+            end_time_unix_nano=end_time_unix_nano,
+            attributes=attributes,
+        )
+    )
+
+
+def traced(cls):
+    """Records a span named after the class and method for each call to the
+    class's public async methods.
+    """
+    for name, method in list(vars(cls).items()):
+        if name.startswith("_"):
+            continue
+
+        span_name = f"{cls.__name__}.{name}"
+
+        if inspect.isasyncgenfunction(method):
+            setattr(cls, name, _trace_async_generator(span_name, method))
+        elif inspect.iscoroutinefunction(method):
+            setattr(cls, name, _trace_coroutine(span_name, method))
+
+    return cls
+
+
+def _trace_coroutine(span_name: str, method):
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        if _current_span.get() is None:
+            return await method(*args, **kwargs)
+
+        with start_span(span_name):
+            return await method(*args, **kwargs)
+
+    return wrapper
+
+
+def _trace_async_generator(span_name: str, method):
+    # Async generators can be resumed from other contexts, so their span is not
+    # made current, and it is recorded once they are exhausted or closed.
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        start_time_unix_nano = time.time_ns()
+
+        try:
+            async for item in method(*args, **kwargs):
+                yield item
+        finally:
+            record_span(
+                name=span_name,
+                start_time_unix_nano=start_time_unix_nano,
+                end_time_unix_nano=time.time_ns(),
+            )
+
+    return wrapper
@@ -0,0 +1,32 @@
+import json
+import sys
+from typing import List
+
+from .span import Span
+from .span_exporter import SpanExporter
+
+
+class StdoutJsonlExporter(SpanExporter):
+    """Writes each span as a JSON line to stdout."""
+
+    def _export_spans(self, spans: List[Span]):
+        sys.stdout.write(
+            "".join(
+                json.dumps(
+                    {
+                        "name": span.name,
+                        "traceId": span.trace_id,
+                        "spanId": span.span_id,
+                        "parentSpanId": span.parent_span_id,
+                        "startTimeUnixNano": span.start_time_unix_nano,
+                        "endTimeUnixNano": span.end_time_unix_nano,
+                        "attributes": span.attributes,
+                        "error": span.error,
+                    },
+                    default=str,
+                )
+                + "\n"
+                for span in spans
+            )
+        )
+        sys.stdout.flush()
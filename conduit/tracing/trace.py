@@ -0,0 +1,21 @@
+import random
+from typing import List, Optional
+
+from .span import Span
+
+
+def generate_trace_id() -> str:
+    return f"{random.getrandbits(128):032x}"
+
+
+def generate_span_id() -> str:
+    return f"{random.getrandbits(64):016x}"
+
+
+class Trace:
+    """The spans of a sampled request, exported together once it completes."""
+
+    def __init__(self, trace_id: str, parent_span_id: Optional[str] = None):
+        self.trace_id = trace_id
+        self.parent_span_id = parent_span_id
+        self.spans: List[Span] = []
@@ -0,0 +1,50 @@
+import random
+import re
+from typing import Optional
+
+from .span import Span
+from .span_exporter import SpanExporter
+from .trace import Trace, generate_trace_id
+
+_traceparent_pattern = re.compile(
+    r"^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$"
+)
+
+
+class Tracer:
+    """Decides which requests are traced and exports their spans.
+
+    A request carrying a W3C traceparent header continues that trace, and is
+    traced if the caller sampled it. Other requests start a new trace, sampled
+    with probability sample_ratio.
+    """
+
+    def __init__(self, exporter: SpanExporter, sample_ratio: float):
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+
+    def start_trace(self, traceparent: Optional[str] = None) -> Optional[Trace]:
+        if traceparent:
+            match = _traceparent_pattern.match(traceparent.strip().lower())
+
+            if match:
+                trace_id, parent_span_id, trace_flags = match.groups()
+
+                if trace_id != "0" * 32 and parent_span_id != "0" * 16:
+                    if not int(trace_flags, 16) & 1:
+                        return None
+
+                    return Trace(trace_id=trace_id, parent_span_id=parent_span_id)
+
+        if random.random() >= self.sample_ratio:
+            return None
+
+        return Trace(trace_id=generate_trace_id())
+
+    def end_trace(self, trace: Trace):
+        if trace.spans:
+            self.exporter.export(spans=trace.spans)
+
+    @staticmethod
+    def format_traceparent(span: Span) -> str:
+        return f"00-{span.trace_id}-{span.span_id}-01"
@@ -0,0 +1,25 @@
+from typing import Any
+from quart import Quart, Response
+from quart.json.provider import JSONProvider
+
+from .spans import start_span
+
+
+class TracingJSONProvider(JSONProvider):
+    """Delegates to the app's JSON provider, recording a span for serializing each
+    response.
+    """
+
+    def __init__(self, app: Quart, json_provider: JSONProvider):
+        super().__init__(app)
+        self._json_provider = json_provider
+
+    def dumps(self, object_: Any, **kwargs: Any) -> str:
+        return self._json_provider.dumps(object_, **kwargs)
+
+    def loads(self, object_: Any, **kwargs: Any) -> Any:
+        return self._json_provider.loads(object_, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        with start_span("serialize"):
+            return self._json_provider.response(*args, **kwargs)
@@ -0,0 +1,68 @@
+import time
+
+from .spans import record_span, start_span
+from .tracer import Tracer
+
+
+class TracingMiddleware:
+    """ASGI middleware recording a root span for each traced HTTP request, and a
+    span for writing its response.
+
+    The traceparent of the root span is returned in the response headers.
+    """
+
+    def __init__(self, asgi_app, tracer: Tracer):
+        self._asgi_app = asgi_app
+        self._tracer = tracer
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self._asgi_app(scope, receive, send)
+
+        traceparent = None
+
+        for header_name, header_value in scope["headers"]:
+            if header_name == b"traceparent":
+                traceparent = header_value.decode("latin-1")
+
+        trace = self._tracer.start_trace(traceparent=traceparent)
+
+        if trace is None:
+            return await self._asgi_app(scope, receive, send)
+
+        with start_span(
+            f"{scope['method']} {scope['path']}",
+            trace=trace,
+            **{"http.method": scope["method"], "http.target": scope["path"]},
+        ) as span:
+            response_write_started_at = None
+
+            async def traced_send(message):
+                nonlocal response_write_started_at
+
+                if message["type"] == "http.response.start":
+                    span.attributes["http.status_code"] = message["status"]
+                    traceparent_header = self._tracer.format_traceparent(span=span)
+                    message = {
+                        **message,
+                        "headers": [
+                            *message.get("headers", []),
+                            (b"traceparent", traceparent_header.encode()),
+                        ],
+                    }
+                    response_write_started_at = time.time_ns()
+
+                await send(message)
+
+                if message["type"] == "http.response.body" and not message.get(
+                    "more_body"
+                ):
+                    record_span(
+                        name="response.write",
+                        start_time_unix_nano=response_write_started_at,
+                        end_time_unix_nano=time.time_ns(),
+                    )
+
+            await self._asgi_app(scope, receive, traced_send)
+
+        self._tracer.end_trace(trace=trace)
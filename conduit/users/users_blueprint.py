@@ -16,7 +16,9 @@ users_blueprint = Blueprint("users", __name__, url_prefix="/api")
 @validate_response(model_class=UserResponse, status_code=HTTPStatus.CREATED)
 async def register_user(data: RegisterUserRequest) -> (UserResponse, int):
     current_app.logger.info(
-        f"received register user request. username: {data.user.username}, email: {data.user.email}"
+        "received register user request. username: %s, email: %s",
+        data.user.username,
+        data.user.email,
     )
 
     user = await current_app.users_service.register_user(
@@ -25,7 +27,7 @@ async def register_user(data: RegisterUserRequest) -> (UserResponse, int):
         password=data.user.password,
     )
 
-    current_app.logger.info(f"user registered! {user}")
+    current_app.logger.info("user registered! %s", user)
 
     token = create_access_token(user=user)
 
@@ -47,7 +49,7 @@ async def register_user(data: RegisterUserRequest) -> (UserResponse, int):
 @validate_request(model_class=LoginRequest)
 @validate_response(model_class=UserResponse)
 async def login(data: LoginRequest) -> (UserResponse, int):
-    current_app.logger.info(f"received login request. email: {data.user.email}")
+    current_app.logger.info("received login request. email: %s", data.user.email)
 
     is_correct_password = await current_app.users_service.verify_password_by_email(
         email=data.user.email,
@@ -59,7 +61,7 @@ async def login(data: LoginRequest) -> (UserResponse, int):
 
     user = await current_app.users_service.get_user_by_email(email=data.user.email)
 
-    current_app.logger.info(f"login successful! {user}")
+    current_app.logger.info("login successful! %s", user)
 
     token = create_access_token(user=user)
 
@@ -115,7 +117,12 @@ async def update_user(data: UpdateUserRequest) -> (UserResponse, int):
         raise UnauthorizedException(f"username {username} not found")
 
     current_app.logger.info(
-        f"received update user request. id: {user.id}, username: {data.user.username}, email:{data.user.email}, bio: {data.user.bio}, image: {data.user.image}"
+        "received update user request. id: %s, username: %s, email:%s, bio: %s, image: %s",
+        user.id,
+        data.user.username,
+        data.user.email,
+        data.user.bio,
+        data.user.image,
     )
 
     updated_user = await current_app.users_service.update_user(
@@ -127,7 +134,7 @@ async def update_user(data: UpdateUserRequest) -> (UserResponse, int):
         image=data.user.image,
     )
 
-    current_app.logger.info(f"user updated! {updated_user}")
+    current_app.logger.info("user updated! %s", updated_user)
 
     token = get_jwt_token(request=request)
 
@@ -3,14 +3,18 @@ import validators
 from typing import Optional
 from werkzeug.security import generate_password_hash, check_password_hash
 from .user import User
+from ..database import ConnectionRouter, read_only, read_write
 from ..exceptions import AlreadyExistsException
+from ..tracing import traced
 
 
+@traced
 class UsersService:
-    def __init__(self, aconn: psycopg.AsyncConnection):
+    def __init__(self, aconn: ConnectionRouter):
         self._aconn = aconn
         self._users_table = "users"
 
+    @read_write
     async def register_user(self, username: str, email: str, password: str) -> User:
         self._validate_email(email=email)
 
@@ -51,6 +55,7 @@ class UsersService:
 
         return user
 
+    @read_only
     async def get_user_by_id(self, id: str) -> Optional[User]:
         async with self._aconn.cursor() as acur:
             get_user_by_email_query = f"""
@@ -78,6 +83,7 @@ class UsersService:
 
         return user
 
+    @read_only
     async def get_user_by_username(self, username: str) -> Optional[User]:
         async with self._aconn.cursor() as acur:
             get_user_by_username_query = f"""
@@ -105,6 +111,7 @@ class UsersService:
 
         return user
 
+    @read_only
     async def get_user_by_email(self, email: str) -> Optional[User]:
         async with self._aconn.cursor() as acur:
             get_user_by_email_query = f"""
@@ -132,6 +139,7 @@ class UsersService:
 
         return user
 
+    @read_write
     async def update_user(
         self,
         user_id: str,
@@ -238,6 +246,7 @@ class UsersService:
         else:
             return await self.get_user_by_id(id=user_id)
 
+    @read_only
     async def verify_password_by_email(self, email: str, password: str) -> bool:
         async with self._aconn.cursor() as acur:
             get_password_hash_query = f"""
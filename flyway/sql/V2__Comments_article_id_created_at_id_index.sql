@@ -0,0 +1,3 @@
+CREATE INDEX IF NOT EXISTS comments_article_id_created_at_id_idx
+ON comments(article_id, created_at DESC, id DESC)
+WHERE deleted_at IS NULL;
@@ -0,0 +1,10 @@
+ALTER TABLE articles ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+GENERATED ALWAYS AS (
+  setweight(to_tsvector('english', title), 'A') ||
+  setweight(to_tsvector('english', description), 'B') ||
+  setweight(to_tsvector('english', body), 'C')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS articles_search_vector_idx
+ON articles USING GIN (search_vector)
+WHERE deleted_at IS NULL;
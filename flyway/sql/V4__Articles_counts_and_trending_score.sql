@@ -0,0 +1,30 @@
+ALTER TABLE articles
+  ADD COLUMN IF NOT EXISTS favorites_count INTEGER NOT NULL DEFAULT 0,
+  ADD COLUMN IF NOT EXISTS comments_count INTEGER NOT NULL DEFAULT 0,
+  ADD COLUMN IF NOT EXISTS trending_score DOUBLE PRECISION NOT NULL DEFAULT 0;
+
+UPDATE articles a
+SET favorites_count = (
+    SELECT COUNT(*) FROM favorites f
+    WHERE f.article_id = a.id
+    AND f.deleted_at IS NULL
+  ),
+  comments_count = (
+    SELECT COUNT(*) FROM comments c
+    WHERE c.article_id = a.id
+    AND c.deleted_at IS NULL
+  );
+
+-- Same as ArticlesService's trending score. The application keeps it up to date.
+UPDATE articles
+SET trending_score = (favorites_count + 2 * comments_count)
+  / POWER(EXTRACT(EPOCH FROM current_timestamp - created_at) / 3600 + 2, 1.8)
+WHERE created_at > current_timestamp - INTERVAL '30 days';
+
+CREATE INDEX IF NOT EXISTS articles_trending_score_created_at_idx
+ON articles(trending_score DESC, created_at DESC)
+WHERE deleted_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS articles_favorites_count_created_at_idx
+ON articles(favorites_count DESC, created_at DESC)
+WHERE deleted_at IS NULL;
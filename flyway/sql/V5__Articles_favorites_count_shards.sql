@@ -0,0 +1,10 @@
+-- Favorites count deltas of hot articles, spread over several rows per article so
+-- concurrent favorites do not wait on each other for the article's row. The
+-- application adds them to articles.favorites_count when reading it, and
+-- periodically rolls them up into it.
+CREATE TABLE IF NOT EXISTS articles_favorites_count_shards(
+  article_id UUID NOT NULL references articles(id) ON DELETE CASCADE,
+  shard SMALLINT NOT NULL,
+  delta INTEGER NOT NULL DEFAULT 0,
+  PRIMARY KEY(article_id, shard)
+);
@@ -0,0 +1,162 @@
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import time
+from typing import Dict
+
+from .git import get_git_commit
+from .http_client import HttpClient
+from .runner import run_closed_loop, run_open_loop
+from .stats import OperationStats
+from .traffic import DEFAULT_MIX, ConduitTraffic
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """Parses a traffic mix such as "list_articles=30,feed=10"."""
+    operation_weights = {}
+
+    for operation_weight in mix.split(","):
+        operation_name, weight = operation_weight.split("=")
+        operation_weights[operation_name.strip()] = float(weight)
+
+    return operation_weights
+
+
+def print_results(results: dict):
+    print(
+        f"{'operation':<16}{'requests':>10}{'errors':>8}{'dropped':>9}{'req/s':>10}"
+        f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    )
+
+    for operation_name, operation in sorted(results["operations"].items()):
+        latency_seconds = operation["latency_seconds"]
+        percentiles = [
+            f"{latency_seconds[percentile] * 1000:>10.1f}"
+            if latency_seconds[percentile] is not None
+            else f"{'-':>10}"
+            for percentile in ("p50", "p95", "p99")
+        ]
+        print(
+            f"{operation_name:<16}{operation['requests']:>10}{operation['errors']:>8}"
+            f"{operation['dropped']:>9}"
+            f"{operation['throughput_per_second']:>10.1f}{''.join(percentiles)}"
+        )
+
+    print(
+        f"{'total':<16}{results['requests']:>10}{results['errors']:>8}"
+        f"{results['dropped']:>9}{results['throughput_per_second']:>10.1f}"
+    )
+
+
+async def main(args: argparse.Namespace) -> dict:
+    client = HttpClient(base_url=args.url)
+
+    try:
+        traffic = ConduitTraffic(client=client, mix=args.mix, seed=args.seed)
+
+        await traffic.setup(
+            users_count=args.users,
+            articles_per_user=args.articles_per_user,
+            follows_per_user=args.follows_per_user,
+        )
+
+        stats: Dict[str, OperationStats] = {}
+
+        started_at = datetime.datetime.now(datetime.timezone.utc)
+        started_at_seconds = time.perf_counter()
+
+        if args.mode == "open":
+            await run_open_loop(
+                traffic=traffic,
+                stats=stats,
+                rate_per_second=args.rate,
+                duration_seconds=args.duration,
+                max_in_flight=args.max_in_flight,
+            )
+        else:
+            await run_closed_loop(
+                traffic=traffic,
+                stats=stats,
+                concurrency=args.concurrency,
+                duration_seconds=args.duration,
+            )
+
+        duration_seconds = time.perf_counter() - started_at_seconds
+    finally:
+        await client.close()
+
+    operations = {
+        operation_name: operation_stats.summarize(duration_seconds=duration_seconds)
+        for operation_name, operation_stats in stats.items()
+    }
+    requests_count = sum(operation["requests"] for operation in operations.values())
+
+    return {
+        "git_commit": get_git_commit(),
+        "started_at": started_at.isoformat(),
+        "config": {
+            "url": args.url,
+            "mode": args.mode,
+            "rate": args.rate,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "users": args.users,
+            "articles_per_user": args.articles_per_user,
+            "follows_per_user": args.follows_per_user,
+            "seed": args.seed,
+            "mix": args.mix,
+        },
+        "duration_seconds": duration_seconds,
+        "requests": requests_count,
+        "errors": sum(operation["errors"] for operation in operations.values()),
+        "dropped": sum(operation["dropped"] for operation in operations.values()),
+        "throughput_per_second": requests_count / duration_seconds,
+        "operations": operations,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="python -m load_test",
+        description="Replays a mix of Conduit API traffic against a running server.",
+    )
+    parser.add_argument(
+        "--url",
+        default=os.getenv("APIURL", "http://localhost:8080/api"),
+        help="API base URL (default: $APIURL or http://localhost:8080/api)",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["closed", "open"],
+        default="closed",
+        help="closed: --concurrency users send back to back; "
+        "open: --rate requests per second regardless of responses",
+    )
+    parser.add_argument("--rate", type=float, default=50)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--max-in-flight", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=30, help="seconds")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--articles-per-user", type=int, default=5)
+    parser.add_argument("--follows-per-user", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help=f"operation weights, e.g. list_articles=30,feed=10 "
+        f"(operations: {', '.join(DEFAULT_MIX)})",
+    )
+    parser.add_argument("--output", help="writes the results as JSON to this file")
+
+    args = parser.parse_args()
+
+    results = asyncio.run(main(args=args))
+
+    print_results(results=results)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
@@ -0,0 +1,14 @@
+import subprocess
+from typing import Optional
+
+
+def get_git_commit() -> Optional[str]:
+    """Returns the checked out commit, to tag results with, or None outside a git
+    checkout.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, check=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
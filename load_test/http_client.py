@@ -0,0 +1,139 @@
+import asyncio
+import json
+import ssl
+import urllib.parse
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class HttpResponse:
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class HttpClient:
+    """A minimal HTTP/1.1 client over asyncio streams, keeping connections alive
+    and reusing them across requests.
+    """
+
+    def __init__(self, base_url: str, timeout_seconds: float = 30):
+        parsed_url = urllib.parse.urlsplit(base_url)
+        self._host = parsed_url.hostname
+        self._port = parsed_url.port or (443 if parsed_url.scheme == "https" else 80)
+        self._ssl = (
+            ssl.create_default_context() if parsed_url.scheme == "https" else None
+        )
+        self._base_path = parsed_url.path.rstrip("/")
+        self._timeout_seconds = timeout_seconds
+        self._idle_connections: List[
+            Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+        ] = []
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        json_body: Optional[Any] = None,
+        token: Optional[str] = None,
+    ) -> HttpResponse:
+        headers = {"Host": self._host, "Connection": "keep-alive"}
+
+        body = b""
+
+        if json_body is not None:
+            body = json.dumps(json_body).encode()
+            headers["Content-Type"] = "application/json"
+
+        headers["Content-Length"] = str(len(body))
+
+        if token:
+            headers["Authorization"] = f"Token {token}"
+
+        request = (
+            f"{method} {self._base_path}{path} HTTP/1.1\r\n"
+            + "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+            + "\r\n"
+        ).encode() + body
+
+        reader, writer = await self._get_connection()
+
+        try:
+            writer.write(request)
+            await writer.drain()
+
+            response = await asyncio.wait_for(
+                self._read_response(reader=reader), timeout=self._timeout_seconds
+            )
+        except BaseException:
+            writer.close()
+            raise
+
+        if response.headers.get("connection", "").lower() == "close":
+            writer.close()
+        else:
+            self._idle_connections.append((reader, writer))
+
+        return response
+
+    async def close(self):
+        for _, writer in self._idle_connections:
+            writer.close()
+
+        self._idle_connections = []
+
+    async def _get_connection(
+        self,
+    ) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        while self._idle_connections:
+            reader, writer = self._idle_connections.pop()
+
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer
+
+            writer.close()
+
+        return await asyncio.open_connection(self._host, self._port, ssl=self._ssl)
+
+    @staticmethod
+    async def _read_response(reader: asyncio.StreamReader) -> HttpResponse:
+        status_line = await reader.readline()
+
+        if not status_line:
+            raise ConnectionError("connection closed by the server")
+
+        status = int(status_line.split(b" ", 2)[1])
+
+        headers = {}
+
+        while True:
+            header_line = await reader.readline()
+
+            if header_line in (b"\r\n", b"\n", b""):
+                break
+
+            name, _, value = header_line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+
+            while True:
+                chunk_size = int((await reader.readline()).split(b";")[0], 16)
+
+                if chunk_size == 0:
+                    await reader.readline()
+                    break
+
+                chunks.append(await reader.readexactly(chunk_size))
+                await reader.readline()
+
+            body = b"".join(chunks)
+        else:
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+        return HttpResponse(status=status, headers=headers, body=body)
@@ -0,0 +1,85 @@
+import asyncio
+import time
+from typing import Dict
+
+from .stats import OperationStats
+from .traffic import ConduitTraffic
+
+
+async def run_closed_loop(
+    traffic: ConduitTraffic,
+    stats: Dict[str, OperationStats],
+    concurrency: int,
+    duration_seconds: float,
+):
+    """Runs concurrency virtual users, each sending its next request as soon as
+    the previous one completes.
+    """
+    deadline = time.perf_counter() + duration_seconds
+
+    async def virtual_user():
+        while time.perf_counter() < deadline:
+            await _run_operation(
+                traffic=traffic, stats=stats, scheduled_at=time.perf_counter()
+            )
+
+    await asyncio.gather(*(virtual_user() for _ in range(concurrency)))
+
+
+async def run_open_loop(
+    traffic: ConduitTraffic,
+    stats: Dict[str, OperationStats],
+    rate_per_second: float,
+    duration_seconds: float,
+    max_in_flight: int,
+):
+    """Starts rate_per_second requests per second at fixed intervals, whether or
+    not the previous ones completed.
+
+    Latencies are measured from when each request was scheduled to start, so
+    time spent waiting behind a slow server is counted. Requests that would
+    exceed max_in_flight are not sent and are counted as dropped.
+    """
+    started_at = time.perf_counter()
+    requests_count = int(rate_per_second * duration_seconds)
+    in_flight = set()
+
+    for request_index in range(requests_count):
+        scheduled_at = started_at + request_index / rate_per_second
+
+        delay_seconds = scheduled_at - time.perf_counter()
+
+        if delay_seconds > 0:
+            await asyncio.sleep(delay_seconds)
+
+        if len(in_flight) >= max_in_flight:
+            operation_name, _ = traffic.next_operation()
+            stats.setdefault(operation_name, OperationStats()).record_dropped()
+            continue
+
+        task = asyncio.create_task(
+            _run_operation(traffic=traffic, stats=stats, scheduled_at=scheduled_at)
+        )
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+
+    if in_flight:
+        await asyncio.gather(*in_flight)
+
+
+async def _run_operation(
+    traffic: ConduitTraffic, stats: Dict[str, OperationStats], scheduled_at: float
+):
+    operation_name, operation = traffic.next_operation()
+
+    try:
+        response = await operation()
+        status = str(response.status)
+        error = response.status >= 400
+    except Exception as e:
+        status = e.__class__.__name__
+        error = True
+
+    stats.setdefault(operation_name, OperationStats()).record(
+        latency_seconds=time.perf_counter() - scheduled_at, status=status, error=error
+    )
@@ -0,0 +1,54 @@
+import collections
+import math
+from typing import Any, Dict, List
+
+
+class OperationStats:
+    def __init__(self):
+        self.latencies_seconds: List[float] = []
+        self.statuses: Dict[str, int] = collections.Counter()
+        self.errors = 0
+        self.dropped = 0
+
+    def record(self, latency_seconds: float, status: str, error: bool):
+        self.latencies_seconds.append(latency_seconds)
+        self.statuses[status] += 1
+
+        if error:
+            self.errors += 1
+
+    def record_dropped(self):
+        """Counts a request that was not sent, apart from the requests sent, so
+        that it does not count towards throughput or latencies.
+        """
+        self.dropped += 1
+
+    def summarize(self, duration_seconds: float) -> Dict[str, Any]:
+        latencies_seconds = sorted(self.latencies_seconds)
+
+        return {
+            "requests": len(latencies_seconds),
+            "errors": self.errors,
+            "dropped": self.dropped,
+            "throughput_per_second": len(latencies_seconds) / duration_seconds,
+            "statuses": dict(self.statuses),
+            "latency_seconds": {
+                "mean": sum(latencies_seconds) / len(latencies_seconds)
+                if latencies_seconds
+                else None,
+                "p50": percentile(latencies_seconds, 50),
+                "p95": percentile(latencies_seconds, 95),
+                "p99": percentile(latencies_seconds, 99),
+                "max": latencies_seconds[-1] if latencies_seconds else None,
+            },
+        }
+
+
+def percentile(sorted_values: List[float], percent: float):
+    """Nearest-rank percentile of the sorted values."""
+    if not sorted_values:
+        return None
+
+    rank = math.ceil(percent / 100 * len(sorted_values))
+
+    return sorted_values[max(rank, 1) - 1]
@@ -0,0 +1,188 @@
+import random
+import uuid
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List
+
+from .http_client import HttpClient, HttpResponse
+
+DEFAULT_MIX = {
+    "list_articles": 30,
+    "get_article": 20,
+    "list_comments": 10,
+    "get_tags": 5,
+    "feed": 15,
+    "favorite": 5,
+    "unfavorite": 5,
+    "add_comment": 4,
+    "login": 4,
+    "register": 2,
+}
+
+
+@dataclass
+class VirtualUser:
+    username: str
+    email: str
+    password: str
+    token: str
+
+
+class ConduitTraffic:
+    """Generates a mix of Conduit API requests from a pool of users and articles
+    created by setup.
+
+    Choices are drawn from a random generator seeded with seed, so a run with the
+    same seed and mix requests the same operations in the same order.
+    """
+
+    def __init__(self, client: HttpClient, mix: Dict[str, float], seed: int):
+        unknown_operations = set(mix) - set(DEFAULT_MIX)
+
+        if unknown_operations:
+            raise ValueError(f"unknown operations {sorted(unknown_operations)}")
+
+        self._client = client
+        self._operation_names = list(mix)
+        self._operation_weights = list(mix.values())
+        self._random = random.Random(seed)
+        self._run_id = uuid.uuid4().hex[:8]
+        self._registered_users_count = 0
+        self._users: List[VirtualUser] = []
+        self._slugs: List[str] = []
+
+    async def setup(
+        self, users_count: int, articles_per_user: int, follows_per_user: int
+    ):
+        for _ in range(users_count):
+            user, response = await self._register_user()
+            self._check(response=response, operation="register user")
+            self._users.append(user)
+
+        for user in self._users:
+            for _ in range(articles_per_user):
+                response = await self._client.request(
+                    "POST",
+                    "/articles",
+                    json_body={
+                        "article": {
+                            "title": f"load test {self._run_id} {self._random.random()}",
+                            "description": "load test article",
+                            "body": "load test article body " * 50,
+                            "tagList": self._random.sample(
+                                ["python", "quart", "sql", "performance", "asyncio"], 2
+                            ),
+                        }
+                    },
+                    token=user.token,
+                )
+                self._check(response=response, operation="create article")
+                self._slugs.append(response.json()["article"]["slug"])
+
+            followed_users = self._random.sample(
+                [other_user for other_user in self._users if other_user is not user],
+                min(follows_per_user, len(self._users) - 1),
+            )
+
+            for followed_user in followed_users:
+                response = await self._client.request(
+                    "POST",
+                    f"/profiles/{followed_user.username}/follow",
+                    token=user.token,
+                )
+                self._check(response=response, operation="follow user")
+
+    def next_operation(self) -> (str, Callable[[], Awaitable[HttpResponse]]):
+        operation_name = self._random.choices(
+            self._operation_names, weights=self._operation_weights
+        )[0]
+
+        return operation_name, getattr(self, f"_{operation_name}")
+
+    async def _list_articles(self) -> HttpResponse:
+        offset = self._random.randrange(0, max(len(self._slugs), 1))
+        return await self._client.request("GET", f"/articles?limit=20&offset={offset}")
+
+    async def _get_article(self) -> HttpResponse:
+        return await self._client.request("GET", f"/articles/{self._slug()}")
+
+    async def _list_comments(self) -> HttpResponse:
+        return await self._client.request("GET", f"/articles/{self._slug()}/comments")
+
+    async def _get_tags(self) -> HttpResponse:
+        return await self._client.request("GET", "/tags")
+
+    async def _feed(self) -> HttpResponse:
+        return await self._client.request(
+            "GET", "/articles/feed", token=self._user().token
+        )
+
+    async def _favorite(self) -> HttpResponse:
+        return await self._client.request(
+            "POST", f"/articles/{self._slug()}/favorite", token=self._user().token
+        )
+
+    async def _unfavorite(self) -> HttpResponse:
+        return await self._client.request(
+            "DELETE", f"/articles/{self._slug()}/favorite", token=self._user().token
+        )
+
+    async def _add_comment(self) -> HttpResponse:
+        return await self._client.request(
+            "POST",
+            f"/articles/{self._slug()}/comments",
+            json_body={
+                "comment": {"body": f"load test comment {self._random.random()}"}
+            },
+            token=self._user().token,
+        )
+
+    async def _login(self) -> HttpResponse:
+        user = self._user()
+        return await self._client.request(
+            "POST",
+            "/users/login",
+            json_body={"user": {"email": user.email, "password": user.password}},
+        )
+
+    async def _register(self) -> HttpResponse:
+        return (await self._register_user())[1]
+
+    async def _register_user(self) -> (VirtualUser, HttpResponse):
+        self._registered_users_count += 1
+
+        username = f"load-test-{self._run_id}-{self._registered_users_count}"
+        email = f"{username}@example.com"
+        password = uuid.uuid4().hex
+
+        response = await self._client.request(
+            "POST",
+            "/users",
+            json_body={
+                "user": {"username": username, "email": email, "password": password}
+            },
+        )
+
+        if response.status >= 400:
+            return None, response
+
+        user = VirtualUser(
+            username=username,
+            email=email,
+            password=password,
+            token=response.json()["user"]["token"],
+        )
+
+        return user, response
+
+    def _user(self) -> VirtualUser:
+        return self._random.choice(self._users)
+
+    def _slug(self) -> str:
+        return self._random.choice(self._slugs)
+
+    @staticmethod
+    def _check(response: HttpResponse, operation: str):
+        if response.status >= 400:
+            raise RuntimeError(
+                f"could not {operation}: {response.status} {response.body[:200]!r}"
+            )
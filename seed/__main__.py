@@ -0,0 +1,91 @@
+import argparse
+import datetime
+import logging
+import os
+import time
+
+from .dataset import SeedConfig
+from .loader import seed_database
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="python -m seed",
+        description="Bulk-loads a synthetic, Zipf-distributed Conduit dataset.",
+    )
+    parser.add_argument(
+        "--database-uri",
+        default=os.getenv("DATABASE_URI"),
+        help="(default: $DATABASE_URI)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--articles", type=int, default=100000)
+    parser.add_argument("--follows", type=int, default=200000, help="approximate total")
+    parser.add_argument(
+        "--favorites", type=int, default=1000000, help="approximate total"
+    )
+    parser.add_argument("--comments", type=int, default=500000)
+    parser.add_argument("--tags", type=int, default=1000, help="distinct tags")
+    parser.add_argument("--max-tags-per-article", type=int, default=5)
+    parser.add_argument("--sentences-per-body", type=int, default=10)
+    parser.add_argument(
+        "--exponent",
+        type=float,
+        default=1.1,
+        help="Zipf exponent of the popularity of users, articles, tags and words",
+    )
+    parser.add_argument(
+        "--days", type=int, default=365, help="spread of the created_at timestamps"
+    )
+    parser.add_argument(
+        "--until",
+        type=datetime.datetime.fromisoformat,
+        default=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        help="latest created_at timestamp (default: 2024-01-01T00:00:00+00:00)",
+    )
+    parser.add_argument("--jobs", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--truncate",
+        action="store_true",
+        help="deletes all users, follows, articles, favorites and comments first",
+    )
+    parser.add_argument(
+        "--skip-foreign-key-checks",
+        action="store_true",
+        help="loads faster by disabling foreign key triggers (requires a superuser)",
+    )
+
+    args = parser.parse_args()
+
+    if not args.database_uri:
+        parser.error("--database-uri or DATABASE_URI is required")
+
+    if args.users < 2:
+        parser.error("--users must be at least 2")
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    started_at = time.perf_counter()
+
+    seed_database(
+        conninfo=args.database_uri,
+        config=SeedConfig(
+            seed=args.seed,
+            users=args.users,
+            articles=args.articles,
+            follows=args.follows,
+            favorites=args.favorites,
+            comments=args.comments,
+            tags=args.tags,
+            max_tags_per_article=args.max_tags_per_article,
+            sentences_per_body=args.sentences_per_body,
+            exponent=args.exponent,
+            days=args.days,
+            until=args.until,
+        ),
+        jobs=args.jobs,
+        truncate=args.truncate,
+        skip_foreign_key_checks=args.skip_foreign_key_checks,
+    )
+
+    logging.info("seeded in %.1fs", time.perf_counter() - started_at)
@@ -0,0 +1,291 @@
+import datetime
+import functools
+import hashlib
+import random
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from .text import TextGenerator, make_word
+from .zipf import ZipfSampler
+
+PASSWORD = "password"
+
+BLOCK_SIZE = 50000
+
+
+@dataclass
+class SeedConfig:
+    seed: int
+    users: int
+    articles: int
+    follows: int
+    favorites: int
+    comments: int
+    tags: int
+    max_tags_per_article: int
+    sentences_per_body: int
+    exponent: float
+    days: int
+    until: datetime.datetime
+
+
+@dataclass
+class Table:
+    name: str
+    columns: List[str]
+    # The number of keys the blocks are split over: rows, or the users that own
+    # the rows for follows and favorites.
+    keys_count: Callable[[SeedConfig], int]
+    generate_block: Callable[["Dataset", int], Iterator[Tuple]]
+
+
+class Dataset:
+    """Generates the rows of each table, in blocks of BLOCK_SIZE.
+
+    Each block draws from its own random generator, seeded with the seed, the
+    table and the block number, and ids are derived from the same, so blocks can
+    be generated in any order and in parallel and the dataset is still the same
+    for a given seed and config.
+    """
+
+    def __init__(self, config: SeedConfig):
+        self.config = config
+        self._text = TextGenerator(
+            seed=config.seed, vocabulary_size=50000, exponent=config.exponent
+        )
+        self._users = ZipfSampler(n=config.users, exponent=config.exponent)
+        self._articles = ZipfSampler(
+            n=max(config.articles, 1), exponent=config.exponent
+        )
+        self._tags = ZipfSampler(n=max(config.tags, 1), exponent=config.exponent)
+        self._password_hash = self._make_password_hash(password=PASSWORD)
+
+    def make_id(self, table: str, key) -> str:
+        return _make_id(seed=self.config.seed, table=table, key=key)
+
+    def generate_users(self, block: int) -> Iterator[Tuple]:
+        rng = self._rng(table="users", block=block)
+
+        for index in self._block_range(block=block, count=self.config.users):
+            username = f"user{index}"
+            created_at = self._timestamp(rng=rng)
+
+            yield (
+                self.make_id(table="users", key=index),
+                username,
+                f"{username}@example.com",
+                self._password_hash,
+                self._text.words(rng=rng, count=rng.randint(0, 12)) or None,
+                None,
+                created_at,
+                created_at,
+            )
+
+    def generate_follows(self, block: int) -> Iterator[Tuple]:
+        """Gives each follower an exponentially distributed number of follows, of
+        Zipf-distributed users, so a few users have most of the followers.
+        """
+        rng = self._rng(table="follows", block=block)
+
+        mean_follows = self.config.follows / self.config.users
+
+        for follower in self._block_range(block=block, count=self.config.users):
+            followed_users = self._sample_distinct(
+                rng=rng,
+                sampler=self._users,
+                count=min(
+                    round(rng.expovariate(1 / mean_follows)) if mean_follows else 0,
+                    self.config.users - 1,
+                ),
+                exclude=follower,
+            )
+
+            for followed in followed_users:
+                yield (
+                    self.make_id(table="follows", key=f"{follower}:{followed}"),
+                    self.make_id(table="users", key=follower),
+                    self.make_id(table="users", key=followed),
+                    self._timestamp(rng=rng),
+                )
+
+    def generate_articles(self, block: int) -> Iterator[Tuple]:
+        rng = self._rng(table="articles", block=block)
+
+        for index in self._block_range(block=block, count=self.config.articles):
+            title = self._text.words(rng=rng, count=rng.randint(3, 8)).capitalize()
+            tags = sorted(
+                {
+                    make_word(rank=self._tags.sample(rng=rng))
+                    for _ in range(rng.randint(0, self.config.max_tags_per_article))
+                }
+            )
+            created_at = self._timestamp(rng=rng)
+
+            yield (
+                self.make_id(table="articles", key=index),
+                self.make_id(table="users", key=self._users.sample(rng=rng)),
+                f"{title.lower().replace(' ', '-')}-{index}",
+                title,
+                self._text.words(rng=rng, count=rng.randint(8, 16)),
+                self._text.paragraph(
+                    rng=rng,
+                    sentences_count=rng.randint(1, 2 * self.config.sentences_per_body),
+                ),
+                f"{{{','.join(tags)}}}",
+                created_at,
+                created_at,
+            )
+
+    def generate_favorites(self, block: int) -> Iterator[Tuple]:
+        """Gives each user an exponentially distributed number of favorites, of
+        Zipf-distributed articles, so a few articles have most of the favorites.
+        """
+        rng = self._rng(table="favorites", block=block)
+
+        mean_favorites = self.config.favorites / self.config.users
+
+        for user in self._block_range(block=block, count=self.config.users):
+            favorited_articles = self._sample_distinct(
+                rng=rng,
+                sampler=self._articles,
+                count=min(
+                    round(rng.expovariate(1 / mean_favorites)) if mean_favorites else 0,
+                    self.config.articles,
+                ),
+            )
+
+            for article in favorited_articles:
+                yield (
+                    self.make_id(table="favorites", key=f"{article}:{user}"),
+                    self.make_id(table="articles", key=article),
+                    self.make_id(table="users", key=user),
+                    self._timestamp(rng=rng),
+                )
+
+    def generate_comments(self, block: int) -> Iterator[Tuple]:
+        rng = self._rng(table="comments", block=block)
+
+        for index in self._block_range(block=block, count=self.config.comments):
+            created_at = self._timestamp(rng=rng)
+
+            yield (
+                self.make_id(table="comments", key=index),
+                self.make_id(table="articles", key=self._articles.sample(rng=rng)),
+                self.make_id(table="users", key=self._users.sample(rng=rng)),
+                self._text.paragraph(rng=rng, sentences_count=rng.randint(1, 3)),
+                created_at,
+                created_at,
+            )
+
+    def _rng(self, table: str, block: int) -> random.Random:
+        return random.Random(f"{self.config.seed}:{table}:{block}")
+
+    def _timestamp(self, rng: random.Random) -> str:
+        return (
+            self.config.until
+            - datetime.timedelta(seconds=rng.random() * self.config.days * 86400)
+        ).isoformat()
+
+    @staticmethod
+    def _block_range(block: int, count: int) -> range:
+        return range(block * BLOCK_SIZE, min((block + 1) * BLOCK_SIZE, count))
+
+    @staticmethod
+    def _sample_distinct(
+        rng: random.Random, sampler: ZipfSampler, count: int, exclude: int = None
+    ) -> List[int]:
+        samples = set()
+        attempts = 0
+
+        while len(samples) < count and attempts < count * 10:
+            sample = sampler.sample(rng=rng)
+
+            if sample != exclude:
+                samples.add(sample)
+
+            attempts += 1
+
+        return sorted(samples)
+
+    def _make_password_hash(self, password: str) -> str:
+        """Hashes password in werkzeug's format, as UsersService does, with a salt
+        derived from the seed instead of a random one.
+        """
+        iterations = 260000
+        salt = hashlib.sha256(f"{self.config.seed}:salt".encode()).hexdigest()[:16]
+        password_hash = hashlib.pbkdf2_hmac(
+            "sha256", password.encode(), salt.encode(), iterations
+        ).hex()
+
+        return f"pbkdf2:sha256:{iterations}${salt}${password_hash}"
+
+
+@functools.lru_cache(maxsize=100000)
+def _make_id(seed: int, table: str, key) -> str:
+    """Cached, since popular users and articles are referenced over and over."""
+    digest = hashlib.blake2b(f"{seed}:{table}:{key}".encode(), digest_size=16).digest()
+    return str(uuid.UUID(bytes=digest, version=4))
+
+
+TABLES: Dict[str, Table] = {
+    table.name: table
+    for table in [
+        Table(
+            name="users",
+            columns=[
+                "id",
+                "username",
+                "email",
+                "password_hash",
+                "bio",
+                "image",
+                "created_at",
+                "updated_at",
+            ],
+            keys_count=lambda config: config.users,
+            generate_block=Dataset.generate_users,
+        ),
+        Table(
+            name="follows",
+            columns=["id", "follower_id", "followed_id", "created_at"],
+            keys_count=lambda config: config.users,
+            generate_block=Dataset.generate_follows,
+        ),
+        Table(
+            name="articles",
+            columns=[
+                "id",
+                "author_id",
+                "slug",
+                "title",
+                "description",
+                "body",
+                "tags",
+                "created_at",
+                "updated_at",
+            ],
+            keys_count=lambda config: config.articles,
+            generate_block=Dataset.generate_articles,
+        ),
+        Table(
+            name="favorites",
+            columns=["id", "article_id", "user_id", "created_at"],
+            keys_count=lambda config: config.users,
+            generate_block=Dataset.generate_favorites,
+        ),
+        Table(
+            name="comments",
+            columns=[
+                "id",
+                "article_id",
+                "author_id",
+                "body",
+                "created_at",
+                "updated_at",
+            ],
+            keys_count=lambda config: config.comments,
+            generate_block=Dataset.generate_comments,
+        ),
+    ]
+}
@@ -0,0 +1,137 @@
+import concurrent.futures
+import logging
+import math
+import time
+from typing import List
+
+import psycopg
+
+from .dataset import BLOCK_SIZE, TABLES, Dataset, SeedConfig
+
+logger = logging.getLogger(__name__)
+
+# Tables in the same phase only reference tables of earlier phases, so they are
+# loaded in parallel.
+PHASES = [["users"], ["follows", "articles"], ["favorites", "comments"]]
+
+# The articles' denormalized counts, which the app maintains as favorites and
+# comments are written. Their trending scores are left for the app to compute.
+UPDATE_ARTICLES_COUNTS_QUERY = """
+    UPDATE articles a
+    SET favorites_count = COALESCE(f.count, 0), comments_count = COALESCE(c.count, 0)
+    FROM articles a2
+    LEFT JOIN (
+        SELECT article_id, COUNT(*) AS count FROM favorites GROUP BY article_id
+    ) f ON f.article_id = a2.id
+    LEFT JOIN (
+        SELECT article_id, COUNT(*) AS count FROM comments GROUP BY article_id
+    ) c ON c.article_id = a2.id
+    WHERE a.id = a2.id
+"""
+
+_dataset: Dataset = None
+_skip_foreign_key_checks = False
+
+
+def seed_database(
+    conninfo: str,
+    config: SeedConfig,
+    jobs: int,
+    truncate: bool,
+    skip_foreign_key_checks: bool,
+):
+    """Generates the dataset for config and bulk-loads it with COPY.
+
+    Blocks of rows are generated and copied by jobs worker processes, each block
+    in its own transaction, since generating the rows takes more time than
+    Postgres takes to load them.
+
+    If skip_foreign_key_checks, the workers disable the foreign key triggers
+    (which requires a superuser), as the generated ids are consistent by
+    construction and checking each row costs about a third of the load time.
+    """
+    with psycopg.connect(conninfo) as conn:
+        if truncate:
+            conn.execute(
+                f"TRUNCATE {', '.join(TABLES)} CASCADE",
+            )
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(config, skip_foreign_key_checks),
+    ) as executor:
+        for phase in PHASES:
+            started_at = time.perf_counter()
+
+            futures = {
+                executor.submit(
+                    _copy_block, conninfo=conninfo, table_name=table_name, block=block
+                ): table_name
+                for table_name in phase
+                for block in range(
+                    math.ceil(TABLES[table_name].keys_count(config) / BLOCK_SIZE)
+                )
+            }
+
+            rows_count = {table_name: 0 for table_name in phase}
+
+            for future in concurrent.futures.as_completed(futures):
+                rows_count[futures[future]] += future.result()
+
+            for table_name in phase:
+                logger.info(
+                    "copied %d %s in %.1fs",
+                    rows_count[table_name],
+                    table_name,
+                    time.perf_counter() - started_at,
+                )
+
+    with psycopg.connect(conninfo, autocommit=True) as conn:
+        started_at = time.perf_counter()
+
+        conn.execute(UPDATE_ARTICLES_COUNTS_QUERY)
+
+        logger.info(
+            "updated articles counts in %.1fs", time.perf_counter() - started_at
+        )
+
+        conn.execute(f"ANALYZE {', '.join(TABLES)}")
+
+
+def _init_worker(config: SeedConfig, skip_foreign_key_checks: bool):
+    global _dataset, _skip_foreign_key_checks
+
+    _dataset = Dataset(config=config)
+    _skip_foreign_key_checks = skip_foreign_key_checks
+
+
+def _copy_block(conninfo: str, table_name: str, block: int) -> int:
+    table = TABLES[table_name]
+
+    lines: List[str] = [
+        "\t".join(_format_value(value) for value in row)
+        for row in table.generate_block(_dataset, block)
+    ]
+
+    if not lines:
+        return 0
+
+    with psycopg.connect(conninfo) as conn:
+        if _skip_foreign_key_checks:
+            conn.execute("SET session_replication_role = replica")
+
+        with conn.cursor() as cur:
+            with cur.copy(
+                f"COPY {table.name} ({', '.join(table.columns)}) FROM STDIN"
+            ) as copy:
+                copy.write("\n".join(lines) + "\n")
+
+    return len(lines)
+
+
+def _format_value(value) -> str:
+    """Formats value for COPY's text format. The generated text never contains
+    tabs, newlines or backslashes, so only NULL needs escaping.
+    """
+    return "\\N" if value is None else str(value)
@@ -0,0 +1,90 @@
+import random
+from typing import List
+
+from .zipf import ZipfSampler
+
+_SYLLABLES = [
+    "ka",
+    "lo",
+    "mi",
+    "ne",
+    "ru",
+    "sa",
+    "ti",
+    "vo",
+    "ze",
+    "pa",
+    "do",
+    "fi",
+    "gu",
+    "ha",
+    "je",
+    "bo",
+    "co",
+    "di",
+    "me",
+    "no",
+    "ra",
+    "se",
+    "to",
+    "va",
+    "wi",
+    "xo",
+    "yu",
+    "be",
+    "lu",
+    "qi",
+]
+
+
+def make_word(rank: int) -> str:
+    """Returns the pseudo-word for rank, made of syllables so that frequent words
+    (low ranks) are short, as in natural language.
+    """
+    syllables = []
+
+    rank += 1
+
+    while rank:
+        rank, syllable_index = divmod(rank - 1, len(_SYLLABLES))
+        syllables.append(_SYLLABLES[syllable_index])
+
+    return "".join(syllables)
+
+
+class TextGenerator:
+    """Generates text out of a Zipf-distributed vocabulary of pseudo-words.
+
+    Bodies are assembled from a pool of sentences generated up front, because
+    drawing every word of millions of bodies would dominate the seeding time.
+    """
+
+    def __init__(
+        self,
+        seed: int,
+        vocabulary_size: int,
+        exponent: float,
+        sentences_count: int = 10000,
+        words_per_sentence: int = 12,
+    ):
+        rng = random.Random(f"{seed}:sentences")
+
+        words = ZipfSampler(n=vocabulary_size, exponent=exponent)
+
+        self._words = words
+        self._sentences: List[str] = []
+
+        for _ in range(sentences_count):
+            sentence = " ".join(
+                make_word(rank=words.sample(rng=rng))
+                for _ in range(rng.randint(4, words_per_sentence * 2 - 4))
+            )
+            self._sentences.append(f"{sentence.capitalize()}.")
+
+    def words(self, rng: random.Random, count: int) -> str:
+        return " ".join(
+            make_word(rank=self._words.sample(rng=rng)) for _ in range(count)
+        )
+
+    def paragraph(self, rng: random.Random, sentences_count: int) -> str:
+        return " ".join(rng.choices(self._sentences, k=sentences_count))
@@ -0,0 +1,37 @@
+import math
+import random
+
+
+class ZipfSampler:
+    """Samples ranks in [0, n) with probability roughly proportional to
+    1 / (rank + 1) ** exponent, so rank 0 is the most popular.
+
+    It inverts the CDF of the continuous approximation of the distribution, so
+    sampling takes constant time and memory whatever n is.
+    """
+
+    def __init__(self, n: int, exponent: float):
+        if n < 1:
+            raise ValueError("n must be greater than 0")
+
+        if exponent <= 0:
+            raise ValueError("exponent must be greater than 0")
+
+        self._n = n
+        self._exponent = exponent
+        self._one_minus_exponent = 1 - exponent
+
+        if math.isclose(exponent, 1):
+            self._log_n_plus_one = math.log(n + 1)
+        else:
+            self._n_plus_one_power = (n + 1) ** self._one_minus_exponent
+
+    def sample(self, rng: random.Random) -> int:
+        u = rng.random()
+
+        if math.isclose(self._exponent, 1):
+            x = math.exp(u * self._log_n_plus_one)
+        else:
+            x = (1 + u * (self._n_plus_one_power - 1)) ** (1 / self._one_minus_exponent)
+
+        return min(int(x) - 1, self._n - 1)
@@ -0,0 +1,202 @@
+import pytest
+import datetime
+import urllib.parse
+import uuid
+from typing import Optional
+from ..utils import create_jwt
+
+
+def make_export_articles_url(
+    tag: Optional[str] = None,
+    author: Optional[str] = None,
+    favorited: Optional[str] = None,
+):
+    params = {}
+
+    if tag:
+        params["tag"] = tag
+
+    if author:
+        params["author"] = author
+
+    if favorited:
+        params["favorited"] = favorited
+
+    encoded_params = urllib.parse.urlencode(params)
+
+    return f"/api/articles/export?{encoded_params}"
+
+
+@pytest.mark.asyncio
+async def test_when_token_is_sent_should_return_200(
+    app,
+    faker,
+    create_user_and_decode,
+    follow_user_and_decode,
+    create_article_and_decode,
+    favorite_article_and_decode,
+):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    tag = str(uuid.uuid4())
+
+    author = await create_user_and_decode()
+
+    article1 = await create_article_and_decode(author_token=author.token, tags=[tag])
+    article2 = await create_article_and_decode(author_token=author.token, tags=[tag])
+
+    await follow_user_and_decode(follower_token=user.token, username=author.username)
+
+    await favorite_article_and_decode(user_token=user.token, slug=article1.slug)
+
+    response = await client.get(
+        make_export_articles_url(tag=tag, author=author.username),
+        headers={
+            "Authorization": f"Token {user.token}",
+        },
+    )
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    assert response_data["articlesCount"] == 2
+
+    articles = response_data["articles"]
+
+    assert len(articles) == 2
+
+    assert articles[0]["slug"] == article2.slug
+    assert articles[0]["title"] == article2.title
+    assert articles[0]["description"] == article2.description
+    assert articles[0]["body"] == article2.body
+    assert articles[0]["tagList"] == article2.tag_list
+    created_at = datetime.datetime.fromisoformat(articles[0]["createdAt"])
+    updated_at = datetime.datetime.fromisoformat(articles[0]["updatedAt"])
+    assert created_at == article2.created_at
+    assert updated_at == article2.updated_at
+    assert not articles[0]["favorited"]
+    assert articles[0]["favoritesCount"] == 0
+    assert articles[0]["author"] == {
+        "username": author.username,
+        "bio": author.bio,
+        "image": author.image,
+        "following": True,
+    }
+
+    assert articles[1]["slug"] == article1.slug
+    assert articles[1]["favorited"]
+    assert articles[1]["favoritesCount"] == 1
+    assert articles[1]["author"]["following"]
+
+
+@pytest.mark.asyncio
+async def test_when_token_is_not_sent_should_return_200(
+    app,
+    faker,
+    create_user_and_decode,
+    create_article_and_decode,
+    favorite_article_and_decode,
+):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    tag = str(uuid.uuid4())
+
+    author = await create_user_and_decode()
+
+    article = await create_article_and_decode(author_token=author.token, tags=[tag])
+
+    await favorite_article_and_decode(user_token=user.token, slug=article.slug)
+
+    response = await client.get(
+        make_export_articles_url(tag=tag, favorited=user.username),
+    )
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    assert response_data["articlesCount"] == 1
+
+    articles = response_data["articles"]
+
+    assert articles[0]["slug"] == article.slug
+    assert not articles[0]["favorited"]
+    assert articles[0]["favoritesCount"] == 1
+    assert not articles[0]["author"]["following"]
+
+
+@pytest.mark.asyncio
+async def test_when_no_articles_match_should_return_200(app):
+    client = app.test_client()
+
+    response = await client.get(
+        make_export_articles_url(tag=str(uuid.uuid4())),
+    )
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    assert response_data == {"articles": [], "articlesCount": 0}
+
+
+@pytest.mark.asyncio
+async def test_when_author_is_not_found_should_return_404(app):
+    client = app.test_client()
+
+    author = str(uuid.uuid4())
+
+    response = await client.get(
+        make_export_articles_url(author=author),
+    )
+
+    assert response.status_code == 404
+
+    response_data = await response.json
+
+    assert response_data["errors"]["body"][0] == f"author {author} not found"
+
+
+@pytest.mark.asyncio
+async def test_when_user_is_not_found_should_return_401(app):
+    client = app.test_client()
+
+    token = create_jwt(username=str(uuid.uuid4()))
+
+    response = await client.get(
+        make_export_articles_url(),
+        headers={
+            "Authorization": f"Token {token}",
+        },
+    )
+
+    assert response.status_code == 401
+
+    response_data = await response.json
+
+    assert response_data["errors"]["body"][0] == "unauthorized"
+
+
+@pytest.mark.asyncio
+async def test_when_no_dedicated_connection_is_left_should_return_503(
+    app, hold_dedicated_connections
+):
+    client = app.test_client()
+
+    async with hold_dedicated_connections():
+        response = await client.get(make_export_articles_url())
+
+    assert response.status_code == 503
+
+    response_data = await response.json
+
+    assert response_data["errors"]["body"][0] == "too many dedicated connections open"
+
+    response = await client.get(make_export_articles_url(tag=str(uuid.uuid4())))
+
+    assert response.status_code == 200
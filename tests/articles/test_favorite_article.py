@@ -387,3 +387,28 @@ async def test_when_user_is_not_found_should_return_401(
     response_data = await response.json
 
     assert response_data["errors"]["body"][0] == "unauthorized"
+
+
+@pytest.mark.asyncio
+async def test_should_run_a_fixed_number_of_statements(
+    app, faker, create_user_and_decode, create_article_and_decode, count_statements
+):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    author = await create_user_and_decode()
+
+    created_article = await create_article_and_decode(author_token=author.token)
+
+    with count_statements() as statements:
+        response = await client.post(
+            make_favorite_article_url(slug=created_article.slug),
+            headers={
+                "Authorization": f"Token {user.token}",
+            },
+        )
+
+    assert response.status_code == 200
+
+    assert len(statements) == 5
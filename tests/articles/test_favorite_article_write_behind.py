@@ -0,0 +1,206 @@
+import pytest
+import pytest_asyncio
+import uuid
+
+
+def make_favorite_article_url(slug: str) -> str:
+    return f"/api/articles/{slug}/favorite"
+
+
+def make_get_article_url(slug: str) -> str:
+    return f"/api/articles/{slug}"
+
+
+@pytest_asyncio.fixture(name="app", scope="function")
+async def _write_behind_app():
+    from conduit import app
+
+    config = {
+        "FAVORITES_WRITE_BEHIND": True,
+        "FAVORITES_FLUSH_INTERVAL_SECONDS": 3600,
+    }
+
+    previous_config = {key: app.config[key] for key in config}
+
+    app.config.update(config)
+
+    try:
+        async with app.test_app() as test_app:
+            yield test_app
+    finally:
+        app.config.update(previous_config)
+
+
+async def flush_favorites(app):
+    async with app.app.app_context():
+        await app.app.articles_service.flush_favorites()
+
+
+async def get_article(app, slug: str, token: str) -> dict:
+    client = app.test_client()
+
+    response = await client.get(
+        make_get_article_url(slug=slug),
+        headers={
+            "Authorization": f"Token {token}",
+        },
+    )
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    return response_data["article"]
+
+
+@pytest.mark.asyncio
+async def test_should_acknowledge_the_favorite_before_writing_it(
+    app, create_user_and_decode, create_article_and_decode, count_statements
+):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    author = await create_user_and_decode()
+
+    created_article = await create_article_and_decode(author_token=author.token)
+
+    with count_statements() as statements:
+        response = await client.post(
+            make_favorite_article_url(slug=created_article.slug),
+            headers={
+                "Authorization": f"Token {user.token}",
+            },
+        )
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    assert response_data["article"]["favorited"]
+    assert response_data["article"]["favoritesCount"] == 1
+
+    assert not [
+        statement for statement in statements if "INSERT INTO favorites" in statement
+    ]
+
+    article = await get_article(app=app, slug=created_article.slug, token=user.token)
+
+    assert article["favorited"]
+
+    await flush_favorites(app=app)
+
+    article = await get_article(app=app, slug=created_article.slug, token=user.token)
+
+    assert article["favorited"]
+    assert article["favoritesCount"] == 1
+
+
+@pytest.mark.asyncio
+async def test_when_favorites_are_toggled_should_write_the_last_state_in_a_single_statement(
+    app, create_user_and_decode, create_article_and_decode, count_statements
+):
+    client = app.test_client()
+
+    user1 = await create_user_and_decode()
+
+    user2 = await create_user_and_decode()
+
+    author = await create_user_and_decode()
+
+    created_article = await create_article_and_decode(author_token=author.token)
+
+    url = make_favorite_article_url(slug=created_article.slug)
+
+    for user, method in [
+        (user1, client.post),
+        (user2, client.post),
+        (user1, client.delete),
+        (user2, client.delete),
+        (user1, client.post),
+    ]:
+        response = await method(
+            url,
+            headers={
+                "Authorization": f"Token {user.token}",
+            },
+        )
+
+        assert response.status_code == 200
+
+    with count_statements() as statements:
+        await flush_favorites(app=app)
+
+    assert len(statements) == 1
+
+    article = await get_article(app=app, slug=created_article.slug, token=user1.token)
+
+    assert article["favorited"]
+    assert article["favoritesCount"] == 1
+
+    article = await get_article(app=app, slug=created_article.slug, token=user2.token)
+
+    assert not article["favorited"]
+
+
+@pytest.mark.asyncio
+async def test_when_favorite_was_written_should_unfavorite_it(
+    app, create_user_and_decode, create_article_and_decode
+):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    author = await create_user_and_decode()
+
+    created_article = await create_article_and_decode(author_token=author.token)
+
+    url = make_favorite_article_url(slug=created_article.slug)
+
+    headers = {
+        "Authorization": f"Token {user.token}",
+    }
+
+    response = await client.post(url, headers=headers)
+
+    assert response.status_code == 200
+
+    await flush_favorites(app=app)
+
+    response = await client.delete(url, headers=headers)
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    assert not response_data["article"]["favorited"]
+    assert response_data["article"]["favoritesCount"] == 0
+
+    await flush_favorites(app=app)
+
+    article = await get_article(app=app, slug=created_article.slug, token=user.token)
+
+    assert not article["favorited"]
+    assert article["favoritesCount"] == 0
+
+    response = await client.get(f"/api/articles?author={author.username}&sort=top")
+
+    response_data = await response.json
+
+    assert response_data["articles"][0]["favoritesCount"] == 0
+
+
+@pytest.mark.asyncio
+async def test_when_article_is_not_found_should_return_404(app, create_user_and_decode):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    response = await client.post(
+        make_favorite_article_url(slug=str(uuid.uuid4())),
+        headers={
+            "Authorization": f"Token {user.token}",
+        },
+    )
+
+    assert response.status_code == 404
@@ -0,0 +1,174 @@
+import contextlib
+import re
+
+import pytest
+
+
+def make_favorite_article_url(slug: str) -> str:
+    return f"/api/articles/{slug}/favorite"
+
+
+@contextlib.contextmanager
+def hot_article_rate(app, rate_threshold: float):
+    hot_articles = app.app.hot_articles
+
+    previous_rate_threshold = hot_articles.rate_threshold
+
+    hot_articles.rate_threshold = rate_threshold
+
+    try:
+        yield hot_articles
+    finally:
+        hot_articles.rate_threshold = previous_rate_threshold
+
+
+async def roll_up_favorites_count_shards(app):
+    async with app.app.app_context():
+        await app.app.articles_service.roll_up_favorites_count_shards()
+
+
+async def get_favorites_counts(app, author_username: str, slug: str) -> list:
+    client = app.test_client()
+
+    response = await client.get(f"/api/articles?author={author_username}")
+
+    assert response.status_code == 200
+
+    list_response_data = await response.json
+
+    response = await client.post("/api/articles/status", json={"slugs": [slug]})
+
+    assert response.status_code == 200
+
+    status_response_data = await response.json
+
+    return [
+        list_response_data["articles"][0]["favoritesCount"],
+        status_response_data["articles"][0]["favoritesCount"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_when_article_is_hot_should_count_favorites_in_shards(
+    app,
+    create_user_and_decode,
+    create_article_and_decode,
+    count_statements,
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    users = [await create_user_and_decode() for _ in range(3)]
+
+    created_article = await create_article_and_decode(author_token=author.token)
+
+    url = make_favorite_article_url(slug=created_article.slug)
+
+    with hot_article_rate(app=app, rate_threshold=0):
+        with count_statements() as statements:
+            for i, user in enumerate(users):
+                response = await client.post(
+                    url,
+                    headers={
+                        "Authorization": f"Token {user.token}",
+                    },
+                )
+
+                assert response.status_code == 200
+
+                response_data = await response.json
+
+                assert response_data["article"]["favoritesCount"] == i + 1
+
+            response = await client.delete(
+                url,
+                headers={
+                    "Authorization": f"Token {users[0].token}",
+                },
+            )
+
+            assert response.status_code == 200
+
+        assert not [
+            statement for statement in statements if "UPDATE articles" in statement
+        ]
+
+        # The returned counts come from the article and its shards, not from
+        # counting its favorites.
+        assert not [
+            statement
+            for statement in statements
+            if re.search(r"COUNT\(\*\)\s+FROM favorites", statement)
+        ]
+
+    assert await get_favorites_counts(
+        app=app, author_username=author.username, slug=created_article.slug
+    ) == [2, 2]
+
+    await roll_up_favorites_count_shards(app=app)
+
+    assert await get_favorites_counts(
+        app=app, author_username=author.username, slug=created_article.slug
+    ) == [2, 2]
+
+    response = await client.post(
+        url,
+        headers={
+            "Authorization": f"Token {users[0].token}",
+        },
+    )
+
+    assert response.status_code == 200
+
+    assert await get_favorites_counts(
+        app=app, author_username=author.username, slug=created_article.slug
+    ) == [3, 3]
+
+
+@pytest.mark.asyncio
+async def test_when_shards_are_rolled_up_should_rank_the_article_by_its_favorites(
+    app, create_user_and_decode, create_article_and_decode
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    user = await create_user_and_decode()
+
+    hot_article = await create_article_and_decode(author_token=author.token)
+
+    newer_article = await create_article_and_decode(author_token=author.token)
+
+    with hot_article_rate(app=app, rate_threshold=0):
+        response = await client.post(
+            make_favorite_article_url(slug=hot_article.slug),
+            headers={
+                "Authorization": f"Token {user.token}",
+            },
+        )
+
+        assert response.status_code == 200
+
+    url = f"/api/articles?author={author.username}&sort=top"
+
+    response = await client.get(url)
+
+    response_data = await response.json
+
+    assert [article["slug"] for article in response_data["articles"]] == [
+        newer_article.slug,
+        hot_article.slug,
+    ]
+
+    await roll_up_favorites_count_shards(app=app)
+
+    response = await client.get(url)
+
+    response_data = await response.json
+
+    assert [article["slug"] for article in response_data["articles"]] == [
+        hot_article.slug,
+        newer_article.slug,
+    ]
+    assert response_data["articles"][0]["favoritesCount"] == 1
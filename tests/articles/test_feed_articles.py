@@ -10,6 +10,7 @@ from ..utils import create_jwt
 def make_feed_articles_url(
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    compact: Optional[bool] = None,
 ):
     params = {}
 
@@ -19,6 +20,9 @@ def make_feed_articles_url(
     if offset:
         params["offset"] = offset
 
+    if compact:
+        params["compact"] = "true"
+
     encoded_params = urllib.parse.urlencode(params)
 
     return f"/api/articles/feed?{encoded_params}"
@@ -519,3 +523,84 @@ async def test_when_user_is_not_found_should_return_401(app, faker):
     response_data = await response.json
 
     assert response_data["errors"]["body"][0] == "unauthorized"
+
+
+@pytest.mark.asyncio
+async def test_when_compact_is_set_should_not_return_bodies(
+    app,
+    create_user_and_decode,
+    follow_user_and_decode,
+    create_article_and_decode,
+):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    author = await create_user_and_decode()
+
+    await follow_user_and_decode(follower_token=user.token, username=author.username)
+
+    article = await create_article_and_decode(author_token=author.token)
+
+    response = await client.get(
+        make_feed_articles_url(compact=True),
+        headers={
+            "Authorization": f"Token {user.token}",
+        },
+    )
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    articles = response_data["articles"]
+
+    assert len(articles) == 1
+    assert articles[0]["slug"] == article.slug
+    assert articles[0]["description"] == article.description
+    assert articles[0]["body"] is None
+
+
+@pytest.mark.xfail(
+    reason="feed_articles reads favorited flags and author profiles per article",
+    strict=True,
+)
+@pytest.mark.asyncio
+async def test_should_not_query_per_article(
+    app,
+    faker,
+    create_user_and_decode,
+    follow_user_and_decode,
+    create_article_and_decode,
+    favorite_article_and_decode,
+    assert_max_queries,
+):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    authors = [await create_user_and_decode() for _ in range(3)]
+
+    for author in authors:
+        await follow_user_and_decode(
+            follower_token=user.token, username=author.username
+        )
+
+        for _ in range(2):
+            article = await create_article_and_decode(author_token=author.token)
+
+            await favorite_article_and_decode(user_token=user.token, slug=article.slug)
+
+    with assert_max_queries(3):
+        response = await client.get(
+            make_feed_articles_url(),
+            headers={
+                "Authorization": f"Token {user.token}",
+            },
+        )
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    assert response_data["articlesCount"] == 6
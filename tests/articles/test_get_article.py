@@ -419,3 +419,48 @@ async def test_when_user_is_not_found_should_return_401(
     response_data = await response.json
 
     assert response_data["errors"]["body"][0] == "unauthorized"
+
+
+@pytest.mark.asyncio
+async def test_when_user_has_just_favorited_article_should_read_from_primary(
+    app,
+    faker,
+    create_user_and_decode,
+    create_article_and_decode,
+    favorite_article_and_decode,
+    count_statements,
+):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    author = await create_user_and_decode()
+
+    article = await create_article_and_decode(author_token=author.token)
+
+    await favorite_article_and_decode(user_token=user.token, slug=article.slug)
+
+    with count_statements(aconns=app.app.aconn.replicas) as statements:
+        response = await client.get(
+            make_get_article_url(slug=article.slug),
+            headers={
+                "Authorization": f"Token {user.token}",
+            },
+        )
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    assert response_data["article"]["favorited"]
+
+    assert len(statements) == 0
+
+    with count_statements(aconns=app.app.aconn.replicas) as statements:
+        response = await client.get(
+            make_get_article_url(slug=article.slug),
+        )
+
+    assert response.status_code == 200
+
+    assert len(statements) > 0
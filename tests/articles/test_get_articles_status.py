@@ -0,0 +1,213 @@
+import pytest
+import uuid
+from ..utils import create_jwt
+
+articles_status_url = "/api/articles/status"
+
+
+@pytest.mark.asyncio
+async def test_should_return_200(
+    app,
+    create_user_and_decode,
+    follow_user_and_decode,
+    create_article_and_decode,
+    favorite_article_and_decode,
+    add_comment_to_article_and_decode,
+):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    author1 = await create_user_and_decode()
+
+    author2 = await create_user_and_decode()
+
+    await follow_user_and_decode(follower_token=user.token, username=author1.username)
+
+    article1 = await create_article_and_decode(author_token=author1.token)
+
+    article2 = await create_article_and_decode(author_token=author2.token)
+
+    await favorite_article_and_decode(user_token=user.token, slug=article2.slug)
+
+    await favorite_article_and_decode(user_token=author1.token, slug=article2.slug)
+
+    await add_comment_to_article_and_decode(author_token=user.token, slug=article1.slug)
+
+    response = await client.post(
+        articles_status_url,
+        json={"slugs": [article2.slug, article1.slug]},
+        headers={
+            "Authorization": f"Token {user.token}",
+        },
+    )
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    assert response_data["articles"] == [
+        {
+            "slug": article2.slug,
+            "favorited": True,
+            "favoritesCount": 2,
+            "commentsCount": 0,
+            "author": {"username": author2.username, "following": False},
+        },
+        {
+            "slug": article1.slug,
+            "favorited": False,
+            "favoritesCount": 0,
+            "commentsCount": 1,
+            "author": {"username": author1.username, "following": True},
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_when_not_authenticated_should_return_200(
+    app, create_user_and_decode, create_article_and_decode, favorite_article_and_decode
+):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    author = await create_user_and_decode()
+
+    article = await create_article_and_decode(author_token=author.token)
+
+    await favorite_article_and_decode(user_token=user.token, slug=article.slug)
+
+    response = await client.post(articles_status_url, json={"slugs": [article.slug]})
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    assert response_data["articles"] == [
+        {
+            "slug": article.slug,
+            "favorited": False,
+            "favoritesCount": 1,
+            "commentsCount": 0,
+            "author": {"username": author.username, "following": False},
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_when_slugs_are_unknown_or_repeated_should_skip_them(
+    app, create_user_and_decode, create_article_and_decode
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    article = await create_article_and_decode(author_token=author.token)
+
+    deleted_article = await create_article_and_decode(author_token=author.token)
+
+    response = await client.delete(
+        f"/api/articles/{deleted_article.slug}",
+        headers={
+            "Authorization": f"Token {author.token}",
+        },
+    )
+
+    assert response.status_code == 204
+
+    response = await client.post(
+        articles_status_url,
+        json={
+            "slugs": [
+                str(uuid.uuid4()),
+                article.slug,
+                deleted_article.slug,
+                article.slug,
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    assert [article["slug"] for article in response_data["articles"]] == [article.slug]
+
+
+@pytest.mark.asyncio
+async def test_should_not_query_per_article(
+    app,
+    create_user_and_decode,
+    create_article_and_decode,
+    favorite_article_and_decode,
+    assert_max_queries,
+):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    author = await create_user_and_decode()
+
+    slugs = []
+
+    for _ in range(5):
+        article = await create_article_and_decode(author_token=author.token)
+        await favorite_article_and_decode(user_token=user.token, slug=article.slug)
+        slugs.append(article.slug)
+
+    with assert_max_queries(2):
+        response = await client.post(
+            articles_status_url,
+            json={"slugs": slugs},
+            headers={
+                "Authorization": f"Token {user.token}",
+            },
+        )
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    assert len(response_data["articles"]) == 5
+    assert all(article["favorited"] for article in response_data["articles"])
+
+
+@pytest.mark.asyncio
+async def test_when_too_many_slugs_should_return_422(app):
+    client = app.test_client()
+
+    max_slugs = app.app.config["ARTICLES_STATUS_MAX_SLUGS"]
+
+    response = await client.post(
+        articles_status_url,
+        json={"slugs": [str(uuid.uuid4()) for _ in range(max_slugs + 1)]},
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_when_slugs_is_missing_should_return_400(app):
+    client = app.test_client()
+
+    response = await client.post(articles_status_url, json={})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_when_user_is_not_found_should_return_401(app):
+    client = app.test_client()
+
+    token = create_jwt(username=str(uuid.uuid4()))
+
+    response = await client.post(
+        articles_status_url,
+        json={"slugs": []},
+        headers={
+            "Authorization": f"Token {token}",
+        },
+    )
+
+    assert response.status_code == 401
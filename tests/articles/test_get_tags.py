@@ -43,3 +43,17 @@ async def test_should_return_200(
     assert tag2_index > -1
     assert tag2_index < tag3_index
     assert tag3_index < tag1_index
+
+
+@pytest.mark.asyncio
+async def test_should_read_from_replica(app, count_statements):
+    client = app.test_client()
+
+    with count_statements(aconns=app.app.aconn.replicas) as statements:
+        response = await client.get(
+            make_get_tags_url(),
+        )
+
+    assert response.status_code == 200
+
+    assert len(statements) == 1
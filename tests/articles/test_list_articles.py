@@ -13,6 +13,8 @@ def make_list_articles_url(
     favorited: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    sort: Optional[str] = None,
+    compact: Optional[bool] = None,
 ):
     params = {}
 
@@ -31,6 +33,12 @@ def make_list_articles_url(
     if offset:
         params["offset"] = offset
 
+    if sort:
+        params["sort"] = sort
+
+    if compact:
+        params["compact"] = "true"
+
     encoded_params = urllib.parse.urlencode(params)
 
     return f"/api/articles?{encoded_params}"
@@ -965,3 +973,184 @@ async def test_when_user_is_not_found_should_return_401(app, faker):
     response_data = await response.json
 
     assert response_data["errors"]["body"][0] == "unauthorized"
+
+
+@pytest.mark.asyncio
+async def test_when_sort_is_top_should_return_the_most_favorited_first(
+    app,
+    create_user_and_decode,
+    create_article_and_decode,
+    favorite_article_and_decode,
+):
+    client = app.test_client()
+
+    users = [await create_user_and_decode() for _ in range(3)]
+
+    author = await create_user_and_decode()
+
+    tag = str(uuid.uuid4())
+
+    article1 = await create_article_and_decode(author_token=author.token, tags=[tag])
+    article2 = await create_article_and_decode(author_token=author.token, tags=[tag])
+    article3 = await create_article_and_decode(author_token=author.token, tags=[tag])
+
+    for user in users:
+        await favorite_article_and_decode(user_token=user.token, slug=article2.slug)
+
+    for user in users[:2]:
+        await favorite_article_and_decode(user_token=user.token, slug=article1.slug)
+
+    response = await client.get(make_list_articles_url(tag=tag, sort="top"))
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    articles = response_data["articles"]
+
+    assert [article["slug"] for article in articles] == [
+        article2.slug,
+        article1.slug,
+        article3.slug,
+    ]
+    assert [article["favoritesCount"] for article in articles] == [3, 2, 0]
+
+
+@pytest.mark.asyncio
+async def test_when_sort_is_trending_should_return_the_most_active_first(
+    app,
+    create_user_and_decode,
+    create_article_and_decode,
+    favorite_article_and_decode,
+    add_comment_to_article_and_decode,
+):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    author = await create_user_and_decode()
+
+    tag = str(uuid.uuid4())
+
+    article1 = await create_article_and_decode(author_token=author.token, tags=[tag])
+    article2 = await create_article_and_decode(author_token=author.token, tags=[tag])
+    article3 = await create_article_and_decode(author_token=author.token, tags=[tag])
+
+    await favorite_article_and_decode(user_token=user.token, slug=article1.slug)
+
+    # Comments weigh more than favorites.
+    await add_comment_to_article_and_decode(author_token=user.token, slug=article2.slug)
+
+    response = await client.get(make_list_articles_url(tag=tag, sort="trending"))
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    assert [article["slug"] for article in response_data["articles"]] == [
+        article2.slug,
+        article1.slug,
+        article3.slug,
+    ]
+
+    response = await client.delete(
+        f"/api/articles/{article1.slug}/favorite",
+        headers={
+            "Authorization": f"Token {user.token}",
+        },
+    )
+
+    assert response.status_code == 200
+
+    response = await client.get(make_list_articles_url(tag=tag, sort="trending"))
+
+    response_data = await response.json
+
+    assert [article["slug"] for article in response_data["articles"]] == [
+        article2.slug,
+        article3.slug,
+        article1.slug,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_when_compact_is_set_should_not_return_bodies(
+    app, create_user_and_decode, create_article_and_decode
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    article = await create_article_and_decode(author_token=author.token)
+
+    response = await client.get(
+        make_list_articles_url(author=author.username, compact=True)
+    )
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    articles = response_data["articles"]
+
+    assert len(articles) == 1
+    assert articles[0]["slug"] == article.slug
+    assert articles[0]["title"] == article.title
+    assert articles[0]["description"] == article.description
+    assert articles[0]["body"] is None
+    assert articles[0]["tagList"] == article.tag_list
+
+
+@pytest.mark.asyncio
+async def test_when_sort_is_invalid_should_return_422(app):
+    client = app.test_client()
+
+    response = await client.get(make_list_articles_url(sort="random"))
+
+    assert response.status_code == 422
+
+    response_data = await response.json
+
+    assert response_data["errors"]["body"][0] == "sort must be one of trending, top"
+
+
+@pytest.mark.xfail(
+    reason="list_articles reads favorited flags and author profiles per article",
+    strict=True,
+)
+@pytest.mark.asyncio
+async def test_should_not_query_per_article(
+    app,
+    faker,
+    create_user_and_decode,
+    follow_user_and_decode,
+    create_article_and_decode,
+    favorite_article_and_decode,
+    assert_max_queries,
+):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    author = await create_user_and_decode()
+
+    await follow_user_and_decode(follower_token=user.token, username=author.username)
+
+    for _ in range(3):
+        article = await create_article_and_decode(author_token=author.token)
+
+        await favorite_article_and_decode(user_token=user.token, slug=article.slug)
+
+    with assert_max_queries(3):
+        response = await client.get(
+            make_list_articles_url(author=author.username),
+            headers={
+                "Authorization": f"Token {user.token}",
+            },
+        )
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    assert response_data["articlesCount"] == 3
@@ -1,12 +1,32 @@
 import pytest
 import datetime
 import secrets
+import urllib.parse
 import uuid
+from typing import Optional
 from ..utils import create_jwt
 
 
-def make_list_comments_from_article_url(slug: str):
-    return f"/api/articles/{slug}/comments"
+def make_list_comments_from_article_url(
+    slug: str,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+):
+    params = {}
+
+    if limit is not None:
+        params["limit"] = limit
+
+    if offset is not None:
+        params["offset"] = offset
+
+    if cursor:
+        params["cursor"] = cursor
+
+    encoded_params = urllib.parse.urlencode(params)
+
+    return f"/api/articles/{slug}/comments?{encoded_params}"
 
 
 @pytest.mark.asyncio
@@ -264,3 +284,287 @@ async def test_when_user_is_not_found_should_return_401(
     response_data = await response.json
 
     assert response_data["errors"]["body"][0] == "unauthorized"
+
+
+@pytest.mark.asyncio
+async def test_when_limit_and_cursor_are_set_should_return_200(
+    app,
+    faker,
+    create_user_and_decode,
+    create_article_and_decode,
+    add_comment_to_article_and_decode,
+):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    author = await create_user_and_decode()
+
+    article = await create_article_and_decode(author_token=author.token)
+
+    created_comments = [
+        await add_comment_to_article_and_decode(
+            author_token=user.token, slug=article.slug
+        )
+        for _ in range(5)
+    ]
+
+    created_comments.reverse()
+
+    response1 = await client.get(
+        make_list_comments_from_article_url(slug=article.slug, limit=2),
+    )
+
+    assert response1.status_code == 200
+
+    response1_data = await response1.json
+
+    assert [comment["id"] for comment in response1_data["comments"]] == [
+        comment.id for comment in created_comments[0:2]
+    ]
+    assert response1_data["nextCursor"]
+
+    response2 = await client.get(
+        make_list_comments_from_article_url(
+            slug=article.slug, limit=2, cursor=response1_data["nextCursor"]
+        ),
+    )
+
+    assert response2.status_code == 200
+
+    response2_data = await response2.json
+
+    assert [comment["id"] for comment in response2_data["comments"]] == [
+        comment.id for comment in created_comments[2:4]
+    ]
+    assert response2_data["nextCursor"]
+
+    response3 = await client.get(
+        make_list_comments_from_article_url(
+            slug=article.slug, limit=2, cursor=response2_data["nextCursor"]
+        ),
+    )
+
+    assert response3.status_code == 200
+
+    response3_data = await response3.json
+
+    assert [comment["id"] for comment in response3_data["comments"]] == [
+        comment.id for comment in created_comments[4:5]
+    ]
+    assert response3_data["nextCursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_when_limit_and_offset_are_set_should_return_200(
+    app,
+    faker,
+    create_user_and_decode,
+    create_article_and_decode,
+    add_comment_to_article_and_decode,
+):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    author = await create_user_and_decode()
+
+    article = await create_article_and_decode(author_token=author.token)
+
+    created_comments = [
+        await add_comment_to_article_and_decode(
+            author_token=user.token, slug=article.slug
+        )
+        for _ in range(4)
+    ]
+
+    created_comments.reverse()
+
+    response = await client.get(
+        make_list_comments_from_article_url(slug=article.slug, limit=2, offset=1),
+    )
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    assert [comment["id"] for comment in response_data["comments"]] == [
+        comment.id for comment in created_comments[1:3]
+    ]
+    assert response_data["nextCursor"]
+
+
+@pytest.mark.asyncio
+async def test_when_cursor_is_invalid_should_return_422(
+    app, faker, create_user_and_decode, create_article_and_decode
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    article = await create_article_and_decode(author_token=author.token)
+
+    cursor = str(uuid.uuid4())
+
+    response = await client.get(
+        make_list_comments_from_article_url(slug=article.slug, cursor=cursor),
+    )
+
+    assert response.status_code == 422
+
+    response_data = await response.json
+
+    assert response_data["errors"]["body"][0] == f"invalid cursor {cursor}"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [0, -1, 101])
+async def test_when_limit_is_out_of_range_should_return_422(
+    app, create_user_and_decode, create_article_and_decode, limit
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    article = await create_article_and_decode(author_token=author.token)
+
+    response = await client.get(
+        make_list_comments_from_article_url(slug=article.slug, limit=limit),
+    )
+
+    assert response.status_code == 422
+
+    response_data = await response.json
+
+    assert (
+        response_data["errors"]["body"][0]
+        == "limit must be greater than 0 and at most 100"
+    )
+
+
+@pytest.mark.asyncio
+async def test_when_offset_is_negative_should_return_422(
+    app, create_user_and_decode, create_article_and_decode
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    article = await create_article_and_decode(author_token=author.token)
+
+    response = await client.get(
+        make_list_comments_from_article_url(slug=article.slug, offset=-1),
+    )
+
+    assert response.status_code == 422
+
+    response_data = await response.json
+
+    assert (
+        response_data["errors"]["body"][0]
+        == "offset must be greater than or equal to 0"
+    )
+
+
+@pytest.mark.asyncio
+async def test_when_offset_and_cursor_are_set_should_return_422(
+    app,
+    create_user_and_decode,
+    create_article_and_decode,
+    add_comment_to_article_and_decode,
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    article = await create_article_and_decode(author_token=author.token)
+
+    for _ in range(3):
+        await add_comment_to_article_and_decode(
+            author_token=author.token, slug=article.slug
+        )
+
+    response = await client.get(
+        make_list_comments_from_article_url(slug=article.slug, limit=2),
+    )
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    response = await client.get(
+        make_list_comments_from_article_url(
+            slug=article.slug, offset=1, cursor=response_data["nextCursor"]
+        ),
+    )
+
+    assert response.status_code == 422
+
+    response_data = await response.json
+
+    assert response_data["errors"]["body"][0] == "offset cannot be used with cursor"
+
+
+@pytest.mark.asyncio
+async def test_when_article_is_not_found_should_return_404(app, faker):
+    client = app.test_client()
+
+    slug = str(uuid.uuid4())
+
+    response = await client.get(
+        make_list_comments_from_article_url(slug=slug),
+    )
+
+    assert response.status_code == 404
+
+    response_data = await response.json
+
+    assert response_data["errors"]["body"][0] == f"slug {slug} not found"
+
+
+@pytest.mark.asyncio
+async def test_should_not_query_per_comment(
+    app,
+    faker,
+    create_user_and_decode,
+    follow_user_and_decode,
+    create_article_and_decode,
+    add_comment_to_article_and_decode,
+    assert_max_queries,
+):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    commenters = [await create_user_and_decode() for _ in range(3)]
+
+    await follow_user_and_decode(
+        follower_token=user.token, username=commenters[0].username
+    )
+
+    article = await create_article_and_decode(author_token=commenters[0].token)
+
+    for _ in range(3):
+        for commenter in commenters:
+            await add_comment_to_article_and_decode(
+                author_token=commenter.token, slug=article.slug
+            )
+
+    with assert_max_queries(3):
+        response = await client.get(
+            make_list_comments_from_article_url(slug=article.slug),
+            headers={
+                "Authorization": f"Token {user.token}",
+            },
+        )
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    assert len(response_data["comments"]) == 9
+
+    for comment in response_data["comments"]:
+        assert comment["author"]["following"] == (
+            comment["author"]["username"] == commenters[0].username
+        )
@@ -0,0 +1,335 @@
+import pytest
+import datetime
+import secrets
+import string
+import urllib.parse
+import uuid
+from typing import Optional
+from ..utils import create_jwt
+
+
+def make_search_articles_url(
+    q: str,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    compact: Optional[bool] = None,
+):
+    params = {"q": q}
+
+    if limit is not None:
+        params["limit"] = limit
+
+    if cursor:
+        params["cursor"] = cursor
+
+    if compact:
+        params["compact"] = "true"
+
+    encoded_params = urllib.parse.urlencode(params)
+
+    return f"/api/articles/search?{encoded_params}"
+
+
+def make_word() -> str:
+    return "".join(secrets.choice(string.ascii_lowercase) for _ in range(16))
+
+
+@pytest.mark.asyncio
+async def test_when_token_is_sent_should_return_200(
+    app,
+    faker,
+    create_user_and_decode,
+    follow_user_and_decode,
+    create_article_and_decode,
+    favorite_article_and_decode,
+):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    author1 = await create_user_and_decode()
+    author2 = await create_user_and_decode()
+
+    word = make_word()
+
+    article1 = await create_article_and_decode(
+        author_token=author1.token, body=f"{faker.paragraph()} {word}"
+    )
+    article2 = await create_article_and_decode(
+        author_token=author2.token, title=f"{faker.sentence()} {word}"
+    )
+    await create_article_and_decode(author_token=author1.token)
+
+    await follow_user_and_decode(follower_token=user.token, username=author2.username)
+
+    await favorite_article_and_decode(user_token=user.token, slug=article1.slug)
+
+    response = await client.get(
+        make_search_articles_url(q=word),
+        headers={
+            "Authorization": f"Token {user.token}",
+        },
+    )
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    articles = response_data["articles"]
+
+    assert len(articles) == 2
+    assert response_data["articlesCount"] == 2
+    assert response_data["nextCursor"] is None
+
+    assert articles[0]["slug"] == article2.slug
+    assert articles[0]["title"] == article2.title
+    assert articles[0]["description"] == article2.description
+    assert articles[0]["body"] == article2.body
+    assert articles[0]["tagList"] == article2.tag_list
+    created_at = datetime.datetime.fromisoformat(articles[0]["createdAt"])
+    updated_at = datetime.datetime.fromisoformat(articles[0]["updatedAt"])
+    assert created_at == article2.created_at
+    assert updated_at == article2.updated_at
+    assert not articles[0]["favorited"]
+    assert articles[0]["favoritesCount"] == 0
+    assert articles[0]["author"] == {
+        "username": author2.username,
+        "bio": author2.bio,
+        "image": author2.image,
+        "following": True,
+    }
+
+    assert articles[1]["slug"] == article1.slug
+    assert articles[1]["favorited"]
+    assert articles[1]["favoritesCount"] == 1
+    assert articles[1]["author"] == {
+        "username": author1.username,
+        "bio": author1.bio,
+        "image": author1.image,
+        "following": False,
+    }
+
+
+@pytest.mark.asyncio
+async def test_when_token_is_not_sent_should_return_200(
+    app, faker, create_user_and_decode, create_article_and_decode
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    word = make_word()
+
+    article = await create_article_and_decode(
+        author_token=author.token, description=f"{faker.sentence()} {word}"
+    )
+
+    response = await client.get(make_search_articles_url(q=word))
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    articles = response_data["articles"]
+
+    assert len(articles) == 1
+    assert articles[0]["slug"] == article.slug
+    assert not articles[0]["favorited"]
+    assert not articles[0]["author"]["following"]
+
+
+@pytest.mark.asyncio
+async def test_when_results_span_pages_should_return_each_article_once(
+    app, faker, create_user_and_decode, create_article_and_decode
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    word = make_word()
+
+    articles = [
+        await create_article_and_decode(
+            author_token=author.token, body=f"{faker.paragraph()} {word}"
+        )
+        for _ in range(5)
+    ]
+
+    slugs = []
+    cursor = None
+
+    for _ in range(3):
+        response = await client.get(
+            make_search_articles_url(q=word, limit=2, cursor=cursor)
+        )
+
+        assert response.status_code == 200
+
+        response_data = await response.json
+
+        slugs.extend(article["slug"] for article in response_data["articles"])
+        cursor = response_data["nextCursor"]
+
+    assert cursor is None
+    assert sorted(slugs) == sorted(article.slug for article in articles)
+
+
+@pytest.mark.asyncio
+async def test_when_compact_is_set_should_not_return_bodies(
+    app, faker, create_user_and_decode, create_article_and_decode
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    word = make_word()
+
+    article = await create_article_and_decode(
+        author_token=author.token, body=f"{faker.paragraph()} {word}"
+    )
+
+    response = await client.get(make_search_articles_url(q=word, compact=True))
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    articles = response_data["articles"]
+
+    assert len(articles) == 1
+    assert articles[0]["slug"] == article.slug
+    assert articles[0]["body"] is None
+
+
+@pytest.mark.asyncio
+async def test_when_article_is_deleted_should_not_return_it(
+    app, faker, create_user_and_decode, create_article_and_decode
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    word = make_word()
+
+    article = await create_article_and_decode(
+        author_token=author.token, title=f"{faker.sentence()} {word}"
+    )
+
+    response = await client.delete(
+        f"/api/articles/{article.slug}",
+        headers={
+            "Authorization": f"Token {author.token}",
+        },
+    )
+
+    assert response.status_code == 204
+
+    response = await client.get(make_search_articles_url(q=word))
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    assert response_data["articles"] == []
+
+
+@pytest.mark.asyncio
+async def test_should_not_query_per_article(
+    app, faker, create_user_and_decode, create_article_and_decode, assert_max_queries
+):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    word = make_word()
+
+    for _ in range(5):
+        author = await create_user_and_decode()
+        await create_article_and_decode(
+            author_token=author.token, body=f"{faker.paragraph()} {word}"
+        )
+
+    with assert_max_queries(2):
+        response = await client.get(
+            make_search_articles_url(q=word),
+            headers={
+                "Authorization": f"Token {user.token}",
+            },
+        )
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    assert len(response_data["articles"]) == 5
+
+
+@pytest.mark.asyncio
+async def test_when_q_is_blank_should_return_422(app):
+    client = app.test_client()
+
+    response = await client.get(make_search_articles_url(q=" "))
+
+    assert response.status_code == 422
+
+    response_data = await response.json
+
+    assert response_data["errors"]["body"][0] == "q must not be empty"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [0, -1, 101])
+async def test_when_limit_is_out_of_range_should_return_422(app, limit):
+    client = app.test_client()
+
+    response = await client.get(make_search_articles_url(q=make_word(), limit=limit))
+
+    assert response.status_code == 422
+
+    response_data = await response.json
+
+    assert (
+        response_data["errors"]["body"][0]
+        == "limit must be greater than 0 and at most 100"
+    )
+
+
+@pytest.mark.asyncio
+async def test_when_cursor_is_invalid_should_return_422(app):
+    client = app.test_client()
+
+    cursor = str(uuid.uuid4())
+
+    response = await client.get(make_search_articles_url(q=make_word(), cursor=cursor))
+
+    assert response.status_code == 422
+
+    response_data = await response.json
+
+    assert response_data["errors"]["body"][0] == f"invalid cursor {cursor}"
+
+
+@pytest.mark.asyncio
+async def test_when_token_has_invalid_signature_should_return_401(
+    app, faker, create_user_and_decode
+):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    secret_key = secrets.token_urlsafe()
+
+    token = create_jwt(username=user.username, secret_key=secret_key)
+
+    response = await client.get(
+        make_search_articles_url(q=make_word()),
+        headers={
+            "Authorization": f"Token {token}",
+        },
+    )
+
+    assert response.status_code == 401
+
+    response_data = await response.json
+
+    assert response_data["errors"]["body"][0] == "unauthorized"
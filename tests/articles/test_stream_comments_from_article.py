@@ -0,0 +1,129 @@
+import asyncio
+import json
+
+import pytest
+from quart.testing.connections import WebsocketDisconnectError
+
+
+def make_stream_comments_from_article_url(slug: str) -> str:
+    return f"/api/articles/{slug}/comments/stream"
+
+
+async def receive_sse_event(connection) -> dict:
+    """Receives chunks until an event, skipping comments."""
+    while True:
+        chunk = (await asyncio.wait_for(connection.receive(), timeout=5)).decode()
+
+        if chunk.startswith(":"):
+            continue
+
+        fields = dict(line.split(": ", 1) for line in chunk.strip().split("\n"))
+
+        return {"event": fields["event"], "data": json.loads(fields["data"])}
+
+
+@pytest.mark.asyncio
+async def test_should_stream_added_and_deleted_comments_as_server_sent_events(
+    app,
+    create_user_and_decode,
+    create_article_and_decode,
+    add_comment_to_article_and_decode,
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    commenter = await create_user_and_decode()
+
+    article = await create_article_and_decode(author_token=author.token)
+
+    other_article = await create_article_and_decode(author_token=author.token)
+
+    async with client.request(
+        make_stream_comments_from_article_url(slug=article.slug)
+    ) as connection:
+        subscribed = await asyncio.wait_for(connection.receive(), timeout=5)
+
+        assert subscribed == b": subscribed\n\n"
+
+        await add_comment_to_article_and_decode(
+            author_token=commenter.token, slug=other_article.slug
+        )
+
+        comment = await add_comment_to_article_and_decode(
+            author_token=commenter.token, slug=article.slug
+        )
+
+        added_event = await receive_sse_event(connection)
+
+        response = await client.delete(
+            f"/api/articles/{article.slug}/comments/{comment.id}",
+            headers={
+                "Authorization": f"Token {commenter.token}",
+            },
+        )
+
+        assert response.status_code == 204
+
+        deleted_event = await receive_sse_event(connection)
+
+        await connection.disconnect()
+
+    assert added_event["event"] == "comment"
+    assert added_event["data"]["id"] == comment.id
+    assert added_event["data"]["body"] == comment.body
+    assert added_event["data"]["author"]["username"] == commenter.username
+    assert added_event["data"]["author"]["following"] is False
+    assert deleted_event == {"event": "deletedComment", "data": {"id": comment.id}}
+
+
+@pytest.mark.asyncio
+async def test_should_stream_added_comments_over_websocket(
+    app,
+    create_user_and_decode,
+    create_article_and_decode,
+    add_comment_to_article_and_decode,
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    commenter = await create_user_and_decode()
+
+    article = await create_article_and_decode(author_token=author.token)
+
+    async with client.websocket(
+        make_stream_comments_from_article_url(slug=article.slug)
+    ) as websocket:
+        await asyncio.sleep(0.1)
+
+        comment = await add_comment_to_article_and_decode(
+            author_token=commenter.token, slug=article.slug
+        )
+
+        message = await asyncio.wait_for(websocket.receive_json(), timeout=5)
+
+    assert message["event"] == "comment"
+    assert message["data"]["id"] == comment.id
+    assert message["data"]["body"] == comment.body
+
+
+@pytest.mark.asyncio
+async def test_when_article_does_not_exist_should_return_404_or_close_websocket(
+    app, faker
+):
+    client = app.test_client()
+
+    slug = faker.slug()
+
+    response = await client.get(make_stream_comments_from_article_url(slug=slug))
+
+    assert response.status_code == 404
+
+    with pytest.raises(WebsocketDisconnectError) as exc_info:
+        async with client.websocket(
+            make_stream_comments_from_article_url(slug=slug)
+        ) as websocket:
+            await asyncio.wait_for(websocket.receive(), timeout=5)
+
+    assert exc_info.value.args == (1008,)
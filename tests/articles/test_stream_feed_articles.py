@@ -0,0 +1,129 @@
+import asyncio
+import json
+
+import pytest
+from quart.testing.connections import WebsocketDisconnectError
+
+feed_stream_url = "/api/articles/feed/stream"
+
+
+async def receive_sse_event(connection) -> dict:
+    """Receives chunks until an event, skipping comments."""
+    while True:
+        chunk = (await asyncio.wait_for(connection.receive(), timeout=5)).decode()
+
+        if chunk.startswith(":"):
+            continue
+
+        fields = dict(line.split(": ", 1) for line in chunk.strip().split("\n"))
+
+        return {"event": fields["event"], "data": json.loads(fields["data"])}
+
+
+@pytest.mark.asyncio
+async def test_should_stream_followed_authors_articles_as_server_sent_events(
+    app, create_user_and_decode, follow_user_and_decode, create_article_and_decode
+):
+    client = app.test_client()
+
+    follower = await create_user_and_decode()
+
+    author = await create_user_and_decode()
+
+    await follow_user_and_decode(
+        follower_token=follower.token, username=author.username
+    )
+
+    async with client.request(
+        feed_stream_url, headers={"Authorization": f"Token {follower.token}"}
+    ) as connection:
+        subscribed = await asyncio.wait_for(connection.receive(), timeout=5)
+
+        assert subscribed == b": subscribed\n\n"
+
+        created_article = await create_article_and_decode(author_token=author.token)
+
+        event = await receive_sse_event(connection)
+
+        await connection.disconnect()
+
+    assert event["event"] == "article"
+    assert event["data"]["slug"] == created_article.slug
+    assert event["data"]["title"] == created_article.title
+    assert "body" in event["data"] and event["data"]["body"] is None
+    assert event["data"]["author"]["username"] == author.username
+    assert event["data"]["author"]["following"] is True
+    assert event["data"]["favorited"] is False
+    assert event["data"]["favoritesCount"] == 0
+
+
+@pytest.mark.asyncio
+async def test_should_stream_followed_authors_articles_over_websocket(
+    app, create_user_and_decode, follow_user_and_decode, create_article_and_decode
+):
+    client = app.test_client()
+
+    follower = await create_user_and_decode()
+
+    author = await create_user_and_decode()
+
+    unfollowed_author = await create_user_and_decode()
+
+    await follow_user_and_decode(
+        follower_token=follower.token, username=author.username
+    )
+
+    async with client.websocket(
+        feed_stream_url, query_string={"token": follower.token}
+    ) as websocket:
+        await asyncio.sleep(0.1)
+
+        await create_article_and_decode(author_token=unfollowed_author.token)
+
+        created_article = await create_article_and_decode(author_token=author.token)
+
+        message = await asyncio.wait_for(websocket.receive_json(), timeout=5)
+
+    assert message["event"] == "article"
+    assert message["data"]["slug"] == created_article.slug
+    assert message["data"]["author"]["username"] == author.username
+
+
+@pytest.mark.asyncio
+async def test_when_subscriber_overflows_should_drop_it(app):
+    from conduit.subscriptions import Event, Subscriptions
+
+    subscriptions = Subscriptions(
+        name="test", queue_size=2, metrics_registry=app.app.metrics_registry
+    )
+
+    with subscriptions.subscribe(key="subscriber") as subscription:
+        for _ in range(3):
+            subscriptions.publish(
+                key="subscriber", event=Event(name="article", data="{}")
+            )
+
+        assert subscription.overflowed is True
+        assert await subscription.get(timeout=1) is None
+
+    assert subscriptions.keys() == []
+
+
+@pytest.mark.asyncio
+async def test_when_no_token_should_return_401(app):
+    client = app.test_client()
+
+    response = await client.get(feed_stream_url)
+
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_when_no_token_should_close_websocket(app):
+    client = app.test_client()
+
+    with pytest.raises(WebsocketDisconnectError) as exc_info:
+        async with client.websocket(feed_stream_url) as websocket:
+            await asyncio.wait_for(websocket.receive(), timeout=5)
+
+    assert exc_info.value.args == (1008,)
@@ -0,0 +1,174 @@
+import json
+import pytest
+import urllib.parse
+import uuid
+from typing import Optional
+
+
+def make_suggest_tags_url(prefix: str, limit: Optional[int] = None) -> str:
+    params = {"prefix": prefix}
+
+    if limit:
+        params["limit"] = limit
+
+    encoded_params = urllib.parse.urlencode(params)
+
+    return f"/api/tags/suggest?{encoded_params}"
+
+
+@pytest.mark.asyncio
+async def test_should_return_200(
+    app, create_user_and_decode, create_article_and_decode
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    prefix = uuid.uuid4().hex
+
+    tag1 = f"{prefix}-a"
+    tag2 = f"{prefix}-b"
+    tag3 = f"{prefix}-c"
+
+    await create_article_and_decode(author_token=author.token, tags=[tag1, tag3])
+    await create_article_and_decode(author_token=author.token, tags=[tag1, tag2])
+    await create_article_and_decode(author_token=author.token, tags=[tag1, tag3])
+
+    response = await client.get(make_suggest_tags_url(prefix=prefix))
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    assert response_data["tags"] == [tag1, tag3, tag2]
+
+    response = await client.get(make_suggest_tags_url(prefix=f"{prefix}-c"))
+
+    response_data = await response.json
+
+    assert response_data["tags"] == [tag3]
+
+
+@pytest.mark.asyncio
+async def test_when_limit_is_set_should_return_the_most_used_tags(
+    app, create_user_and_decode, create_article_and_decode
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    prefix = uuid.uuid4().hex
+
+    tag1 = f"{prefix}-a"
+    tag2 = f"{prefix}-b"
+
+    await create_article_and_decode(author_token=author.token, tags=[tag1])
+    await create_article_and_decode(author_token=author.token, tags=[tag2])
+    await create_article_and_decode(author_token=author.token, tags=[tag2])
+
+    response = await client.get(make_suggest_tags_url(prefix=prefix.upper(), limit=1))
+
+    assert response.status_code == 200
+
+    response_data = await response.json
+
+    assert response_data["tags"] == [tag2]
+
+
+@pytest.mark.asyncio
+async def test_when_article_tags_are_updated_should_return_the_new_tags(
+    app, create_user_and_decode, create_article_and_decode
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    prefix = uuid.uuid4().hex
+
+    tag1 = f"{prefix}-a"
+    tag2 = f"{prefix}-b"
+
+    article = await create_article_and_decode(author_token=author.token, tags=[tag1])
+
+    response = await client.put(
+        f"/api/articles/{article.slug}",
+        data=json.dumps({"article": {"tagList": [tag2]}}),
+        headers={
+            "Content-Type": "application/json",
+            "Authorization": f"Token {author.token}",
+        },
+    )
+
+    assert response.status_code == 200
+
+    response = await client.get(make_suggest_tags_url(prefix=prefix))
+
+    response_data = await response.json
+
+    assert response_data["tags"] == [tag2]
+
+
+@pytest.mark.asyncio
+async def test_when_article_is_deleted_should_not_return_its_tags(
+    app, create_user_and_decode, create_article_and_decode
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    prefix = uuid.uuid4().hex
+
+    tag1 = f"{prefix}-a"
+    tag2 = f"{prefix}-b"
+
+    article = await create_article_and_decode(author_token=author.token, tags=[tag1])
+    await create_article_and_decode(author_token=author.token, tags=[tag2])
+
+    response = await client.delete(
+        f"/api/articles/{article.slug}",
+        headers={
+            "Authorization": f"Token {author.token}",
+        },
+    )
+
+    assert response.status_code == 204
+
+    response = await client.get(make_suggest_tags_url(prefix=prefix))
+
+    response_data = await response.json
+
+    assert response_data["tags"] == [tag2]
+
+
+@pytest.mark.asyncio
+async def test_should_not_query_the_database(
+    app, create_user_and_decode, create_article_and_decode, assert_max_queries
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    prefix = uuid.uuid4().hex
+
+    await create_article_and_decode(author_token=author.token, tags=[f"{prefix}-a"])
+
+    with assert_max_queries(0):
+        response = await client.get(make_suggest_tags_url(prefix=prefix))
+
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_when_limit_is_too_large_should_return_422(app):
+    client = app.test_client()
+
+    response = await client.get(make_suggest_tags_url(prefix="a", limit=21))
+
+    assert response.status_code == 422
+
+    response_data = await response.json
+
+    assert (
+        response_data["errors"]["body"][0]
+        == "limit must be greater than 0 and at most 20"
+    )
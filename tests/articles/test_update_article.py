@@ -562,3 +562,37 @@ async def test_when_user_is_not_found_should_return_401(
     response_data = await response.json
 
     assert response_data["errors"]["body"][0] == "unauthorized"
+
+
+@pytest.mark.asyncio
+async def test_should_run_a_fixed_number_of_statements(
+    app, faker, create_user_and_decode, create_article_and_decode, count_statements
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    article = await create_article_and_decode(author_token=author.token)
+
+    data = {
+        "article": {
+            "title": faker.sentence(),
+            "description": faker.sentence(),
+            "body": faker.paragraph(),
+            "tagList": faker.words(nb=10),
+        }
+    }
+
+    with count_statements() as statements:
+        response = await client.put(
+            make_update_article_url(slug=article.slug),
+            data=json.dumps(data),
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Token {author.token}",
+            },
+        )
+
+    assert response.status_code == 200
+
+    assert len(statements) == 3
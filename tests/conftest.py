@@ -1,9 +1,12 @@
+import collections
+import contextlib
 import datetime
 import json
 import random
 import uuid
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
+import psycopg
 import pytest
 import pytest_asyncio
 from dotenv import load_dotenv
@@ -27,6 +30,110 @@ async def _app():
         yield test_app
 
 
+@pytest.fixture(scope="function")
+def count_statements(app):
+    @contextlib.contextmanager
+    def _count_statements(
+        aconns: Optional[List[psycopg.AsyncConnection]] = None,
+    ) -> Iterator[List[str]]:
+        statements = []
+
+        if aconns is None:
+            query_instrumentation = app.app.query_instrumentation
+
+            def _count_statement(executed_query):
+                statements.append(executed_query.statement)
+
+            query_instrumentation.add_listener(_count_statement)
+
+            try:
+                yield statements
+            finally:
+                query_instrumentation.remove_listener(_count_statement)
+
+            return
+
+        cursor_factories = [aconn.cursor_factory for aconn in aconns]
+
+        for aconn, cursor_factory in zip(aconns, cursor_factories):
+
+            class _CountingAsyncCursor(cursor_factory):
+                async def execute(self, query, params=None, **kwargs):
+                    statements.append(query)
+                    return await super().execute(query, params, **kwargs)
+
+            aconn.cursor_factory = _CountingAsyncCursor
+
+        try:
+            yield statements
+        finally:
+            for aconn, cursor_factory in zip(aconns, cursor_factories):
+                aconn.cursor_factory = cursor_factory
+
+    yield _count_statements
+
+
+@pytest.fixture(scope="function")
+def assert_max_queries(count_statements):
+    """Fails the test when the block executes more than max_queries statements, or
+    the same statement fingerprint more than max_repeats times, which usually
+    means a query per row (N+1).
+    """
+    from conduit.database import fingerprint_statement, normalize_statement
+
+    @contextlib.contextmanager
+    def _assert_max_queries(
+        max_queries: int, max_repeats: int = 1
+    ) -> Iterator[List[str]]:
+        with count_statements() as statements:
+            yield statements
+
+        fingerprints = [fingerprint_statement(statement) for statement in statements]
+
+        executed_statements = "\n".join(
+            f"[{fingerprint}] {normalize_statement(statement)}"
+            for fingerprint, statement in zip(fingerprints, statements)
+        )
+
+        assert len(statements) <= max_queries, (
+            f"{len(statements)} queries executed, "
+            f"expected at most {max_queries}:\n{executed_statements}"
+        )
+
+        repeated_fingerprints = [
+            f"[{fingerprint}] executed {count} times"
+            for fingerprint, count in collections.Counter(fingerprints).items()
+            if count > max_repeats
+        ]
+
+        assert not repeated_fingerprints, (
+            f"queries executed more than {max_repeats} times: "
+            f"{', '.join(repeated_fingerprints)}:\n{executed_statements}"
+        )
+
+    yield _assert_max_queries
+
+
+@pytest.fixture(scope="function")
+def hold_dedicated_connections(app):
+    """Opens as many dedicated connections as a worker allows, so the block runs
+    with none left.
+    """
+
+    @contextlib.asynccontextmanager
+    async def _hold_dedicated_connections():
+        async with app.app.app_context():
+            async with contextlib.AsyncExitStack() as stack:
+                for _ in range(app.app.config["DATABASE_MAX_DEDICATED_CONNECTIONS"]):
+                    await stack.enter_async_context(
+                        app.app.aconn.dedicated_connection()
+                    )
+
+                yield
+
+    yield _hold_dedicated_connections
+
+
 @pytest.fixture(scope="function", autouse=True)
 def faker_seed():
     return random.random()
@@ -179,15 +286,19 @@ async def get_profile_and_decode(app):
 @pytest_asyncio.fixture(scope="function")
 async def create_article_and_decode(app, faker):
     async def _create_article_and_decode(
-        author_token: str, tags: Optional[List[str]] = None
+        author_token: str,
+        tags: Optional[List[str]] = None,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        body: Optional[str] = None,
     ) -> Article:
         client = app.test_client()
 
         data = {
             "article": {
-                "title": faker.sentence(),
-                "description": faker.sentence(),
-                "body": faker.paragraph(),
+                "title": title if title else faker.sentence(),
+                "description": description if description else faker.sentence(),
+                "body": body if body else faker.paragraph(),
                 "tagList": tags if tags else faker.words(nb=10, unique=True),
             }
         }
@@ -0,0 +1,80 @@
+import psycopg
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_after_reading_from_replicas_should_not_leave_them_in_a_transaction(
+    app, create_user_and_decode, create_article_and_decode
+):
+    author = await create_user_and_decode()
+
+    article = await create_article_and_decode(author_token=author.token)
+
+    async with app.app.app_context():
+        for _ in app.app.aconn.replicas:
+            await app.app.articles_service.get_article_by_slug(slug=article.slug)
+
+    for replica in app.app.aconn.replicas:
+        assert replica.info.transaction_status == psycopg.pq.TransactionStatus.IDLE
+
+
+@pytest.mark.asyncio
+async def test_when_replicas_are_not_lagging_should_keep_them(app):
+    router = app.app.aconn
+
+    await router.check_replicas_lag()
+
+    async with app.app.test_request_context("/api/articles"):
+        assert router.get_read_connection() in router.replicas
+
+
+@pytest.mark.asyncio
+async def test_when_replica_lags_should_eject_it(app, monkeypatch):
+    router = app.app.aconn
+
+    async def _get_replica_lag_seconds(replica):
+        return app.app.config["DATABASE_REPLICA_MAX_LAG_SECONDS"] + 1
+
+    monkeypatch.setattr(router, "_get_replica_lag_seconds", _get_replica_lag_seconds)
+
+    await router.check_replicas_lag()
+
+    async with app.app.test_request_context("/api/articles"):
+        assert router.get_read_connection() is router.primary
+
+    monkeypatch.undo()
+
+    await router.check_replicas_lag()
+
+    async with app.app.test_request_context("/api/articles"):
+        assert router.get_read_connection() in router.replicas
+
+
+@pytest.mark.asyncio
+async def test_when_replica_fails_should_eject_it_and_reconnect_it(app, monkeypatch):
+    router = app.app.aconn
+
+    failed_replicas = router.replicas
+
+    async def _get_replica_lag_seconds(replica):
+        await replica.close()
+        raise psycopg.OperationalError("server closed the connection unexpectedly")
+
+    monkeypatch.setattr(router, "_get_replica_lag_seconds", _get_replica_lag_seconds)
+
+    await router.check_replicas_lag()
+
+    async with app.app.test_request_context("/api/articles"):
+        assert router.get_read_connection() is router.primary
+
+    monkeypatch.undo()
+
+    await router.check_replicas_lag()
+
+    for failed_replica, replica in zip(failed_replicas, router.replicas):
+        assert failed_replica.closed
+        assert replica is not failed_replica
+        assert not replica.closed
+
+    async with app.app.test_request_context("/api/articles"):
+        assert router.get_read_connection() in router.replicas
@@ -0,0 +1,87 @@
+import contextlib
+import logging
+
+import pytest
+
+
+@contextlib.contextmanager
+def slow_query_threshold(app, threshold_seconds: float):
+    slow_query_log = app.app.slow_query_log
+
+    previous_threshold_seconds = slow_query_log.threshold_seconds
+
+    slow_query_log.threshold_seconds = threshold_seconds
+
+    try:
+        yield slow_query_log
+    finally:
+        slow_query_log.threshold_seconds = previous_threshold_seconds
+
+
+@pytest.mark.asyncio
+async def test_when_query_is_slower_than_threshold_should_log_it_with_its_plan(
+    app, faker, create_user_and_decode, caplog
+):
+    caplog.set_level(logging.WARNING, logger="conduit.database.slow_query_log")
+
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    with slow_query_threshold(app=app, threshold_seconds=0) as slow_query_log:
+        response = await client.get(
+            f"/api/profiles/{user.username}",
+        )
+
+        await slow_query_log.join()
+
+    assert response.status_code == 200
+
+    slow_query_records = [
+        record
+        for record in caplog.records
+        if record.name == "conduit.database.slow_query_log"
+        and "SELECT id, email, bio, image FROM users WHERE username = ?"
+        in record.getMessage()
+    ]
+
+    assert slow_query_records
+
+    message = slow_query_records[0].getMessage()
+
+    assert "on GET profiles.get_profile" in message
+    assert '"Plan": {"Node Type"' in message
+
+
+@pytest.mark.asyncio
+async def test_when_query_was_explained_recently_should_log_it_without_plan(
+    app, faker, create_user_and_decode, caplog
+):
+    caplog.set_level(logging.WARNING, logger="conduit.database.slow_query_log")
+
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    with slow_query_threshold(app=app, threshold_seconds=0) as slow_query_log:
+        for _ in range(2):
+            response = await client.get(
+                f"/api/profiles/{user.username}",
+            )
+
+            assert response.status_code == 200
+
+        await slow_query_log.join()
+
+    messages = [
+        record.getMessage()
+        for record in caplog.records
+        if record.name == "conduit.database.slow_query_log"
+        and "SELECT id, email, bio, image FROM users WHERE username = ?"
+        in record.getMessage()
+    ]
+
+    assert len(messages) == 2
+    assert (
+        len([message for message in messages if "plan: not captured" in message]) == 1
+    )
@@ -0,0 +1,67 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from .test_get_metrics import get_metrics, get_sample_value
+
+
+def block_event_loop(seconds: float):
+    time.sleep(seconds)
+
+
+@pytest.mark.asyncio
+async def test_should_record_event_loop_lag(app):
+    client = app.test_client()
+
+    metrics_before = await get_metrics(client=client)
+
+    block_event_loop(seconds=0.3)
+
+    await asyncio.sleep(0.3)
+
+    metrics_after = await get_metrics(client=client)
+
+    assert "# TYPE event_loop_lag_seconds histogram" in metrics_after
+
+    assert get_sample_value(metrics_after, "event_loop_lag_seconds_count") > (
+        get_sample_value(metrics_before, "event_loop_lag_seconds_count") or 0
+    )
+    assert (
+        get_sample_value(metrics_after, "event_loop_lag_seconds_sum")
+        >= (get_sample_value(metrics_before, "event_loop_lag_seconds_sum") or 0) + 0.1
+    )
+
+
+@pytest.mark.asyncio
+async def test_when_event_loop_is_blocked_should_log_the_blocking_stack(caplog):
+    from conduit.metrics import EventLoopMonitor, MetricsRegistry
+
+    caplog.set_level(logging.WARNING, logger="conduit.metrics.event_loop_monitor")
+
+    event_loop_monitor = EventLoopMonitor(
+        metrics_registry=MetricsRegistry(),
+        interval_seconds=0.01,
+        blocking_threshold_seconds=0.1,
+    )
+
+    event_loop_monitor_task = asyncio.create_task(event_loop_monitor.monitor())
+
+    await asyncio.sleep(0.05)
+
+    block_event_loop(seconds=0.5)
+
+    await asyncio.sleep(0.05)
+
+    event_loop_monitor_task.cancel()
+
+    messages = [
+        record.getMessage()
+        for record in caplog.records
+        if record.name == "conduit.metrics.event_loop_monitor"
+    ]
+
+    assert len(messages) == 1
+    assert "event loop blocked for more than" in messages[0]
+    assert "in block_event_loop" in messages[0]
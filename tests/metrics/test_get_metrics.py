@@ -0,0 +1,192 @@
+import json
+from typing import Optional
+
+import pytest
+
+
+def make_get_metrics_url():
+    return "/metrics"
+
+
+async def get_metrics(client) -> str:
+    response = await client.get(make_get_metrics_url())
+
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain")
+
+    return await response.get_data(as_text=True)
+
+
+def get_sample_value(metrics: str, sample: str) -> Optional[float]:
+    for line in metrics.splitlines():
+        if line.startswith(f"{sample} "):
+            return float(line.split(" ")[-1])
+
+    return None
+
+
+@pytest.mark.asyncio
+async def test_should_return_200(app):
+    client = app.test_client()
+
+    requests_total_sample = (
+        'http_requests_total{endpoint="articles.get_tags",method="GET",status="200"}'
+    )
+    request_duration_count_sample = 'http_request_duration_seconds_count{endpoint="articles.get_tags",method="GET",status="200"}'
+
+    metrics_before = await get_metrics(client=client)
+
+    response = await client.get("/api/tags")
+
+    assert response.status_code == 200
+
+    metrics_after = await get_metrics(client=client)
+
+    assert "# TYPE http_requests_total counter" in metrics_after
+    assert "# TYPE http_request_duration_seconds histogram" in metrics_after
+    assert "# TYPE http_requests_in_flight gauge" in metrics_after
+
+    assert (
+        get_sample_value(metrics_after, requests_total_sample)
+        == (get_sample_value(metrics_before, requests_total_sample) or 0) + 1
+    )
+    assert (
+        get_sample_value(metrics_after, request_duration_count_sample)
+        == (get_sample_value(metrics_before, request_duration_count_sample) or 0) + 1
+    )
+    assert get_sample_value(
+        metrics_after,
+        'http_request_duration_seconds_bucket{endpoint="articles.get_tags",method="GET",status="200",le="+Inf"}',
+    ) == get_sample_value(metrics_after, request_duration_count_sample)
+    assert (
+        get_sample_value(
+            metrics_after,
+            'http_requests_in_flight{endpoint="metrics.get_metrics",method="GET"}',
+        )
+        == 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_when_route_is_not_found_should_label_as_unmatched(app):
+    client = app.test_client()
+
+    response = await client.get("/api/not-found")
+
+    assert response.status_code == 404
+
+    metrics = await get_metrics(client=client)
+
+    assert (
+        get_sample_value(
+            metrics,
+            'http_requests_total{endpoint="unmatched",method="GET",status="404"}',
+        )
+        >= 1
+    )
+    assert (
+        get_sample_value(
+            metrics,
+            'http_request_duration_seconds_count{endpoint="unmatched",method="GET",status="404"}',
+        )
+        >= 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_when_metrics_dir_is_set_should_aggregate_workers(app, tmp_path):
+    client = app.test_client()
+
+    metrics_registry = app.app.metrics_registry
+
+    requests_total_sample = (
+        'http_requests_total{endpoint="articles.get_tags",method="GET",status="200"}'
+    )
+    requests_in_flight_sample = (
+        'http_requests_in_flight{endpoint="articles.get_tags",method="GET"}'
+    )
+
+    dead_worker_pid = 2**22 + 1
+
+    with open(tmp_path / f"{dead_worker_pid}.json", "w") as f:
+        json.dump(
+            {
+                "http_requests_total": {
+                    json.dumps(["articles.get_tags", "GET", "200"]): 5
+                },
+                "http_requests_in_flight": {
+                    json.dumps(["articles.get_tags", "GET"]): 3
+                },
+            },
+            f,
+        )
+
+    metrics_before = await get_metrics(client=client)
+
+    metrics_registry.directory = str(tmp_path)
+
+    try:
+        metrics_after = await get_metrics(client=client)
+    finally:
+        metrics_registry.directory = None
+
+    assert (
+        get_sample_value(metrics_after, requests_total_sample)
+        == (get_sample_value(metrics_before, requests_total_sample) or 0) + 5
+    )
+    assert get_sample_value(metrics_after, requests_in_flight_sample) == (
+        get_sample_value(metrics_before, requests_in_flight_sample)
+    )
+
+
+@pytest.mark.asyncio
+async def test_should_record_database_queries_per_request(app):
+    client = app.test_client()
+
+    request_db_queries_count_sample = (
+        'http_request_db_queries_count{endpoint="articles.get_tags",method="GET"}'
+    )
+    request_db_queries_sum_sample = (
+        'http_request_db_queries_sum{endpoint="articles.get_tags",method="GET"}'
+    )
+
+    metrics_before = await get_metrics(client=client)
+
+    response = await client.get("/api/tags")
+
+    assert response.status_code == 200
+
+    metrics_after = await get_metrics(client=client)
+
+    assert "# TYPE db_query_duration_seconds histogram" in metrics_after
+    assert "# TYPE http_request_db_duration_seconds histogram" in metrics_after
+
+    assert (
+        get_sample_value(metrics_after, request_db_queries_count_sample)
+        == (get_sample_value(metrics_before, request_db_queries_count_sample) or 0) + 1
+    )
+    assert (
+        get_sample_value(metrics_after, request_db_queries_sum_sample)
+        == (get_sample_value(metrics_before, request_db_queries_sum_sample) or 0) + 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_when_request_exceeds_query_count_threshold_should_log_queries(
+    app, caplog
+):
+    client = app.test_client()
+
+    query_log_count_threshold = app.app.config["DATABASE_QUERY_LOG_COUNT_THRESHOLD"]
+
+    app.app.config["DATABASE_QUERY_LOG_COUNT_THRESHOLD"] = 0
+
+    try:
+        response = await client.get("/api/tags")
+    finally:
+        app.app.config["DATABASE_QUERY_LOG_COUNT_THRESHOLD"] = query_log_count_threshold
+
+    assert response.status_code == 200
+
+    assert "GET /api/tags ran 1 queries" in caplog.text
+    assert "SELECT array_agg(DISTINCT t)" in caplog.text
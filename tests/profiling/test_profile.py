@@ -0,0 +1,155 @@
+import contextlib
+import logging
+import secrets
+import urllib.parse
+from typing import Optional
+
+import pytest
+
+
+def make_profile_url(seconds: Optional[float] = None):
+    params = {}
+
+    if seconds:
+        params["seconds"] = seconds
+
+    encoded_params = urllib.parse.urlencode(params)
+
+    return f"/admin/profile?{encoded_params}"
+
+
+@contextlib.contextmanager
+def profiler_enabled(app, profiler_secret: str):
+    config = app.app.config
+
+    previous_config = {
+        "PROFILER_ENABLED": config["PROFILER_ENABLED"],
+        "PROFILER_SECRET": config["PROFILER_SECRET"],
+    }
+
+    config["PROFILER_ENABLED"] = True
+    config["PROFILER_SECRET"] = profiler_secret
+
+    try:
+        yield
+    finally:
+        config.update(previous_config)
+
+
+@pytest.mark.asyncio
+async def test_should_return_200(app):
+    client = app.test_client()
+
+    profiler_secret = secrets.token_urlsafe()
+
+    with profiler_enabled(app=app, profiler_secret=profiler_secret):
+        response = await client.get(
+            make_profile_url(seconds=0.2),
+            headers={"X-Profiler-Secret": profiler_secret},
+        )
+
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain")
+
+    profile = await response.get_data(as_text=True)
+
+    lines = profile.splitlines()
+
+    assert lines
+
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+        assert ";" in stack
+
+    assert any(line.startswith("MainThread;") for line in lines)
+
+
+@pytest.mark.asyncio
+async def test_when_profiler_is_not_enabled_should_return_404(app):
+    client = app.test_client()
+
+    response = await client.get(
+        make_profile_url(seconds=0.2),
+        headers={"X-Profiler-Secret": secrets.token_urlsafe()},
+    )
+
+    assert response.status_code == 404
+
+    response_data = await response.json
+
+    assert response_data["errors"]["body"][0] == "profiler is not enabled"
+
+
+@pytest.mark.asyncio
+async def test_when_profiler_secret_is_not_sent_should_return_401(app):
+    client = app.test_client()
+
+    with profiler_enabled(app=app, profiler_secret=secrets.token_urlsafe()):
+        response = await client.get(make_profile_url(seconds=0.2))
+
+    assert response.status_code == 401
+
+    response_data = await response.json
+
+    assert response_data["errors"]["body"][0] == "unauthorized"
+
+
+@pytest.mark.asyncio
+async def test_when_profiler_secret_is_invalid_should_return_401(app):
+    client = app.test_client()
+
+    with profiler_enabled(app=app, profiler_secret=secrets.token_urlsafe()):
+        response = await client.get(
+            make_profile_url(seconds=0.2),
+            headers={"X-Profiler-Secret": secrets.token_urlsafe()},
+        )
+
+    assert response.status_code == 401
+
+    response_data = await response.json
+
+    assert response_data["errors"]["body"][0] == "unauthorized"
+
+
+@pytest.mark.asyncio
+async def test_when_seconds_is_greater_than_max_should_return_422(app):
+    client = app.test_client()
+
+    profiler_secret = secrets.token_urlsafe()
+
+    max_seconds = app.app.config["PROFILER_MAX_SECONDS"]
+
+    with profiler_enabled(app=app, profiler_secret=profiler_secret):
+        response = await client.get(
+            make_profile_url(seconds=max_seconds + 1),
+            headers={"X-Profiler-Secret": profiler_secret},
+        )
+
+    assert response.status_code == 422
+
+    response_data = await response.json
+
+    assert (
+        response_data["errors"]["body"][0]
+        == f"seconds must be greater than 0 and at most {max_seconds}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_when_request_sends_profiler_secret_should_log_its_profile(app, caplog):
+    caplog.set_level(logging.WARNING, logger="conduit.profiling.request_profiling")
+
+    client = app.test_client()
+
+    profiler_secret = secrets.token_urlsafe()
+
+    with profiler_enabled(app=app, profiler_secret=profiler_secret):
+        response = await client.get(
+            "/api/tags",
+            headers={"X-Profiler-Secret": profiler_secret},
+        )
+
+    assert response.status_code == 200
+
+    assert "profile of GET /api/tags" in caplog.text
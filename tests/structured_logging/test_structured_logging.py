@@ -0,0 +1,143 @@
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import uuid
+from typing import Callable, Iterator, List
+
+import pytest
+
+
+@contextlib.contextmanager
+def capture_logs(app) -> Iterator[Callable]:
+    from conduit.structured_logging import JSONFormatter
+
+    stream = io.StringIO()
+
+    handler = logging.StreamHandler(stream=stream)
+    handler.setFormatter(
+        JSONFormatter(max_payload_length=app.app.config["LOG_MAX_PAYLOAD_LENGTH"])
+    )
+
+    log_listener = app.app.log_listener
+
+    previous_handlers = log_listener.handlers
+
+    log_listener.handlers = (handler,)
+
+    async def read_logs_until(message: str) -> List[dict]:
+        for _ in range(100):
+            logs = [json.loads(line) for line in stream.getvalue().splitlines()]
+
+            if any(message in log["message"] for log in logs):
+                return logs
+
+            await asyncio.sleep(0.02)
+
+        raise AssertionError(f"{message} was not logged")
+
+    try:
+        yield read_logs_until
+    finally:
+        log_listener.handlers = previous_handlers
+
+
+@pytest.mark.asyncio
+async def test_should_log_requests_as_json_with_truncated_payloads(
+    app, faker, create_user_and_decode
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    body = "a" * 100000
+
+    data = {
+        "article": {
+            "title": faker.sentence(),
+            "description": faker.sentence(),
+            "body": body,
+            "tagList": faker.words(),
+        }
+    }
+
+    with capture_logs(app=app) as read_logs_until:
+        response = await client.post(
+            "/api/articles",
+            data=json.dumps(data),
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Token {author.token}",
+            },
+        )
+
+        logs = await read_logs_until("received create article request")
+
+    assert response.status_code == 201
+
+    [log] = [log for log in logs if "received create article request" in log["message"]]
+
+    assert log["level"] == "INFO"
+    assert log["logger"] == "conduit"
+    assert log["route"] == "articles.create_article"
+    assert log["method"] == "POST"
+    assert log["path"] == "/api/articles"
+    assert "(100000 long)" in log["message"]
+    assert len(log["message"]) < 10000
+
+
+@pytest.mark.asyncio
+async def test_when_route_sample_ratio_is_zero_should_not_log_its_info_records(
+    app, faker, create_user_and_decode, create_article_and_decode
+):
+    client = app.test_client()
+
+    author = await create_user_and_decode()
+
+    article = await create_article_and_decode(author_token=author.token)
+
+    sample_ratios = app.app.config["LOG_SAMPLE_RATIOS"]
+
+    sample_ratios["articles.favorite_article"] = 0
+
+    sentinel = str(uuid.uuid4())
+
+    try:
+        with capture_logs(app=app) as read_logs_until:
+            response = await client.post(
+                f"/api/articles/{article.slug}/favorite",
+                headers={"Authorization": f"Token {author.token}"},
+            )
+
+            logging.getLogger("conduit").warning(sentinel)
+
+            logs = await read_logs_until(sentinel)
+    finally:
+        del sample_ratios["articles.favorite_article"]
+
+    assert response.status_code == 200
+
+    assert not [
+        log for log in logs if "received favorite article request" in log["message"]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_when_error_is_handled_should_log_its_traceback(app):
+    client = app.test_client()
+
+    slug = str(uuid.uuid4())
+
+    with capture_logs(app=app) as read_logs_until:
+        response = await client.get(f"/api/articles/{slug}")
+
+        logs = await read_logs_until(f"slug {slug} not found")
+
+    assert response.status_code == 404
+
+    [log] = [log for log in logs if log["message"] == f"slug {slug} not found"]
+
+    assert log["level"] == "ERROR"
+    assert log["route"] == "articles.get_article"
+    assert "NotFoundException" in log["exception"]
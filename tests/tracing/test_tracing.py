@@ -0,0 +1,143 @@
+import contextlib
+import secrets
+from typing import Iterator, List
+
+import pytest
+
+
+@contextlib.contextmanager
+def export_spans(app, sample_ratio: float) -> Iterator[List]:
+    from conduit.tracing import SpanExporter
+
+    exported_spans = []
+
+    class _ListSpanExporter(SpanExporter):
+        def export(self, spans):
+            # Exports in the calling thread, so spans are there once it returns.
+            self._export_spans(spans)
+
+        def _export_spans(self, spans):
+            exported_spans.extend(spans)
+
+    tracer = app.app.tracer
+
+    previous_exporter, previous_sample_ratio = tracer.exporter, tracer.sample_ratio
+
+    tracer.exporter = _ListSpanExporter()
+    tracer.sample_ratio = sample_ratio
+
+    try:
+        yield exported_spans
+    finally:
+        tracer.exporter, tracer.sample_ratio = previous_exporter, previous_sample_ratio
+
+
+@pytest.mark.asyncio
+async def test_when_request_is_sampled_should_export_its_spans(
+    app, faker, create_user_and_decode, create_article_and_decode
+):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    article = await create_article_and_decode(author_token=user.token)
+
+    with export_spans(app=app, sample_ratio=1) as spans:
+        response = await client.get(
+            f"/api/articles/{article.slug}",
+            headers={"Authorization": f"Token {user.token}"},
+        )
+
+    assert response.status_code == 200
+
+    spans_by_name = {}
+    for span in spans:
+        spans_by_name.setdefault(span.name, []).append(span)
+
+    [request_span] = spans_by_name["GET articles.get_article"]
+
+    assert request_span.parent_span_id is None
+    assert request_span.attributes["http.route"] == "/api/articles/<slug>"
+    assert request_span.attributes["http.status_code"] == 200
+
+    assert response.headers["traceparent"] == (
+        f"00-{request_span.trace_id}-{request_span.span_id}-01"
+    )
+
+    for span in spans:
+        assert span.trace_id == request_span.trace_id
+        assert span.end_time_unix_nano >= span.start_time_unix_nano
+
+    for span_name in ["jwt.verify", "serialize", "response.write"]:
+        [span] = spans_by_name[span_name]
+        assert span.parent_span_id == request_span.span_id
+
+    [get_article_by_slug_span] = spans_by_name["ArticlesService.get_article_by_slug"]
+
+    assert get_article_by_slug_span.parent_span_id == request_span.span_id
+
+    sql_spans = spans_by_name["sql"]
+
+    assert get_article_by_slug_span.span_id in [
+        span.parent_span_id for span in sql_spans
+    ]
+
+    for span in sql_spans:
+        assert span.attributes["db.statement"]
+        assert span.attributes["db.fingerprint"]
+
+
+@pytest.mark.asyncio
+async def test_when_request_is_not_sampled_should_not_export_spans(app):
+    client = app.test_client()
+
+    with export_spans(app=app, sample_ratio=0) as spans:
+        response = await client.get("/api/tags")
+
+    assert response.status_code == 200
+
+    assert "traceparent" not in response.headers
+
+    assert spans == []
+
+
+@pytest.mark.asyncio
+async def test_when_traceparent_is_sampled_should_continue_its_trace(app):
+    client = app.test_client()
+
+    trace_id = secrets.token_hex(16)
+    parent_span_id = secrets.token_hex(8)
+
+    with export_spans(app=app, sample_ratio=0) as spans:
+        response = await client.get(
+            "/api/tags",
+            headers={"traceparent": f"00-{trace_id}-{parent_span_id}-01"},
+        )
+
+    assert response.status_code == 200
+
+    [request_span] = [span for span in spans if span.name == "GET articles.get_tags"]
+
+    assert request_span.trace_id == trace_id
+    assert request_span.parent_span_id == parent_span_id
+
+    for span in spans:
+        assert span.trace_id == trace_id
+
+
+@pytest.mark.asyncio
+async def test_when_traceparent_is_not_sampled_should_not_export_spans(app):
+    client = app.test_client()
+
+    trace_id = secrets.token_hex(16)
+    parent_span_id = secrets.token_hex(8)
+
+    with export_spans(app=app, sample_ratio=1) as spans:
+        response = await client.get(
+            "/api/tags",
+            headers={"traceparent": f"00-{trace_id}-{parent_span_id}-00"},
+        )
+
+    assert response.status_code == 200
+
+    assert spans == []
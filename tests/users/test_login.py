@@ -53,6 +53,31 @@ async def test_should_return_200(app, faker, create_user_and_decode):
     assert logged_user["image"] == user.image
 
 
+@pytest.mark.asyncio
+async def test_should_read_from_replicas(app, create_user_and_decode, count_statements):
+    client = app.test_client()
+
+    user = await create_user_and_decode()
+
+    data = {
+        "user": {
+            "email": user.email,
+            "password": user.password,
+        }
+    }
+
+    with count_statements(aconns=app.app.aconn.replicas) as statements:
+        response = await client.post(
+            make_login_url(),
+            data=json.dumps(data),
+            headers={"Content-Type": "application/json"},
+        )
+
+    assert response.status_code == 200
+
+    assert len(statements) == 2
+
+
 @pytest.mark.asyncio
 async def test_when_email_is_not_sent_should_return_400(
     app, faker, create_user_and_decode